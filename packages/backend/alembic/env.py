@@ -15,7 +15,12 @@ from app.db.models import (  # noqa: F401 - Import models for metadata
     FamilyMember,
     InterviewSession,
     Memory,
+    SavedSearch,
+    SavedSearchMatch,
+    TimelineBucket,
+    TimelineSnapshot,
     User,
+    VocabularyTerm,
 )
 
 config = context.config
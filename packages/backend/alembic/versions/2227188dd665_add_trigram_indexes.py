@@ -0,0 +1,44 @@
+"""Add pg_trgm GIN indexes for title, location and elder search
+
+Revision ID: 2227188dd665
+Revises: e574525131fe
+Create Date: 2025-10-16 09:47:52.115604
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2227188dd665'
+down_revision: Union[str, None] = 'e574525131fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = [
+    ('ix_memories_title_trgm', 'memories', 'title'),
+    ('ix_memories_location_trgm', 'memories', 'location'),
+    ('ix_elders_name_trgm', 'elders', 'name'),
+    ('ix_elders_email_trgm', 'elders', 'email'),
+    ('ix_elders_hometown_trgm', 'elders', 'hometown'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,58 @@
+"""Maintain memories.search_vector and index it with GIN
+
+Revision ID: 3b23213561e3
+Revises: 5590a9ae2421
+Create Date: 2025-10-14 10:12:37.418230
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b23213561e3'
+down_revision: Union[str, None] = '5590a9ae2421'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Title matches outrank summary matches, which outrank transcription matches.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION memories_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.summary, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(NEW.transcription, '')), 'C');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER memories_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, summary, transcription ON memories
+        FOR EACH ROW EXECUTE FUNCTION memories_search_vector_update();
+        """
+    )
+    # Backfill rows written before the trigger existed.
+    op.execute("UPDATE memories SET title = title")
+    op.create_index(
+        'ix_memories_search_vector',
+        'memories',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_memories_search_vector', table_name='memories')
+    op.execute("DROP TRIGGER IF EXISTS memories_search_vector_trigger ON memories")
+    op.execute("DROP FUNCTION IF EXISTS memories_search_vector_update()")
+    op.execute("UPDATE memories SET search_vector = NULL")
@@ -0,0 +1,28 @@
+"""Add float16 embeddings to memories
+
+Revision ID: 5a83c54ef3ca
+Revises: 2227188dd665
+Create Date: 2025-10-17 11:05:26.640193
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5a83c54ef3ca'
+down_revision: Union[str, None] = '2227188dd665'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('memories', sa.Column('embedding', sa.LargeBinary(), nullable=True))
+    op.create_index(op.f('ix_memories_updated_at'), 'memories', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_memories_updated_at'), table_name='memories')
+    op.drop_column('memories', 'embedding')
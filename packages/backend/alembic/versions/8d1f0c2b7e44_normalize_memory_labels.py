@@ -0,0 +1,101 @@
+"""Normalize memory tags/people to lists and add jsonb_path_ops indexes
+
+Revision ID: 8d1f0c2b7e44
+Revises: 5a83c54ef3ca
+Create Date: 2025-10-17 15:22:08.401377
+
+"""
+import json
+from typing import Any, Optional, Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1f0c2b7e44'
+down_revision: Union[str, None] = '5a83c54ef3ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LABEL_INDEXES = [
+    ('ix_memories_tags', 'tags'),
+    ('ix_memories_people_mentioned', 'people_mentioned'),
+]
+
+
+def _normalize(value: Any, lowercase: bool) -> Optional[list[str]]:
+    # Frozen copy of app.utils.text.normalize_labels at the time of writing.
+    if value is None:
+        return None
+    if isinstance(value, str):
+        candidates: list[Any] = value.split(',')
+    elif isinstance(value, dict):
+        candidates = []
+        for key, item in value.items():
+            if isinstance(item, list):
+                candidates.extend(item)
+            else:
+                candidates.append(key)
+    elif isinstance(value, list):
+        candidates = value
+    else:
+        return None
+
+    labels: list[str] = []
+    seen: set[str] = set()
+    for candidate in candidates:
+        if isinstance(candidate, dict):
+            candidate = candidate.get('name')
+        if not isinstance(candidate, str):
+            continue
+        label = ' '.join(candidate.split())
+        if lowercase:
+            label = label.lower()
+        if label and label.casefold() not in seen:
+            seen.add(label.casefold())
+            labels.append(label)
+    return labels or None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            'SELECT id, tags, people_mentioned FROM memories '
+            'WHERE tags IS NOT NULL OR people_mentioned IS NOT NULL'
+        )
+    ).fetchall()
+    update = sa.text(
+        'UPDATE memories SET tags = CAST(:tags AS JSONB), '
+        'people_mentioned = CAST(:people AS JSONB) WHERE id = :id'
+    )
+    for memory_id, tags, people in rows:
+        new_tags = _normalize(tags, lowercase=True)
+        new_people = _normalize(people, lowercase=False)
+        if new_tags != tags or new_people != people:
+            bind.execute(
+                update,
+                {
+                    'id': memory_id,
+                    'tags': json.dumps(new_tags) if new_tags is not None else None,
+                    'people': (
+                        json.dumps(new_people) if new_people is not None else None
+                    ),
+                },
+            )
+
+    for name, column in LABEL_INDEXES:
+        op.create_index(
+            name,
+            'memories',
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    for name, _column in reversed(LABEL_INDEXES):
+        op.drop_index(name, table_name='memories')
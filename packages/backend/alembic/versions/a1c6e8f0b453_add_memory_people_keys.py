@@ -0,0 +1,46 @@
+"""add_memory_people_keys
+
+Revision ID: a1c6e8f0b453
+Revises: f4a9d3e61c27
+Create Date: 2025-10-27 09:41:18.220574
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c6e8f0b453'
+down_revision: Union[str, None] = 'f4a9d3e61c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Person filters match lowercased names, so people_mentioned keeps the
+    # spelling given while its lowercase twin takes over the GIN index.
+    op.add_column('memories', sa.Column('people_keys', postgresql.JSONB(astext_type=sa.Text()), sa.Computed('lower(people_mentioned::text)::jsonb', ), nullable=True))
+    op.drop_index('ix_memories_people_mentioned', table_name='memories', postgresql_using='gin', postgresql_ops={'people_mentioned': 'jsonb_path_ops'})
+    op.create_index('ix_memories_people_keys', 'memories', ['people_keys'], unique=False, postgresql_using='gin', postgresql_ops={'people_keys': 'jsonb_path_ops'})
+    # Saved searches store person match keys lowercased from now on.
+    op.execute(
+        """
+        UPDATE saved_searches SET match_keys = (
+            SELECT jsonb_agg(
+                CASE WHEN key LIKE 'person:%' THEN lower(key) ELSE key END
+                ORDER BY position
+            )
+            FROM jsonb_array_elements_text(match_keys) WITH ORDINALITY AS k(key, position)
+        )
+        WHERE match_keys::text LIKE '%"person:%'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_memories_people_keys', table_name='memories', postgresql_using='gin', postgresql_ops={'people_keys': 'jsonb_path_ops'})
+    op.create_index('ix_memories_people_mentioned', 'memories', ['people_mentioned'], unique=False, postgresql_using='gin', postgresql_ops={'people_mentioned': 'jsonb_path_ops'})
+    op.drop_column('memories', 'people_keys')
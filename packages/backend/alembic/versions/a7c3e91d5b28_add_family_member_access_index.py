@@ -0,0 +1,37 @@
+"""add_family_member_access_index
+
+Revision ID: a7c3e91d5b28
+Revises: f2b86a1d0c57
+Create Date: 2025-10-22 10:12:47.530918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e91d5b28"
+down_revision: Union[str, None] = "f2b86a1d0c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_family_members_user_id_access_level_elder_id",
+        "family_members",
+        ["user_id", "access_level", "elder_id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_family_members_user_id_access_level_elder_id",
+        table_name="family_members",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
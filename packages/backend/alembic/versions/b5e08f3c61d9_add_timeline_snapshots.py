@@ -0,0 +1,47 @@
+"""add_timeline_snapshots
+
+Revision ID: b5e08f3c61d9
+Revises: a7c3e91d5b28
+Create Date: 2025-10-23 11:04:52.118306
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e08f3c61d9'
+down_revision: Union[str, None] = 'a7c3e91d5b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by `python -m app.cli rebuild-timelines` (or on first read) and
+    # kept up to date by the memory write hooks.
+    op.create_table('timeline_snapshots',
+    sa.Column('elder_id', sa.Integer(), nullable=False),
+    sa.Column('group_by', sa.String(length=20), nullable=False),
+    sa.Column('built_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['elder_id'], ['elders.id'], ),
+    sa.PrimaryKeyConstraint('elder_id', 'group_by')
+    )
+    op.create_table('timeline_buckets',
+    sa.Column('elder_id', sa.Integer(), nullable=False),
+    sa.Column('group_by', sa.String(length=20), nullable=False),
+    sa.Column('period', sa.String(length=50), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('memories', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+    sa.Column('memory_ids', postgresql.ARRAY(sa.Integer()), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['elder_id'], ['elders.id'], ),
+    sa.PrimaryKeyConstraint('elder_id', 'group_by', 'period')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('timeline_buckets')
+    op.drop_table('timeline_snapshots')
@@ -0,0 +1,70 @@
+"""add_saved_searches
+
+Revision ID: c41e7d9a2f63
+Revises: 8d1f0c2b7e44
+Create Date: 2025-10-20 10:12:44.918203
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7d9a2f63'
+down_revision: Union[str, None] = '8d1f0c2b7e44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('saved_searches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('family_member_id', sa.Integer(), nullable=False),
+    sa.Column('elder_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('query', sa.String(length=500), nullable=False),
+    sa.Column('match_keys', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('last_matched_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['elder_id'], ['elders.id'], ),
+    sa.ForeignKeyConstraint(['family_member_id'], ['family_members.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_saved_searches_id'), 'saved_searches', ['id'], unique=False)
+    op.create_index(op.f('ix_saved_searches_elder_id'), 'saved_searches', ['elder_id'], unique=False)
+    op.create_index(op.f('ix_saved_searches_family_member_id'), 'saved_searches', ['family_member_id'], unique=False)
+    op.create_index('ix_saved_searches_created_at_id', 'saved_searches', ['created_at', 'id'], unique=False)
+    # Default jsonb_ops, which (unlike jsonb_path_ops) supports the ?| operator.
+    op.create_index('ix_saved_searches_match_keys', 'saved_searches', ['match_keys'], unique=False, postgresql_using='gin')
+
+    op.create_table('saved_search_matches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('saved_search_id', sa.Integer(), nullable=False),
+    sa.Column('memory_id', sa.Integer(), nullable=False),
+    sa.Column('matched_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['memory_id'], ['memories.id'], ),
+    sa.ForeignKeyConstraint(['saved_search_id'], ['saved_searches.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('saved_search_id', 'memory_id')
+    )
+    op.create_index(op.f('ix_saved_search_matches_id'), 'saved_search_matches', ['id'], unique=False)
+    op.create_index(op.f('ix_saved_search_matches_memory_id'), 'saved_search_matches', ['memory_id'], unique=False)
+    op.create_index('ix_saved_search_matches_search_matched_at', 'saved_search_matches', ['saved_search_id', 'matched_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_saved_search_matches_search_matched_at', table_name='saved_search_matches')
+    op.drop_index(op.f('ix_saved_search_matches_memory_id'), table_name='saved_search_matches')
+    op.drop_index(op.f('ix_saved_search_matches_id'), table_name='saved_search_matches')
+    op.drop_table('saved_search_matches')
+    op.drop_index('ix_saved_searches_match_keys', table_name='saved_searches')
+    op.drop_index('ix_saved_searches_created_at_id', table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_family_member_id'), table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_elder_id'), table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_id'), table_name='saved_searches')
+    op.drop_table('saved_searches')
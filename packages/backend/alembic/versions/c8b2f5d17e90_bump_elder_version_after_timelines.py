@@ -0,0 +1,52 @@
+"""bump_elder_version_after_timelines
+
+Revision ID: c8b2f5d17e90
+Revises: a1c6e8f0b453
+Create Date: 2025-10-28 11:06:52.418337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8b2f5d17e90'
+down_revision: Union[str, None] = 'a1c6e8f0b453'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trigger bumped content_version in the memory's own transaction,
+    # before the post-commit hooks refreshed the elder's timeline buckets, so
+    # a response built in between was cached under the new version. The
+    # hooks now bump it themselves, in the transaction that refreshes them.
+    op.execute("DROP TRIGGER IF EXISTS memories_elder_version_trigger ON memories")
+    op.execute("DROP FUNCTION IF EXISTS memories_elder_version_update()")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION memories_elder_version_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE elders SET content_version = content_version + 1
+                WHERE id = OLD.elder_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.elder_id <> OLD.elder_id) THEN
+                UPDATE elders SET content_version = content_version + 1
+                WHERE id = NEW.elder_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER memories_elder_version_trigger
+        AFTER INSERT OR UPDATE OR DELETE ON memories
+        FOR EACH ROW EXECUTE FUNCTION memories_elder_version_update();
+        """
+    )
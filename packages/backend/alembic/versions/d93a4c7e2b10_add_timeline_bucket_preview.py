@@ -0,0 +1,31 @@
+"""add_timeline_bucket_preview
+
+Revision ID: d93a4c7e2b10
+Revises: b5e08f3c61d9
+Create Date: 2025-10-24 09:26:31.642087
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93a4c7e2b10'
+down_revision: Union[str, None] = 'b5e08f3c61d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing timelines have no preview; drop them so they are rebuilt on
+    # first read (or by `python -m app.cli rebuild-timelines`).
+    op.execute('DELETE FROM timeline_buckets')
+    op.execute('DELETE FROM timeline_snapshots')
+    op.add_column('timeline_buckets', sa.Column('preview', postgresql.JSON(astext_type=sa.Text()), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('timeline_buckets', 'preview')
@@ -0,0 +1,32 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: e574525131fe
+Revises: 3b23213561e3
+Create Date: 2025-10-15 14:31:08.902114
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e574525131fe'
+down_revision: Union[str, None] = '3b23213561e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_memories_elder_id_created_at_id', 'memories', ['elder_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_elders_created_at_id', 'elders', ['created_at', 'id'], unique=False)
+    op.create_index('ix_family_members_created_at_id', 'family_members', ['created_at', 'id'], unique=False)
+    op.create_index('ix_interview_sessions_created_at_id', 'interview_sessions', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_interview_sessions_created_at_id', table_name='interview_sessions')
+    op.drop_index('ix_family_members_created_at_id', table_name='family_members')
+    op.drop_index('ix_elders_created_at_id', table_name='elders')
+    op.drop_index('ix_memories_elder_id_created_at_id', table_name='memories')
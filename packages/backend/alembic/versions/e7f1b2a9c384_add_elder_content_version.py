@@ -0,0 +1,54 @@
+"""add_elder_content_version
+
+Revision ID: e7f1b2a9c384
+Revises: d93a4c7e2b10
+Create Date: 2025-10-24 15:47:09.305128
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f1b2a9c384'
+down_revision: Union[str, None] = 'd93a4c7e2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('elders', sa.Column('content_version', sa.BigInteger(), server_default='0', nullable=False))
+    # Any insert, update or delete of a memory changes its elder's version
+    # (both elders' when a memory moves), so ETags derived from it go stale.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION memories_elder_version_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE elders SET content_version = content_version + 1
+                WHERE id = OLD.elder_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.elder_id <> OLD.elder_id) THEN
+                UPDATE elders SET content_version = content_version + 1
+                WHERE id = NEW.elder_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER memories_elder_version_trigger
+        AFTER INSERT OR UPDATE OR DELETE ON memories
+        FOR EACH ROW EXECUTE FUNCTION memories_elder_version_update();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS memories_elder_version_trigger ON memories")
+    op.execute("DROP FUNCTION IF EXISTS memories_elder_version_update()")
+    op.drop_column('elders', 'content_version')
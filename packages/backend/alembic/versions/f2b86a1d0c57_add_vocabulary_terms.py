@@ -0,0 +1,34 @@
+"""add_vocabulary_terms
+
+Revision ID: f2b86a1d0c57
+Revises: c41e7d9a2f63
+Create Date: 2025-10-21 09:38:15.274619
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b86a1d0c57'
+down_revision: Union[str, None] = 'c41e7d9a2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by `python -m app.cli rebuild-vocabulary` and kept up to date by
+    # the memory write hooks.
+    op.create_table('vocabulary_terms',
+    sa.Column('elder_id', sa.Integer(), nullable=False),
+    sa.Column('term', sa.String(length=50), nullable=False),
+    sa.Column('frequency', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['elder_id'], ['elders.id'], ),
+    sa.PrimaryKeyConstraint('elder_id', 'term')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('vocabulary_terms')
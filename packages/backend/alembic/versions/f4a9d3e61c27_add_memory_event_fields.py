@@ -0,0 +1,140 @@
+"""add_memory_event_fields
+
+Revision ID: f4a9d3e61c27
+Revises: e7f1b2a9c384
+Create Date: 2025-10-25 10:12:37.640219
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a9d3e61c27'
+down_revision: Union[str, None] = 'e7f1b2a9c384'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Life stage at the time of an event, from the elder's age then; matches
+# ERA_ORDER in app/services/timeline_service.py.
+LIFE_STAGE_SQL = """
+    CASE
+        WHEN age < 0 THEN NULL
+        WHEN age < 13 THEN 'childhood'
+        WHEN age < 20 THEN 'adolescence'
+        WHEN age < 30 THEN 'young_adult'
+        WHEN age < 45 THEN 'adult'
+        WHEN age < 65 THEN 'middle_age'
+        ELSE 'senior'
+    END
+"""
+
+
+def upgrade() -> None:
+    op.add_column('memories', sa.Column('event_year', sa.Integer(), nullable=True))
+    op.add_column('memories', sa.Column('event_decade', sa.String(length=10), nullable=True))
+    op.add_column('memories', sa.Column('event_era', sa.String(length=50), nullable=True))
+
+    # event_year comes from date_of_event; event_decade and event_era are the
+    # labelled decade and era if set, else derived from the event year and the
+    # elder's age at the event.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION memory_life_stage(age integer) RETURNS text AS $$
+            SELECT {LIFE_STAGE_SQL}
+        $$ LANGUAGE sql IMMUTABLE;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION memories_event_fields_update() RETURNS trigger AS $$
+        DECLARE
+            born timestamptz;
+        BEGIN
+            NEW.event_year := EXTRACT(YEAR FROM NEW.date_of_event)::integer;
+            NEW.event_decade := COALESCE(
+                NULLIF(NEW.decade, ''), (NEW.event_year / 10 * 10)::text || 's'
+            );
+            SELECT date_of_birth INTO born FROM elders WHERE id = NEW.elder_id;
+            NEW.event_era := COALESCE(
+                NULLIF(NEW.era, ''),
+                memory_life_stage(
+                    EXTRACT(YEAR FROM age(NEW.date_of_event, born))::integer
+                )
+            );
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER memories_event_fields_trigger
+        BEFORE INSERT OR UPDATE OF elder_id, date_of_event, decade, era ON memories
+        FOR EACH ROW EXECUTE FUNCTION memories_event_fields_update();
+        """
+    )
+    # A new date of birth moves the elder's memories between life stages.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION elders_event_era_update() RETURNS trigger AS $$
+        BEGIN
+            UPDATE memories SET era = era WHERE elder_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER elders_event_era_trigger
+        AFTER UPDATE OF date_of_birth ON elders
+        FOR EACH ROW
+        WHEN (OLD.date_of_birth IS DISTINCT FROM NEW.date_of_birth)
+        EXECUTE FUNCTION elders_event_era_update();
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE memories AS m SET
+            event_year = EXTRACT(YEAR FROM m.date_of_event)::integer,
+            event_decade = COALESCE(
+                NULLIF(m.decade, ''),
+                (EXTRACT(YEAR FROM m.date_of_event)::integer / 10 * 10)::text || 's'
+            ),
+            event_era = COALESCE(
+                NULLIF(m.era, ''),
+                memory_life_stage(
+                    EXTRACT(YEAR FROM age(m.date_of_event, e.date_of_birth))::integer
+                )
+            )
+        FROM elders AS e
+        WHERE e.id = m.elder_id
+        """
+    )
+    op.create_index('ix_memories_elder_id_event_year', 'memories', ['elder_id', 'event_year'], unique=False)
+    op.create_index('ix_memories_elder_id_event_decade', 'memories', ['elder_id', 'event_decade'], unique=False)
+    op.create_index('ix_memories_elder_id_event_era', 'memories', ['elder_id', 'event_era'], unique=False)
+
+    # Materialized timelines grouped by the old expressions; rebuilt on read.
+    op.execute('DELETE FROM timeline_buckets')
+    op.execute('DELETE FROM timeline_snapshots')
+
+
+def downgrade() -> None:
+    op.execute('DELETE FROM timeline_buckets')
+    op.execute('DELETE FROM timeline_snapshots')
+    op.drop_index('ix_memories_elder_id_event_era', table_name='memories')
+    op.drop_index('ix_memories_elder_id_event_decade', table_name='memories')
+    op.drop_index('ix_memories_elder_id_event_year', table_name='memories')
+    op.execute("DROP TRIGGER IF EXISTS elders_event_era_trigger ON elders")
+    op.execute("DROP FUNCTION IF EXISTS elders_event_era_update()")
+    op.execute("DROP TRIGGER IF EXISTS memories_event_fields_trigger ON memories")
+    op.execute("DROP FUNCTION IF EXISTS memories_event_fields_update()")
+    op.execute("DROP FUNCTION IF EXISTS memory_life_stage(integer)")
+    op.drop_column('memories', 'event_era')
+    op.drop_column('memories', 'event_decade')
+    op.drop_column('memories', 'event_year')
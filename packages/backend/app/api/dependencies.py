@@ -1,16 +1,22 @@
-"""FastAPI dependencies for database, authentication, and pagination."""
+"""FastAPI dependencies for database, authentication, caching and pagination."""
 
 from collections.abc import AsyncGenerator
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import verify_token
+from app.db.models.elder import Elder
+from app.db.models.user import User
 from app.db.session import get_db as get_database_session
+from app.utils.etag import etag_matches, strong_etag, weak_etag
+from app.utils.pagination import TotalMode
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -33,11 +39,103 @@ async def get_current_user(
     return user_id
 
 
-async def require_admin(current_user: str = Depends(get_current_user)) -> str:
-    """Require admin role for endpoint access."""
+async def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+) -> Optional[str]:
+    """
+    Get the authenticated user if a valid bearer token is sent, else None.
+
+    An expired or invalid token is treated as no token, so endpoints that
+    only need a user for some requests decide themselves when to require one.
+    """
+    if credentials is None:
+        return None
+    return verify_token(credentials.credentials)
+
+
+async def require_admin(
+    current_user: str = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> str:
+    """Require an active superuser for endpoint access."""
+    is_superuser = False
+    if current_user.isdigit():
+        result = await db.execute(
+            select(User.is_superuser).where(
+                User.id == int(current_user),
+                User.is_active.is_(True),
+                User.deleted_at.is_(None),
+            )
+        )
+        is_superuser = bool(result.scalar_one_or_none())
+    if not is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
     return current_user
 
 
+async def elder_etag(
+    elder_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, str]:
+    """
+    ETag of a per-elder response, answering If-None-Match before it is built.
+
+    The tag covers the elder's content_version (bumped after every memory
+    write, once derived data such as timelines is updated), its updated_at
+    and the request URL, so it changes with the underlying data and differs
+    between representations. A matching If-None-Match ends the request with
+    304 after this one primary-key lookup. Otherwise the ETag and
+    Cache-Control headers are set on the response and returned, for
+    endpoints that build their own Response.
+    """
+    return await _elder_cache_headers(elder_id, request, response, db, weak=False)
+
+
+async def weak_elder_etag(
+    elder_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, str]:
+    """
+    Weak ETag of a per-elder response, as elder_etag.
+
+    For responses that embed the time they were generated, such as exports:
+    requests at different times get equivalent but not identical bodies.
+    """
+    return await _elder_cache_headers(elder_id, request, response, db, weak=True)
+
+
+async def _elder_cache_headers(
+    elder_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    weak: bool,
+) -> dict[str, str]:
+    result = await db.execute(
+        select(Elder.content_version, Elder.updated_at).where(Elder.id == elder_id)
+    )
+    version = result.one_or_none()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Elder not found")
+
+    query = sorted(request.query_params.multi_items())
+    make_etag = weak_etag if weak else strong_etag
+    etag = make_etag(elder_id, *version, request.url.path, query)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return headers
+
+
 def pagination_params(
     page: int = 1,
     size: int = 20,
@@ -57,3 +155,49 @@ def pagination_params(
         "sort_by": sort_by,
         "order": order,
     }
+
+
+def search_filter_params(
+    elder_id: Optional[int] = Query(None, description="Filter by elder ID"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    era: Optional[str] = Query(None, description="Filter by era"),
+    decade: Optional[str] = Query(None, description="Filter by decade"),
+    emotional_tone: Optional[str] = Query(None, description="Filter by emotional tone"),
+    location: Optional[str] = Query(None, description="Filter by location"),
+    date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    tag: Optional[list[str]] = Query(None, description="Require tag (repeatable)"),
+    person: Optional[list[str]] = Query(
+        None, description="Require person mentioned (repeatable)"
+    ),
+) -> dict[str, Any]:
+    """Get search filter parameters, keyed like the SearchSpec fields."""
+    return {
+        "elder_id": elder_id,
+        "category": category,
+        "era": era,
+        "decade": decade,
+        "emotional_tone": emotional_tone,
+        "location": location,
+        "date_from": date_from,
+        "date_to": date_to,
+        "tag": tag,
+        "person": person,
+    }
+
+
+def search_page_params(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Count matches in cursor mode"),
+    total_mode: TotalMode = Query("exact", description="exact, capped or estimate"),
+) -> dict[str, Any]:
+    """Get search paging parameters, keyed like the SearchSpec fields."""
+    return {
+        "page": page,
+        "page_size": page_size,
+        "cursor": cursor,
+        "include_total": include_total,
+        "total_mode": total_mode,
+    }
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
+    admin,
     analytics,
     audio,
     auth,
@@ -11,6 +12,7 @@ from app.api.v1.endpoints import (
     family_members,
     interviews,
     memories,
+    saved_searches,
     search,
     timeline,
     voice,
@@ -29,5 +31,9 @@ api_router.include_router(audio.router, prefix="/audio", tags=["audio"])
 api_router.include_router(voice.router, prefix="/voice", tags=["voice"])
 api_router.include_router(timeline.router, prefix="/timeline", tags=["timeline"])
 api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(
+    saved_searches.router, prefix="/saved-searches", tags=["saved-searches"]
+)
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
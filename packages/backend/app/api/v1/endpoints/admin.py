@@ -0,0 +1,42 @@
+"""Administrative diagnostics endpoints."""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.api.dependencies import require_admin
+from app.core.config import settings
+from app.db.query_log import slow_query_log
+
+router = APIRouter()
+
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000, description="Max entries"),
+    with_plans_only: bool = Query(False, description="Only entries with a plan"),
+    _admin: str = Depends(require_admin),
+) -> dict[str, Any]:
+    """
+    List recently captured slow statements, newest first.
+
+    Capture is enabled with SLOW_QUERY_LOG_ENABLED and is per process, so
+    behind several workers each one reports only the queries it ran.
+    Parameters are reported by type and length only. Superusers only.
+    """
+    entries = list(reversed(slow_query_log.entries))
+    if with_plans_only:
+        entries = [entry for entry in entries if entry["plan"] is not None]
+
+    return {
+        "enabled": settings.SLOW_QUERY_LOG_ENABLED,
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "explain_sample_rate": settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+        "entries": entries[:limit],
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(_admin: str = Depends(require_admin)) -> None:
+    """Clear the captured slow statements."""
+    slow_query_log.clear()
@@ -4,22 +4,26 @@ from datetime import datetime, timedelta
 from typing import Any, Optional, cast
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, func, select
+from sqlalchemy import Row, and_, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import elder_etag, get_db
 from app.db.models.elder import Elder
 from app.db.models.memory import Memory
 
 router = APIRouter()
 
 
-@router.get("/elders/{elder_id}/analytics")
+@router.get("/elders/{elder_id}/analytics", dependencies=[Depends(elder_etag)])
 async def get_elder_analytics(
     elder_id: int,
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
-    """Get comprehensive analytics for an elder."""
+    """
+    Get comprehensive analytics for an elder.
+
+    Honours If-None-Match: unchanged analytics are answered with 304.
+    """
     result = await db.execute(select(Elder).where(Elder.id == elder_id))
     elder = result.scalar_one_or_none()
 
@@ -42,7 +46,7 @@ async def get_elder_analytics(
         "elder_id": elder_id,
         "elder_name": elder.name,
         "overview": await _get_overview_stats(memories),
-        "timeline_analysis": await _get_timeline_analysis(memories),
+        "timeline_analysis": await _get_timeline_analysis(db, elder_id),
         "content_analysis": await _get_content_analysis(memories),
         "emotional_insights": await _get_emotional_insights(memories),
         "engagement_metrics": await _get_engagement_metrics(memories),
@@ -67,33 +71,46 @@ async def _get_overview_stats(memories: list[Memory]) -> dict[str, Any]:
     }
 
 
-async def _get_timeline_analysis(memories: list[Memory]) -> dict[str, Any]:
-    """Analyze timeline coverage."""
-    decades: dict[str, int] = {}
-    eras: dict[str, int] = {}
-    years: dict[int, int] = {}
-
-    for memory in memories:
-        if memory.decade:
-            decades[memory.decade] = decades.get(memory.decade, 0) + 1
-        elif memory.date_of_event:
-            decade = f"{(memory.date_of_event.year // 10) * 10}s"
-            decades[decade] = decades.get(decade, 0) + 1
-            years[memory.date_of_event.year] = (
-                years.get(memory.date_of_event.year, 0) + 1
-            )
+async def _get_timeline_analysis(db: AsyncSession, elder_id: int) -> dict[str, Any]:
+    """
+    Analyze timeline coverage.
 
-        if memory.era:
-            eras[memory.era] = eras.get(memory.era, 0) + 1
+    Grouped in one query over the indexed event fields that the
+    memories_event_fields_trigger derives on write.
+    """
+    groups = (
+        Memory.event_decade,
+        Memory.event_era,
+        Memory.event_year,
+    )
+    result = await db.execute(
+        select(
+            *groups,
+            func.grouping(*groups).label("rolled_up"),
+            func.count().label("memories"),
+            func.min(Memory.date_of_event).label("earliest"),
+            func.max(Memory.date_of_event).label("latest"),
+        )
+        .where(Memory.elder_id == elder_id, Memory.deleted_at.is_(None))
+        .group_by(func.grouping_sets(literal_column("()"), *groups))
+    )
 
-    earliest = min((m.date_of_event for m in memories if m.date_of_event), default=None)
-    latest = max((m.date_of_event for m in memories if m.date_of_event), default=None)
+    counts: dict[str, dict[Any, int]] = {"decade": {}, "era": {}, "year": {}}
+    earliest = latest = None
+    for row in result.all():
+        group, key = _timeline_group(row)
+        if group == "total":
+            earliest, latest = row.earliest, row.latest
+        elif key is not None:
+            counts[group][key] = row.memories
 
     return {
-        "decades": [{"decade": k, "count": v} for k, v in sorted(decades.items())],
-        "eras": [{"era": k, "count": v} for k, v in eras.items()],
+        "decades": [
+            {"decade": k, "count": v} for k, v in sorted(counts["decade"].items())
+        ],
+        "eras": [{"era": k, "count": v} for k, v in counts["era"].items()],
         "years_with_memories": [
-            {"year": k, "count": v} for k, v in sorted(years.items())
+            {"year": k, "count": v} for k, v in sorted(counts["year"].items())
         ],
         "earliest_memory": earliest.isoformat() if earliest else None,
         "latest_memory": latest.isoformat() if latest else None,
@@ -101,6 +118,18 @@ async def _get_timeline_analysis(memories: list[Memory]) -> dict[str, Any]:
     }
 
 
+def _timeline_group(row: Row[Any]) -> tuple[str, Any]:
+    """Name the grouping set a timeline row counts, with its group key."""
+    # GROUPING() sets a bit for each column rolled up in a row's set.
+    if row.rolled_up == 0b011:
+        return "decade", row.event_decade
+    if row.rolled_up == 0b101:
+        return "era", row.event_era
+    if row.rolled_up == 0b110:
+        return "year", row.event_year
+    return "total", None
+
+
 async def _get_content_analysis(memories: list[Memory]) -> dict[str, Any]:
     """Analyze content distribution."""
     categories: dict[str, int] = {}
@@ -116,18 +145,10 @@ async def _get_content_analysis(memories: list[Memory]) -> dict[str, Any]:
             locations.add(memory.location)
 
         if memory.people_mentioned:
-            if isinstance(memory.people_mentioned, dict):
-                people.update(memory.people_mentioned.keys())
-            elif isinstance(memory.people_mentioned, list):
-                people.update(memory.people_mentioned)
-
-        if memory.tags:
-            if isinstance(memory.tags, dict):
-                for tag in memory.tags.get("tags", []):
-                    tags_count[tag] = tags_count.get(tag, 0) + 1
-            elif isinstance(memory.tags, list):
-                for tag in memory.tags:
-                    tags_count[tag] = tags_count.get(tag, 0) + 1
+            people.update(memory.people_mentioned)
+
+        for tag in memory.tags or []:
+            tags_count[tag] = tags_count.get(tag, 0) + 1
 
     top_tags = sorted(tags_count.items(), key=lambda x: x[1], reverse=True)[:10]
 
@@ -10,6 +10,7 @@ from app.api.dependencies import get_db
 from app.db.models import Memory
 from app.schemas.memory_schema import MemoryResponse
 from app.services.ipfs_service import ipfs_service
+from app.services.memory_hooks import after_memory_create, before_memory_commit
 from app.services.openai_service import openai_service
 
 router = APIRouter()
@@ -145,8 +146,10 @@ async def process_audio_memory(
     )
 
     db.add(memory)
+    await before_memory_commit(memory)
     await db.commit()
     await db.refresh(memory)
+    await after_memory_create(db, memory)
 
     return memory  # type: ignore[return-value]
 
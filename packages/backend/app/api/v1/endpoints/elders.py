@@ -1,15 +1,17 @@
 """Elder CRUD endpoints."""
 
-from math import ceil
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, or_, select
+from sqlalchemy import REAL, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
 from app.db.models import Elder
 from app.schemas.elder_schema import ElderCreate, ElderList, ElderResponse, ElderUpdate
+from app.services.timeline_service import timeline_service
+from app.utils.pagination import TotalMode, count_total, fetch_page, page_count
+from app.utils.text import LIKE_ESCAPE, escape_like
 
 router = APIRouter()
 
@@ -30,43 +32,75 @@ async def create_elder(
 async def list_elders(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Count matches in cursor mode"),
+    total_mode: TotalMode = Query("exact", description="exact, capped or estimate"),
     search: str | None = Query(None),
+    fuzzy: bool = Query(False, description="Match search by trigram similarity"),
     is_active: bool | None = Query(None),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    """List elders with pagination and filtering."""
+    """
+    List elders with offset or keyset (cursor) pagination and filtering.
+
+    `search` matches name, email and hometown through their trigram indexes.
+    With `fuzzy`, near misses match too and results are ordered by similarity.
+    """
     query = select(Elder).where(Elder.deleted_at.is_(None))
 
     if is_active is not None:
         query = query.where(Elder.is_active == is_active)
 
-    if search:
-        search_pattern = f"%{search}%"
+    sort_keys: tuple[Any, ...] = (Elder.created_at, Elder.id)
+
+    if search and fuzzy:
+        similarity = func.greatest(
+            func.similarity(Elder.name, search),
+            func.similarity(Elder.email, search),
+            func.similarity(Elder.hometown, search),
+            type_=REAL,
+        ).label("similarity")
         query = query.where(
             or_(
-                Elder.name.ilike(search_pattern),
-                Elder.email.ilike(search_pattern),
-                Elder.hometown.ilike(search_pattern),
+                Elder.name.op("%")(search),
+                Elder.email.op("%")(search),
+                Elder.hometown.op("%")(search),
+            )
+        )
+        sort_keys = (similarity, Elder.id)
+    elif search:
+        search_pattern = f"%{escape_like(search)}%"
+        query = query.where(
+            or_(
+                Elder.name.ilike(search_pattern, escape=LIKE_ESCAPE),
+                Elder.email.ilike(search_pattern, escape=LIKE_ESCAPE),
+                Elder.hometown.ilike(search_pattern, escape=LIKE_ESCAPE),
             )
         )
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    query = (
-        query.order_by(Elder.created_at.desc()).offset((page - 1) * size).limit(size)
+    total = total_is_exact = None
+    if cursor is None or include_total:
+        total, total_is_exact = await count_total(db, query, total_mode)
+
+    result = await fetch_page(
+        db,
+        query,
+        sort_keys,
+        size,
+        cursor=cursor,
+        offset=(page - 1) * size,
     )
-
-    result = await db.execute(query)
-    elders = list(result.scalars().all())
+    elders = [row[0] for row in result.rows]
 
     return ElderList(
         items=elders,  # type: ignore[arg-type]
         total=total,
-        page=page,
+        total_is_exact=total_is_exact,
+        page=page if cursor is None else None,
         size=size,
-        pages=ceil(total / size) if total > 0 else 0,
+        pages=page_count(total, size),
+        next_cursor=result.next_cursor,
+        prev_cursor=result.prev_cursor,
     )
 
 
@@ -107,6 +141,11 @@ async def update_elder(
     for field, value in update_data.items():
         setattr(elder, field, value)
 
+    # The date of birth decides the derived era of memories without one of
+    # their own (memories_event_fields_trigger), so timelines are rebuilt.
+    if "date_of_birth" in update_data:
+        await timeline_service.clear(db, elder_id)
+
     await db.commit()
     await db.refresh(elder)
     return elder
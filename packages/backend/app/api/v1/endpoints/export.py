@@ -10,7 +10,7 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import elder_etag, get_db, weak_elder_etag
 from app.db.models.elder import Elder
 from app.db.models.memory import Memory
 
@@ -24,6 +24,7 @@ async def export_memories_json(
     include_transcriptions: bool = Query(True, description="Include transcriptions"),
     category: Optional[str] = Query(None, description="Filter by category"),
     db: AsyncSession = Depends(get_db),
+    cache_headers: dict[str, str] = Depends(weak_elder_etag),
 ) -> StreamingResponse:
     """Export memories as JSON."""
     result = await db.execute(select(Elder).where(Elder.id == elder_id))
@@ -92,7 +93,10 @@ async def export_memories_json(
     return StreamingResponse(
         json_stream,
         media_type="application/json",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            **cache_headers,
+        },
     )
 
 
@@ -101,6 +105,7 @@ async def export_memories_csv(
     elder_id: int,
     category: Optional[str] = Query(None, description="Filter by category"),
     db: AsyncSession = Depends(get_db),
+    cache_headers: dict[str, str] = Depends(weak_elder_etag),
 ) -> StreamingResponse:
     """Export memories as CSV."""
     result = await db.execute(select(Elder).where(Elder.id == elder_id))
@@ -168,7 +173,10 @@ async def export_memories_csv(
     return StreamingResponse(
         csv_stream,
         media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            **cache_headers,
+        },
     )
 
 
@@ -180,6 +188,7 @@ async def export_memories_markdown(
         True, description="Include full transcriptions"
     ),
     db: AsyncSession = Depends(get_db),
+    cache_headers: dict[str, str] = Depends(weak_elder_etag),
 ) -> StreamingResponse:
     """Export memories as Markdown document."""
     result = await db.execute(select(Elder).where(Elder.id == elder_id))
@@ -246,14 +255,8 @@ async def export_memories_markdown(
             md_content += f"**Category:** {memory.category}\n\n"
 
         if memory.people_mentioned:
-            people = []
-            if isinstance(memory.people_mentioned, dict):
-                people = list(memory.people_mentioned.keys())
-            elif isinstance(memory.people_mentioned, list):
-                people = memory.people_mentioned
-
-            if people:
-                md_content += f"**People Mentioned:** {', '.join(people)}\n\n"
+            people = ", ".join(memory.people_mentioned)
+            md_content += f"**People Mentioned:** {people}\n\n"
 
         md_content += "---\n\n"
 
@@ -267,7 +270,10 @@ async def export_memories_markdown(
     return StreamingResponse(
         md_stream,
         media_type="text/markdown",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            **cache_headers,
+        },
     )
 
 
@@ -311,7 +317,9 @@ async def request_export(
     }
 
 
-@router.get("/elders/{elder_id}/export/audio-compilation")
+@router.get(
+    "/elders/{elder_id}/export/audio-compilation", dependencies=[Depends(elder_etag)]
+)
 async def export_audio_compilation(
     elder_id: int,
     category: Optional[str] = Query(None, description="Filter by category"),
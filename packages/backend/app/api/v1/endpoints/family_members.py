@@ -1,10 +1,9 @@
 """Family member CRUD endpoints."""
 
-from math import ceil
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
@@ -15,6 +14,7 @@ from app.schemas.family_member_schema import (
     FamilyMemberResponse,
     FamilyMemberUpdate,
 )
+from app.utils.pagination import TotalMode, count_total, fetch_page, page_count
 
 router = APIRouter()
 
@@ -61,11 +61,14 @@ async def create_family_member(
 async def list_family_members(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Count matches in cursor mode"),
+    total_mode: TotalMode = Query("exact", description="exact, capped or estimate"),
     elder_id: int | None = Query(None),
     user_id: int | None = Query(None),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    """List family members with pagination and filtering."""
+    """List family members with offset or keyset (cursor) pagination."""
     query = select(FamilyMember).where(FamilyMember.deleted_at.is_(None))
 
     if elder_id:
@@ -74,25 +77,29 @@ async def list_family_members(
     if user_id:
         query = query.where(FamilyMember.user_id == user_id)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    query = (
-        query.order_by(FamilyMember.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+    total = total_is_exact = None
+    if cursor is None or include_total:
+        total, total_is_exact = await count_total(db, query, total_mode)
+
+    result = await fetch_page(
+        db,
+        query,
+        (FamilyMember.created_at, FamilyMember.id),
+        size,
+        cursor=cursor,
+        offset=(page - 1) * size,
     )
-
-    result = await db.execute(query)
-    family_members = list(result.scalars().all())
+    family_members = [row[0] for row in result.rows]
 
     return FamilyMemberList(
         items=family_members,  # type: ignore[arg-type]
         total=total,
-        page=page,
+        total_is_exact=total_is_exact,
+        page=page if cursor is None else None,
         size=size,
-        pages=ceil(total / size) if total > 0 else 0,
+        pages=page_count(total, size),
+        next_cursor=result.next_cursor,
+        prev_cursor=result.prev_cursor,
     )
 
 
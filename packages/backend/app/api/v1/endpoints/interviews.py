@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
@@ -20,6 +20,7 @@ from app.schemas.interview_session_schema import (
     InterviewSessionUpdate,
 )
 from app.services.openai_service import openai_service
+from app.utils.pagination import TotalMode, count_total, fetch_page, page_count
 
 router = APIRouter()
 
@@ -62,11 +63,14 @@ async def create_interview_session(
 async def list_interview_sessions(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Count matches in cursor mode"),
+    total_mode: TotalMode = Query("exact", description="exact, capped or estimate"),
     elder_id: int | None = Query(None),
     status_filter: str | None = Query(None, alias="status"),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    """List interview sessions with pagination and filtering."""
+    """List interview sessions with offset or keyset (cursor) pagination."""
     query = select(InterviewSession).where(InterviewSession.deleted_at.is_(None))
 
     if elder_id:
@@ -75,22 +79,29 @@ async def list_interview_sessions(
     if status_filter:
         query = query.where(InterviewSession.status == status_filter)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    query = query.order_by(InterviewSession.created_at.desc())
-    query = query.offset((page - 1) * size).limit(size)
-
-    result = await db.execute(query)
-    sessions = list(result.scalars().all())
+    total = total_is_exact = None
+    if cursor is None or include_total:
+        total, total_is_exact = await count_total(db, query, total_mode)
+
+    result = await fetch_page(
+        db,
+        query,
+        (InterviewSession.created_at, InterviewSession.id),
+        size,
+        cursor=cursor,
+        offset=(page - 1) * size,
+    )
+    sessions = [row[0] for row in result.rows]
 
     return InterviewSessionList(
         items=sessions,  # type: ignore[arg-type]
         total=total,
-        page=page,
+        total_is_exact=total_is_exact,
+        page=page if cursor is None else None,
         size=size,
-        pages=(total + size - 1) // size,
+        pages=page_count(total, size),
+        next_cursor=result.next_cursor,
+        prev_cursor=result.prev_cursor,
     )
 
 
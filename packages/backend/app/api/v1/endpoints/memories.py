@@ -1,10 +1,9 @@
 """Memory CRUD endpoints."""
 
-from math import ceil
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
@@ -15,7 +14,16 @@ from app.schemas.memory_schema import (
     MemoryResponse,
     MemoryUpdate,
 )
+from app.services.facet_service import facet_service
+from app.services.memory_hooks import (
+    after_memory_commit,
+    after_memory_create,
+    after_memory_delete,
+    before_memory_commit,
+    bump_content_version,
+)
 from app.services.openai_service import openai_service
+from app.utils.pagination import TotalMode, count_total, fetch_page, page_count
 
 router = APIRouter()
 
@@ -40,8 +48,10 @@ async def create_memory(
 
     memory = Memory(**memory_data.model_dump())
     db.add(memory)
+    await before_memory_commit(memory)
     await db.commit()
     await db.refresh(memory)
+    await after_memory_create(db, memory)
     return memory
 
 
@@ -49,13 +59,22 @@ async def create_memory(
 async def list_memories(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Count matches in cursor mode"),
+    total_mode: TotalMode = Query("exact", description="exact, capped or estimate"),
     elder_id: int | None = Query(None),
     category: str | None = Query(None),
     era: str | None = Query(None),
     search: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    """List memories with pagination and filtering."""
+    """
+    List memories with pagination and filtering.
+
+    Pages by offset by default. Passing a `next_cursor`/`prev_cursor` from a
+    previous response switches to keyset paging, which skips the count unless
+    `include_total` is set.
+    """
     query = select(Memory).where(Memory.deleted_at.is_(None))
 
     if elder_id:
@@ -77,23 +96,37 @@ async def list_memories(
             )
         )
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    query = (
-        query.order_by(Memory.created_at.desc()).offset((page - 1) * size).limit(size)
+    total = total_is_exact = None
+    if cursor is None or include_total:
+        if elder_id and not search and facet_service.enabled:
+            # Only facet filters apply, so the elder's bitmap can count them.
+            filters = [("category", category), ("era", era)]
+            total = await facet_service.count(
+                db, elder_id, [(field, [value]) for field, value in filters if value]
+            )
+            total_is_exact = True
+        else:
+            total, total_is_exact = await count_total(db, query, total_mode)
+
+    result = await fetch_page(
+        db,
+        query,
+        (Memory.created_at, Memory.id),
+        size,
+        cursor=cursor,
+        offset=(page - 1) * size,
     )
-
-    result = await db.execute(query)
-    memories = list(result.scalars().all())
+    memories = [row[0] for row in result.rows]
 
     return MemoryList(
         items=memories,  # type: ignore[arg-type]
         total=total,
-        page=page,
+        total_is_exact=total_is_exact,
+        page=page if cursor is None else None,
         size=size,
-        pages=ceil(total / size) if total > 0 else 0,
+        pages=page_count(total, size),
+        next_cursor=result.next_cursor,
+        prev_cursor=result.prev_cursor,
     )
 
 
@@ -111,7 +144,9 @@ async def get_memory(memory_id: int, db: AsyncSession = Depends(get_db)) -> Any:
             detail="Memory not found",
         )
 
+    # Play counts feed the elder's analytics, so its ETags go stale too.
     memory.play_count += 1
+    await bump_content_version(db, memory.elder_id)
     await db.commit()
     await db.refresh(memory)
 
@@ -138,8 +173,10 @@ async def update_memory(
     for field, value in update_data.items():
         setattr(memory, field, value)
 
+    await before_memory_commit(memory)
     await db.commit()
     await db.refresh(memory)
+    await after_memory_commit(db, memory)
     return memory
 
 
@@ -161,6 +198,7 @@ async def delete_memory(memory_id: int, db: AsyncSession = Depends(get_db)) -> N
 
     memory.deleted_at = datetime.now(timezone.utc)
     await db.commit()
+    await after_memory_delete(db, memory)
 
 
 @router.post("/{memory_id}/enrich", response_model=MemoryResponse)
@@ -183,15 +221,8 @@ async def enrich_memory(memory_id: int, db: AsyncSession = Depends(get_db)) -> A
             detail="Memory must have transcription to be enriched",
         )
 
-    existing_tags: list[str] | None = None
-    if memory.tags:
-        if isinstance(memory.tags, dict):
-            existing_tags = list(memory.tags.keys()) if memory.tags else None
-        elif isinstance(memory.tags, list):
-            existing_tags = memory.tags
-
     enrichment_data = await openai_service.enrich_memory(
-        memory.transcription, existing_tags
+        memory.transcription, memory.tags
     )
 
     memory.category = enrichment_data.get("category")
@@ -207,6 +238,8 @@ async def enrich_memory(memory_id: int, db: AsyncSession = Depends(get_db)) -> A
     if "locations" in enrichment_data:
         memory.location = ", ".join(enrichment_data.get("locations", []))[:200]
 
+    await before_memory_commit(memory)
     await db.commit()
     await db.refresh(memory)
+    await after_memory_commit(db, memory)
     return memory
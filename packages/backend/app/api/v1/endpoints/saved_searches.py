@@ -0,0 +1,201 @@
+"""Saved search endpoints."""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_db
+from app.db.models import FamilyMember, Memory, SavedSearch, SavedSearchMatch
+from app.schemas.saved_search_schema import (
+    SavedSearchCreate,
+    SavedSearchList,
+    SavedSearchMatchList,
+    SavedSearchResponse,
+    SavedSearchUpdate,
+)
+from app.services.percolator_service import percolator_service
+from app.utils.pagination import TotalMode, count_total, fetch_page, page_count
+
+router = APIRouter()
+
+
+async def _get_saved_search(db: AsyncSession, saved_search_id: int) -> SavedSearch:
+    """Load a saved search that has not been deleted, or raise 404."""
+    result = await db.execute(
+        select(SavedSearch).where(
+            SavedSearch.id == saved_search_id, SavedSearch.deleted_at.is_(None)
+        )
+    )
+    saved_search = result.scalar_one_or_none()
+
+    if not saved_search:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Saved search not found",
+        )
+    return saved_search
+
+
+@router.post(
+    "/", response_model=SavedSearchResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_saved_search(
+    saved_search_data: SavedSearchCreate, db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    Save a search to be matched against every new memory of an elder.
+
+    The query uses the /search syntax, e.g. `grandpa category:war`. The
+    search follows the elder of the given family member; memories created
+    from now on that match it are listed under /{id}/matches.
+    """
+    result = await db.execute(
+        select(FamilyMember).where(
+            FamilyMember.id == saved_search_data.family_member_id,
+            FamilyMember.deleted_at.is_(None),
+        )
+    )
+    family_member = result.scalar_one_or_none()
+
+    if not family_member:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Family member not found",
+        )
+
+    saved_search = SavedSearch(
+        **saved_search_data.model_dump(),
+        elder_id=family_member.elder_id,
+        match_keys=await percolator_service.match_keys(db, saved_search_data.query),
+    )
+    db.add(saved_search)
+    await db.commit()
+    await db.refresh(saved_search)
+    return saved_search
+
+
+@router.get("/", response_model=SavedSearchList)
+async def list_saved_searches(
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Count matches in cursor mode"),
+    total_mode: TotalMode = Query("exact", description="exact, capped or estimate"),
+    family_member_id: Optional[int] = Query(None),
+    elder_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> Any:
+    """List saved searches with offset or keyset (cursor) pagination."""
+    query = select(SavedSearch).where(SavedSearch.deleted_at.is_(None))
+
+    if family_member_id:
+        query = query.where(SavedSearch.family_member_id == family_member_id)
+
+    if elder_id:
+        query = query.where(SavedSearch.elder_id == elder_id)
+
+    total = total_is_exact = None
+    if cursor is None or include_total:
+        total, total_is_exact = await count_total(db, query, total_mode)
+
+    result = await fetch_page(
+        db,
+        query,
+        (SavedSearch.created_at, SavedSearch.id),
+        size,
+        cursor=cursor,
+        offset=(page - 1) * size,
+    )
+    saved_searches = [row[0] for row in result.rows]
+
+    return SavedSearchList(
+        items=saved_searches,  # type: ignore[arg-type]
+        total=total,
+        total_is_exact=total_is_exact,
+        page=page if cursor is None else None,
+        size=size,
+        pages=page_count(total, size),
+        next_cursor=result.next_cursor,
+        prev_cursor=result.prev_cursor,
+    )
+
+
+@router.get("/{saved_search_id}", response_model=SavedSearchResponse)
+async def get_saved_search(
+    saved_search_id: int, db: AsyncSession = Depends(get_db)
+) -> Any:
+    """Get saved search details by ID."""
+    return await _get_saved_search(db, saved_search_id)
+
+
+@router.put("/{saved_search_id}", response_model=SavedSearchResponse)
+async def update_saved_search(
+    saved_search_id: int,
+    saved_search_data: SavedSearchUpdate,
+    db: AsyncSession = Depends(get_db),
+) -> Any:
+    """Update a saved search; a new query applies to memories created later."""
+    saved_search = await _get_saved_search(db, saved_search_id)
+
+    update_data = saved_search_data.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(saved_search, field, value)
+
+    if "query" in update_data:
+        saved_search.match_keys = await percolator_service.match_keys(
+            db, saved_search.query
+        )
+
+    await db.commit()
+    await db.refresh(saved_search)
+    return saved_search
+
+
+@router.delete("/{saved_search_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_saved_search(
+    saved_search_id: int, db: AsyncSession = Depends(get_db)
+) -> None:
+    """Soft delete a saved search."""
+    saved_search = await _get_saved_search(db, saved_search_id)
+    saved_search.deleted_at = datetime.now(timezone.utc)
+    await db.commit()
+
+
+@router.get("/{saved_search_id}/matches", response_model=SavedSearchMatchList)
+async def list_saved_search_matches(
+    saved_search_id: int,
+    size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    db: AsyncSession = Depends(get_db),
+) -> Any:
+    """List the memories matched by a saved search, newest match first."""
+    await _get_saved_search(db, saved_search_id)
+
+    query = (
+        select(SavedSearchMatch.matched_at, Memory)
+        .join(Memory, Memory.id == SavedSearchMatch.memory_id)
+        .where(
+            SavedSearchMatch.saved_search_id == saved_search_id,
+            Memory.deleted_at.is_(None),
+        )
+    )
+    result = await fetch_page(
+        db,
+        query,
+        (SavedSearchMatch.matched_at, SavedSearchMatch.id),
+        size,
+        cursor=cursor,
+    )
+
+    return SavedSearchMatchList(
+        items=[
+            {"matched_at": matched_at, "memory": memory}  # type: ignore[misc]
+            for matched_at, memory in result.rows
+        ],
+        size=size,
+        next_cursor=result.next_cursor,
+        prev_cursor=result.prev_cursor,
+    )
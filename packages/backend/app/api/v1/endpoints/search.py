@@ -1,183 +1,194 @@
 """Advanced search endpoints."""
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, func, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import (
+    get_db,
+    get_optional_user,
+    search_filter_params,
+    search_page_params,
+)
 from app.db.models.memory import Memory
+from app.schemas.search_schema import (
+    SearchBatchRequest,
+    SearchMode,
+    SearchScope,
+    SearchSpec,
+)
+from app.services.search_service import search_service, serialize_memory
+from app.services.suggestion_service import suggestion_service
+from app.utils.text import LIKE_ESCAPE, escape_like
 
 router = APIRouter()
 
+StreamFormat = Literal["ndjson"]
+
 
 @router.get("/search")
 async def search_memories(
     q: str = Query(..., min_length=1, description="Search query"),
-    elder_id: Optional[int] = Query(None, description="Filter by elder ID"),
-    category: Optional[str] = Query(None, description="Filter by category"),
-    era: Optional[str] = Query(None, description="Filter by era"),
-    decade: Optional[str] = Query(None, description="Filter by decade"),
-    emotional_tone: Optional[str] = Query(None, description="Filter by emotional tone"),
-    location: Optional[str] = Query(None, description="Filter by location"),
-    date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    scope: SearchScope = Query("all", description="all, or family for your elders"),
+    filters: dict[str, Any] = Depends(search_filter_params),
+    paging: dict[str, Any] = Depends(search_page_params),
+    mode: SearchMode = Query("lexical", description="lexical or hybrid"),
+    highlight: bool = Query(False, description="Return snippets of matched terms"),
+    autocorrect: bool = Query(True, description="Search for corrected spellings"),
+    stream: Optional[StreamFormat] = Query(None, description="Stream every match"),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
+    current_user: Optional[str] = Depends(get_optional_user),
+) -> Any:
     """
     Advanced search for memories with filters and facets.
 
-    Full-text search on title, transcription, and summary.
-    Multiple filters can be combined.
+    Full-text search on title, transcription, and summary, ranked by
+    relevance. Accepts web-search syntax ("quoted phrases", -exclusions, OR)
+    plus field qualifiers: `category:`, `era:`, `decade:`, `tone:`,
+    `location:`, `tag:` and `person:`, each negatable with `-` and taking a
+    quoted value, e.g. `"train station" era:"post-war" -tag:sad`. Qualifiers
+    narrow results like the matching filters, and a query of qualifiers only
+    returns every memory they match; the split is echoed as `parsed_query`.
+    Multiple filters can be combined. Passing a returned cursor switches from
+    offset to keyset paging on (rank, id) and skips the count unless
+    `include_total` is set.
+
+    `mode=hybrid` also retrieves semantically similar memories and fuses both
+    rankings; it pages by offset only and reports per-retriever timings.
+
+    `highlight=true` replaces each result's summary with a `headline`: short
+    fragments of the transcription around the matched terms, marked up with
+    <mark> tags.
+
+    `stream=ndjson` returns every match instead of a page, as one JSON object
+    per line in rank order, read through a server-side cursor so memory use
+    stays flat however many rows match. Paging, totals and facets do not
+    apply, and only lexical mode can be streamed.
+
+    Within an elder, words missing from the elder's vocabulary are corrected
+    to the closest known word (at most two edits) and the corrected query is
+    returned as `did_you_mean`; results are for the corrected query unless
+    `autocorrect=false`. Streams report it in an `X-Did-You-Mean` header.
+
+    `scope=family` searches every elder the authenticated user is linked to
+    as a family member (with a searching access level) in one query, ranked
+    together; results name their elder. The access check is a semi-join on
+    family_members inside the search itself, so it cannot be combined with
+    `elder_id`, and spelling is not corrected as vocabularies are per elder.
+
+    Responses are cached per elder (or globally without an elder filter) and
+    invalidated by any write to that elder's memories. Family-scoped searches
+    are not cached, so revoked access applies at once.
     """
-    query = select(Memory).where(Memory.deleted_at.is_(None))
-
-    search_term = f"%{q.lower()}%"
-    search_conditions = or_(
-        func.lower(Memory.title).like(search_term),
-        func.lower(Memory.transcription).like(search_term),
-        func.lower(Memory.summary).like(search_term),
+    spec = SearchSpec(
+        q=q,
+        scope=scope,
+        **filters,
+        **paging,
+        mode=mode,
+        highlight=highlight,
+        autocorrect=autocorrect,
     )
-    query = query.where(search_conditions)
+    user_id = _validate_spec(spec, current_user)
 
-    if elder_id is not None:
-        query = query.where(Memory.elder_id == elder_id)
-
-    if category:
-        query = query.where(Memory.category == category)
-
-    if era:
-        query = query.where(Memory.era == era)
+    if stream is None:
+        return await search_service.search(db, spec, user_id)
 
-    if decade:
-        query = query.where(Memory.decade == decade)
+    if spec.mode != "lexical":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only lexical searches can be streamed",
+        )
+    body, did_you_mean = await search_service.stream(db, spec, user_id)
+    headers = {}
+    if did_you_mean is not None:
+        headers["X-Did-You-Mean"] = quote(did_you_mean)
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
 
-    if emotional_tone:
-        query = query.where(Memory.emotional_tone == emotional_tone)
 
-    if location:
-        query = query.where(func.lower(Memory.location).like(f"%{location.lower()}%"))
+@router.post("/search/batch")
+async def search_memories_batch(
+    batch: SearchBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[str] = Depends(get_optional_user),
+) -> dict[str, Any]:
+    """
+    Run several searches in one request.
 
-    if date_from:
-        from datetime import datetime
+    Each search accepts the parameters of GET /search and returns the same
+    response, except that facets are computed once per elder over all of that
+    elder's memories and returned under `facets`, keyed by elder ID ("all" for
+    searches without an elder, "family" for family-scoped ones); each result
+    names its key in `facets_key`.
 
-        date_from_obj = datetime.fromisoformat(date_from)
-        query = query.where(Memory.date_of_event >= date_from_obj)
+    SQL runs one statement at a time on the request's session, but the vector
+    lookups of hybrid searches are started up front and overlap it. Searches
+    already in the cache do not touch the database.
+    """
+    user_ids = [_validate_spec(spec, current_user) for spec in batch.searches]
+    return await search_service.search_batch(db, batch.searches, user_ids)
 
-    if date_to:
-        from datetime import datetime
 
-        date_to_obj = datetime.fromisoformat(date_to)
-        query = query.where(Memory.date_of_event <= date_to_obj)
+def _validate_spec(spec: SearchSpec, current_user: Optional[str]) -> Optional[int]:
+    """
+    Reject parameter combinations that the search modes do not support.
 
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    Returns the ID of the user whose elders a family-scoped search covers.
+    """
+    if spec.mode == "hybrid" and spec.cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor paging is not supported in hybrid mode",
+        )
+    if spec.scope != "family":
+        return None
+    if spec.elder_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="elder_id cannot be combined with scope=family",
+        )
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Family-scoped search requires authentication",
+        )
+    return int(current_user)
 
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
 
-    result = await db.execute(query)
-    memories = result.scalars().all()
+@router.get("/search/semantic")
+async def semantic_search_memories(
+    q: str = Query(..., min_length=1, description="Natural-language query"),
+    filters: dict[str, Any] = Depends(search_filter_params),
+    page: int = Query(1, ge=1, le=50, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Search memories by meaning rather than exact words.
 
-    facets = await _get_search_facets(db, elder_id)
+    Candidates come from the approximate nearest-neighbour index, restricted
+    to the elder when one is given, and the remaining filters are applied in
+    SQL. When filters discard candidates the index is asked for more, up to
+    SEMANTIC_MAX_CANDIDATES, so deep pages of narrow filters can come back
+    short.
+    """
+    hits = await search_service.semantic_search(db, q, filters, page * page_size)
 
+    start = (page - 1) * page_size
     return {
         "query": q,
-        "total": total,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
+        "has_more": len(hits) > start + page_size,
         "results": [
-            {
-                "id": memory.id,
-                "elder_id": memory.elder_id,
-                "title": memory.title,
-                "summary": memory.summary,
-                "category": memory.category,
-                "era": memory.era,
-                "decade": memory.decade,
-                "emotional_tone": memory.emotional_tone,
-                "location": memory.location,
-                "date_of_event": (
-                    memory.date_of_event.isoformat() if memory.date_of_event else None
-                ),
-                "created_at": memory.created_at.isoformat(),
-            }
-            for memory in memories
+            {**serialize_memory(memory), "score": score}
+            for memory, score in hits[start : start + page_size]
         ],
-        "facets": facets,
-        "filters_applied": {
-            "elder_id": elder_id,
-            "category": category,
-            "era": era,
-            "decade": decade,
-            "emotional_tone": emotional_tone,
-            "location": location,
-            "date_from": date_from,
-            "date_to": date_to,
-        },
-    }
-
-
-async def _get_search_facets(
-    db: AsyncSession, elder_id: Optional[int] = None
-) -> dict[str, Any]:
-    """Get facets for search filtering."""
-    base_query = select(Memory).where(Memory.deleted_at.is_(None))
-
-    if elder_id is not None:
-        base_query = base_query.where(Memory.elder_id == elder_id)
-
-    category_query = (
-        select(Memory.category, func.count(Memory.id).label("count"))
-        .select_from(base_query.subquery())
-        .where(Memory.category.isnot(None))
-        .group_by(Memory.category)
-    )
-    category_result = await db.execute(category_query)
-    categories = [
-        {"value": row[0], "count": row[1]} for row in category_result.fetchall()
-    ]
-
-    era_query = (
-        select(Memory.era, func.count(Memory.id).label("count"))
-        .select_from(base_query.subquery())
-        .where(Memory.era.isnot(None))
-        .group_by(Memory.era)
-    )
-    era_result = await db.execute(era_query)
-    eras = [{"value": row[0], "count": row[1]} for row in era_result.fetchall()]
-
-    decade_query = (
-        select(Memory.decade, func.count(Memory.id).label("count"))
-        .select_from(base_query.subquery())
-        .where(Memory.decade.isnot(None))
-        .group_by(Memory.decade)
-        .order_by(Memory.decade)
-    )
-    decade_result = await db.execute(decade_query)
-    decades = [{"value": row[0], "count": row[1]} for row in decade_result.fetchall()]
-
-    tone_query = (
-        select(Memory.emotional_tone, func.count(Memory.id).label("count"))
-        .select_from(base_query.subquery())
-        .where(Memory.emotional_tone.isnot(None))
-        .group_by(Memory.emotional_tone)
-    )
-    tone_result = await db.execute(tone_query)
-    emotional_tones = [
-        {"value": row[0], "count": row[1]} for row in tone_result.fetchall()
-    ]
-
-    return {
-        "categories": categories,
-        "eras": eras,
-        "decades": decades,
-        "emotional_tones": emotional_tones,
+        "filters_applied": filters,
     }
 
 
@@ -186,23 +197,41 @@ async def get_search_suggestions(
     q: str = Query(..., min_length=2, description="Search query prefix"),
     elder_id: Optional[int] = Query(None, description="Filter by elder ID"),
     limit: int = Query(10, ge=1, le=20, description="Max suggestions"),
+    fuzzy: bool = Query(False, description="Rank titles by trigram similarity"),
     db: AsyncSession = Depends(get_db),
 ) -> list[str]:
-    """Get search suggestions based on partial query."""
+    """
+    Get search suggestions based on partial query.
+
+    With an elder, prefix suggestions come from an in-memory index of that
+    elder's titles, tags, people and locations, ranked by how many memories
+    use them. Otherwise prefix matching and the fuzzy mode run on the title
+    trigram index; fuzzy mode tolerates typos and orders titles by word
+    similarity.
+    """
+    if elder_id is not None and not fuzzy:
+        return await suggestion_service.suggest(db, elder_id, q, limit)
+
     query = select(Memory.title).where(
-        and_(
-            Memory.deleted_at.is_(None),
-            Memory.title.isnot(None),
-            func.lower(Memory.title).like(f"{q.lower()}%"),
-        )
+        Memory.deleted_at.is_(None),
+        Memory.title.isnot(None),
     )
 
     if elder_id is not None:
         query = query.where(Memory.elder_id == elder_id)
 
-    query = query.distinct().limit(limit)
+    if fuzzy:
+        query = (
+            query.where(literal(q).op("<%")(Memory.title))
+            .group_by(Memory.title)
+            .order_by(func.word_similarity(q, Memory.title).desc())
+        )
+    else:
+        query = query.where(
+            Memory.title.ilike(f"{escape_like(q)}%", escape=LIKE_ESCAPE)
+        ).distinct()
 
-    result = await db.execute(query)
+    result = await db.execute(query.limit(limit))
     suggestions = [row[0] for row in result.fetchall()]
 
     return suggestions
@@ -1,323 +1,145 @@
 """Timeline visualization endpoints."""
 
-from typing import Any, Optional, cast
+from typing import Any, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import and_, func, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import elder_etag, get_db
 from app.db.models.elder import Elder
-from app.db.models.memory import Memory
+from app.services.timeline_service import (
+    TIMELINE_GROUPINGS,
+    timeline_entry,
+    timeline_service,
+)
 
 router = APIRouter()
 
+TimelineDetail = Literal["full", "summary", "histogram"]
+HistogramResolution = Literal["year", "month"]
 
-@router.get("/elders/{elder_id}/timeline")
+
+@router.get("/elders/{elder_id}/timeline", dependencies=[Depends(elder_etag)])
 async def get_elder_timeline(
     elder_id: int,
     group_by: str = "decade",
+    detail: TimelineDetail = Query("full", description="full, summary or histogram"),
+    resolution: HistogramResolution = Query(
+        "year", description="Histogram resolution (year or month)"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
     """
     Get timeline data for an elder's memories.
 
+    Timelines are materialized per elder and mode, so this is a single keyed
+    read; the first request for an elder builds it (see TimelineService).
+
+    `detail=summary` returns each period's count with only its earliest few
+    memories; fetch the rest of a period from /timeline/periods/{period}.
+    `detail=histogram` returns just the number of memories per year or month
+    of their event (`resolution`), ignoring `group_by`.
+
+    Responses carry an ETag that changes with the elder's memories; a
+    matching If-None-Match is answered with 304 before any timeline query.
+
     Args:
         elder_id: ID of the elder
         group_by: How to group memories (decade, year, era, category)
+        detail: How much of each period to return
+        resolution: Period length of a histogram
 
     Returns:
         Timeline data grouped by specified parameter
     """
-    result = await db.execute(select(Elder).where(Elder.id == elder_id))
-    elder = result.scalar_one_or_none()
-
-    if not elder:
-        raise HTTPException(status_code=404, detail="Elder not found")
+    if group_by not in TIMELINE_GROUPINGS:
+        raise HTTPException(status_code=400, detail=f"Invalid group_by: {group_by}")
 
-    query = (
-        select(Memory)
-        .where(
-            and_(
-                Memory.elder_id == elder_id,
-                Memory.deleted_at.is_(None),
-            )
-        )
-        .order_by(Memory.date_of_event.asc())
+    if detail == "histogram":
+        result = await db.execute(select(Elder.name).where(Elder.id == elder_id))
+        elder_name = result.scalar_one_or_none()
+        if elder_name is None:
+            raise HTTPException(status_code=404, detail="Elder not found")
+
+        histogram = await timeline_service.histogram(db, elder_id, resolution)
+        return {
+            "elder_id": elder_id,
+            "elder_name": elder_name,
+            "detail": detail,
+            "resolution": resolution,
+            "total_memories": sum(bucket["count"] for bucket in histogram),
+            "timeline": histogram,
+        }
+
+    timeline = await timeline_service.get_timeline(
+        db, elder_id, group_by, summary=detail == "summary"
     )
 
-    result = await db.execute(query)
-    memories = cast(list[Memory], list(result.scalars().all()))
-
-    if group_by == "decade":
-        timeline_data = _group_by_decade(memories)
-    elif group_by == "year":
-        timeline_data = _group_by_year(memories)
-    elif group_by == "era":
-        timeline_data = _group_by_era(memories)
-    elif group_by == "category":
-        timeline_data = _group_by_category(memories)
-    else:
-        raise HTTPException(status_code=400, detail=f"Invalid group_by: {group_by}")
+    if timeline is None:
+        raise HTTPException(status_code=404, detail="Elder not found")
 
+    elder_name, timeline_data = timeline
     return {
         "elder_id": elder_id,
-        "elder_name": elder.name,
+        "elder_name": elder_name,
         "group_by": group_by,
-        "total_memories": len(memories),
+        "detail": detail,
+        "total_memories": sum(bucket["count"] for bucket in timeline_data),
         "timeline": timeline_data,
     }
 
 
-def _group_by_decade(memories: list[Memory]) -> list[dict[str, Any]]:
-    """Group memories by decade."""
-    decades: dict[str, list[dict[str, Any]]] = {}
-
-    for memory in memories:
-        decade_key = "Unknown"
-
-        if memory.decade:
-            decade_key = memory.decade
-        elif memory.date_of_event:
-            year = memory.date_of_event.year
-            decade_key = f"{(year // 10) * 10}s"
-
-        if decade_key not in decades:
-            decades[decade_key] = []
-
-        decades[decade_key].append(
-            {
-                "id": memory.id,
-                "title": memory.title,
-                "category": memory.category,
-                "date_of_event": (
-                    memory.date_of_event.isoformat() if memory.date_of_event else None
-                ),
-                "summary": memory.summary,
-                "emotional_tone": memory.emotional_tone,
-                "location": memory.location,
-            }
-        )
-
-    sorted_decades = sorted(
-        [
-            {
-                "period": decade,
-                "memories": memories_list,
-                "count": len(memories_list),
-            }
-            for decade, memories_list in decades.items()
-        ],
-        key=lambda x: str(x["period"]) if x["period"] != "Unknown" else "9999",
-    )
-
-    return sorted_decades
-
-
-def _group_by_year(memories: list[Memory]) -> list[dict[str, Any]]:
-    """Group memories by year."""
-    years: dict[int, list[dict[str, Any]]] = {}
-
-    for memory in memories:
-        if memory.date_of_event:
-            year = memory.date_of_event.year
-        else:
-            year = 0
-
-        if year not in years:
-            years[year] = []
-
-        years[year].append(
-            {
-                "id": memory.id,
-                "title": memory.title,
-                "category": memory.category,
-                "date_of_event": (
-                    memory.date_of_event.isoformat() if memory.date_of_event else None
-                ),
-                "summary": memory.summary,
-                "emotional_tone": memory.emotional_tone,
-                "location": memory.location,
-            }
-        )
-
-    sorted_years = sorted(
-        [
-            {
-                "period": str(year) if year > 0 else "Unknown",
-                "memories": memories_list,
-                "count": len(memories_list),
-            }
-            for year, memories_list in years.items()
-        ],
-        key=lambda x: int(str(x["period"])) if str(x["period"]).isdigit() else 9999,
-    )
-
-    return sorted_years
-
-
-def _group_by_era(memories: list[Memory]) -> list[dict[str, Any]]:
-    """Group memories by era/life stage."""
-    eras: dict[str, list[dict[str, Any]]] = {}
-
-    for memory in memories:
-        era_key = memory.era or "Unknown"
-
-        if era_key not in eras:
-            eras[era_key] = []
-
-        eras[era_key].append(
-            {
-                "id": memory.id,
-                "title": memory.title,
-                "category": memory.category,
-                "date_of_event": (
-                    memory.date_of_event.isoformat() if memory.date_of_event else None
-                ),
-                "summary": memory.summary,
-                "emotional_tone": memory.emotional_tone,
-                "location": memory.location,
-            }
-        )
-
-    era_order = [
-        "childhood",
-        "adolescence",
-        "young_adult",
-        "adult",
-        "middle_age",
-        "senior",
-        "Unknown",
-    ]
-
-    sorted_eras = sorted(
-        [
-            {
-                "period": era,
-                "memories": memories_list,
-                "count": len(memories_list),
-            }
-            for era, memories_list in eras.items()
-        ],
-        key=lambda x: (
-            era_order.index(str(x["period"]))
-            if str(x["period"]) in era_order
-            else len(era_order)
-        ),
-    )
-
-    return sorted_eras
-
-
-def _group_by_category(memories: list[Memory]) -> list[dict[str, Any]]:
-    """Group memories by category."""
-    categories: dict[str, list[dict[str, Any]]] = {}
-
-    for memory in memories:
-        category_key = memory.category or "Uncategorized"
-
-        if category_key not in categories:
-            categories[category_key] = []
-
-        categories[category_key].append(
-            {
-                "id": memory.id,
-                "title": memory.title,
-                "date_of_event": (
-                    memory.date_of_event.isoformat() if memory.date_of_event else None
-                ),
-                "summary": memory.summary,
-                "emotional_tone": memory.emotional_tone,
-                "location": memory.location,
-            }
-        )
-
-    sorted_categories = sorted(
-        [
-            {
-                "period": category,
-                "memories": memories_list,
-                "count": len(memories_list),
-            }
-            for category, memories_list in categories.items()
-        ],
-        key=lambda x: int(x["count"]) if isinstance(x["count"], int) else 0,
-        reverse=True,
-    )
-
-    return sorted_categories
-
-
-@router.get("/elders/{elder_id}/timeline/stats")
-async def get_timeline_stats(
+@router.get(
+    "/elders/{elder_id}/timeline/periods/{period}", dependencies=[Depends(elder_etag)]
+)
+async def get_timeline_period(
     elder_id: int,
+    period: str,
+    group_by: str = "decade",
+    size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
-    """Get timeline statistics for an elder."""
-    result = await db.execute(select(Elder).where(Elder.id == elder_id))
-    elder = result.scalar_one_or_none()
+    """
+    Page through the memories of one timeline period, oldest event first.
 
-    if not elder:
+    The period is as returned by the timeline for the same `group_by`, e.g.
+    `1960s`, `1965`, `childhood` or `Unknown`.
+    """
+    if group_by not in TIMELINE_GROUPINGS:
+        raise HTTPException(status_code=400, detail=f"Invalid group_by: {group_by}")
+
+    result = await db.execute(select(Elder.id).where(Elder.id == elder_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Elder not found")
 
-    query = select(Memory).where(
-        and_(
-            Memory.elder_id == elder_id,
-            Memory.deleted_at.is_(None),
-        )
+    page = await timeline_service.period_page(
+        db, elder_id, group_by, period, size, cursor=cursor
     )
-
-    result = await db.execute(query)
-    memories = cast(list[Memory], list(result.scalars().all()))
-
-    earliest_memory = None
-    latest_memory = None
-
-    for memory in memories:
-        if memory.date_of_event:
-            if earliest_memory is None or memory.date_of_event < earliest_memory:
-                earliest_memory = memory.date_of_event
-            if latest_memory is None or memory.date_of_event > latest_memory:
-                latest_memory = memory.date_of_event
-
-    decades_covered: set[str] = set()
-    categories: dict[str, int] = {}
-    eras: dict[str, int] = {}
-
-    for memory in memories:
-        if memory.decade:
-            decades_covered.add(memory.decade)
-        elif memory.date_of_event:
-            year = memory.date_of_event.year
-            decades_covered.add(f"{(year // 10) * 10}s")
-
-        if memory.category:
-            categories[memory.category] = categories.get(memory.category, 0) + 1
-
-        if memory.era:
-            eras[memory.era] = eras.get(memory.era, 0) + 1
-
     return {
-        "total_memories": len(memories),
-        "earliest_memory": earliest_memory.isoformat() if earliest_memory else None,
-        "latest_memory": latest_memory.isoformat() if latest_memory else None,
-        "decades_covered": sorted(list(decades_covered)),
-        "total_decades": len(decades_covered),
-        "categories": categories,
-        "eras": eras,
-        "completeness_score": _calculate_completeness(decades_covered, memories),
+        "elder_id": elder_id,
+        "group_by": group_by,
+        "period": period,
+        "size": size,
+        "memories": [timeline_entry(group_by, row) for row in page.rows],
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor,
     }
 
 
-def _calculate_completeness(decades_covered: set[str], memories: list[Memory]) -> float:
-    """Calculate timeline completeness score (0-100)."""
-    if not memories:
-        return 0.0
-
-    expected_decades = 8
-    decade_score = (len(decades_covered) / expected_decades) * 50
+@router.get("/elders/{elder_id}/timeline/stats", dependencies=[Depends(elder_etag)])
+async def get_timeline_stats(
+    elder_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Get timeline statistics for an elder.
 
-    category_coverage = len(set(m.category for m in memories if m.category))
-    category_score = min((category_coverage / 10) * 50, 50)
+    Computed by one aggregate query (see TimelineService.stats).
+    """
+    result = await db.execute(select(Elder.id).where(Elder.id == elder_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Elder not found")
 
-    return min(decade_score + category_score, 100.0)
+    return await timeline_service.stats(db, elder_id)
@@ -0,0 +1,52 @@
+"""Maintenance commands.
+
+Usage: python -m app.cli <command>
+"""
+
+import argparse
+import asyncio
+
+from app.db.session import AsyncSessionLocal
+from app.services.semantic_search_service import semantic_search_service
+from app.services.timeline_service import timeline_service
+from app.services.vocabulary_service import vocabulary_service
+
+
+async def rebuild_vectors() -> None:
+    """Embed missing memories and publish a fresh vector index build."""
+    async with AsyncSessionLocal() as db:
+        count = await semantic_search_service.rebuild(db)
+    print(f"Indexed {count} memories")
+
+
+async def rebuild_vocabulary() -> None:
+    """Recount every elder's search vocabulary."""
+    async with AsyncSessionLocal() as db:
+        count = await vocabulary_service.rebuild(db)
+    print(f"Indexed {count} terms")
+
+
+async def rebuild_timelines() -> None:
+    """Materialize every elder's timelines from scratch."""
+    async with AsyncSessionLocal() as db:
+        count = await timeline_service.rebuild(db)
+    print(f"Built {count} timeline buckets")
+
+
+COMMANDS = {
+    "rebuild-timelines": rebuild_timelines,
+    "rebuild-vectors": rebuild_vectors,
+    "rebuild-vocabulary": rebuild_vocabulary,
+}
+
+
+def main() -> None:
+    """Run the command named on the command line."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(COMMANDS[args.command]())
+
+
+if __name__ == "__main__":
+    main()
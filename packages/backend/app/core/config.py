@@ -47,7 +47,17 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
+    PAGINATION_COUNT_CAP: int = 10001
+
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_LOG_SIZE: int = 200
+
     REDIS_URL: str = "redis://localhost:6379/0"
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: int = 300
+    SEARCH_CACHE_MAX_ENTRIES: int = 2048
 
     CORS_ORIGINS: str = "http://localhost:3000"
     CORS_CREDENTIALS: bool = True
@@ -69,6 +79,11 @@ class Settings(BaseSettings):
         """Parse CORS headers as list."""
         return [header.strip() for header in self.CORS_HEADERS.split(",")]
 
+    @property
+    def search_family_access_levels_list(self) -> List[str]:
+        """Parse the access levels that let a family member search as list."""
+        return [level.strip() for level in self.SEARCH_FAMILY_ACCESS_LEVELS.split(",")]
+
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
@@ -78,6 +93,25 @@ class Settings(BaseSettings):
     OPENAI_TEMPERATURE: float = 0.7
     WHISPER_MODEL: str = "whisper-1"
 
+    SEARCH_FAMILY_ACCESS_LEVELS: str = "viewer,contributor,editor,admin,owner"
+
+    EMBEDDING_BACKEND: str = "hashing"
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    EMBEDDING_DIM: int = 256
+    VECTOR_INDEX_PATH: str = "/tmp/memvault/vector_index"
+    VECTOR_INDEX_NPROBE: int = 8
+    VECTOR_INDEX_REFRESH_SECONDS: int = 30
+
+    SUGGESTION_INDEX_MAX_BYTES: int = 64 * 1024 * 1024
+    SUGGESTION_INDEX_TTL_SECONDS: int = 300
+
+    VOCABULARY_INDEX_MAX_BYTES: int = 64 * 1024 * 1024
+    VOCABULARY_INDEX_TTL_SECONDS: int = 300
+
+    FACET_INDEX_ENABLED: bool = False
+    FACET_INDEX_MAX_BYTES: int = 64 * 1024 * 1024
+    FACET_INDEX_TTL_SECONDS: int = 300
+
     ELEVENLABS_API_KEY: str = ""
 
     PINATA_API_KEY: str = ""
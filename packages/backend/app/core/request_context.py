@@ -0,0 +1,7 @@
+"""Per-request values made available outside the request handlers."""
+
+from contextvars import ContextVar
+from typing import Optional
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+request_route_var: ContextVar[Optional[str]] = ContextVar("request_route", default=None)
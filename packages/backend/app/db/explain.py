@@ -0,0 +1,45 @@
+"""EXPLAIN support for SQLAlchemy statements."""
+
+import json
+import re
+from typing import Any, cast
+
+from sqlalchemy import TextClause, bindparam, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement
+
+# Statements are rendered with named parameters, which text() parses back into
+# bind parameters; IN lists compile to a post-compile placeholder instead.
+_DIALECT = postgresql.dialect(paramstyle="named")
+_POSTCOMPILE_RE = re.compile(r"\(__\[POSTCOMPILE_(\w+)\]\)")
+
+
+def explain(statement: ClauseElement, options: str = "FORMAT JSON") -> TextClause:
+    """
+    Return EXPLAIN (<options>) <statement> as a text clause.
+
+    The statement's bind parameters are carried over with their types (IN
+    lists as expanding parameters), so values are sent exactly as they would
+    be for the statement itself.
+    """
+    compiled = cast(SQLCompiler, statement.compile(dialect=_DIALECT))
+    sql = _POSTCOMPILE_RE.sub(r":\1", compiled.string)
+    return text(f"EXPLAIN ({options}) {sql}").bindparams(
+        *(
+            bindparam(
+                name,
+                value,
+                type_=compiled.binds[name].type,
+                expanding=compiled.binds[name].expanding,
+            )
+            for name, value in compiled.params.items()
+        )
+    )
+
+
+def plan_rows(plan: Any) -> int:
+    """Extract the planner's top-level row estimate from EXPLAIN JSON output."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -4,6 +4,20 @@ from app.db.models.elder import Elder
 from app.db.models.family_member import FamilyMember
 from app.db.models.interview_session import InterviewSession
 from app.db.models.memory import Memory
+from app.db.models.saved_search import SavedSearch, SavedSearchMatch
+from app.db.models.timeline_snapshot import TimelineBucket, TimelineSnapshot
 from app.db.models.user import User
+from app.db.models.vocabulary_term import VocabularyTerm
 
-__all__ = ["User", "Elder", "Memory", "FamilyMember", "InterviewSession"]
+__all__ = [
+    "User",
+    "Elder",
+    "Memory",
+    "FamilyMember",
+    "InterviewSession",
+    "SavedSearch",
+    "SavedSearchMatch",
+    "VocabularyTerm",
+    "TimelineSnapshot",
+    "TimelineBucket",
+]
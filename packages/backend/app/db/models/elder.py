@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -15,6 +15,27 @@ class Elder(Base):
     """Elder model for storing elder profiles."""
 
     __tablename__ = "elders"
+    __table_args__ = (
+        Index("ix_elders_created_at_id", "created_at", "id"),
+        Index(
+            "ix_elders_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_elders_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_elders_hometown_trgm",
+            "hometown",
+            postgresql_using="gin",
+            postgresql_ops={"hometown": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -49,6 +70,13 @@ class Elder(Base):
     )
     privacy_settings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
+    # Bumped by the memory hooks after every write to the elder's memories,
+    # once timelines are updated, and on every play; part of the ETags of
+    # per-elder responses.
+    content_version: Mapped[int] = mapped_column(
+        BigInteger, server_default="0", nullable=False
+    )
+
     # Metadata
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
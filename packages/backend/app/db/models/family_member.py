@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -15,6 +15,17 @@ class FamilyMember(Base):
     """Family member model linking users to elders."""
 
     __tablename__ = "family_members"
+    __table_args__ = (
+        Index("ix_family_members_created_at_id", "created_at", "id"),
+        # Covers the access check of family-scoped search with an index-only scan.
+        Index(
+            "ix_family_members_user_id_access_level_elder_id",
+            "user_id",
+            "access_level",
+            "elder_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
@@ -1,20 +1,63 @@
 """Memory database model."""
 
 from datetime import datetime
-from typing import Optional
-
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from typing import Any, Optional
+
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.utils.text import normalize_labels
 
 
 class Memory(Base):
     """Memory model for storing elder memories."""
 
     __tablename__ = "memories"
+    __table_args__ = (
+        Index("ix_memories_elder_id_created_at_id", "elder_id", "created_at", "id"),
+        Index("ix_memories_elder_id_event_year", "elder_id", "event_year"),
+        Index("ix_memories_elder_id_event_decade", "elder_id", "event_decade"),
+        Index("ix_memories_elder_id_event_era", "elder_id", "event_era"),
+        Index("ix_memories_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_memories_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_memories_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_memories_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_memories_people_keys",
+            "people_keys",
+            postgresql_using="gin",
+            postgresql_ops={"people_keys": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     elder_id: Mapped[int] = mapped_column(
@@ -46,10 +89,21 @@ class Memory(Base):
     date_of_event: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
-    people_mentioned: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # Derived on write by the memories_event_fields_trigger: the event year,
+    # and the decade and era if set, else from the year and the elder's age.
+    event_year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    event_decade: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    event_era: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    # Lists of names; normalized on write so @> containment filters match
+    people_mentioned: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
+    # Lowercased people_mentioned, which person filters match against so that
+    # case does not matter while the names keep their spelling.
+    people_keys: Mapped[Optional[list[str]]] = mapped_column(
+        JSONB, Computed("lower(people_mentioned::text)::jsonb"), nullable=True
+    )
 
-    # AI Analysis
-    tags: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # AI Analysis (tags: lowercase list of labels)
+    tags: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
     entities: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     sentiment: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     emotional_tone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -86,13 +140,25 @@ class Memory(Base):
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
+        index=True,
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
 
-    # Full-text search
+    # Full-text search (maintained by the memories_search_vector_trigger)
     search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True)
 
+    # Semantic search (float16 vector, see app/services/embedding_service.py)
+    embedding: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+
+    @validates("tags")
+    def _normalize_tags(self, key: str, value: Any) -> Optional[list[str]]:
+        return normalize_labels(value, lowercase=True)
+
+    @validates("people_mentioned")
+    def _normalize_people(self, key: str, value: Any) -> Optional[list[str]]:
+        return normalize_labels(value)
+
     def __repr__(self) -> str:
         return f"<Memory(id={self.id}, elder_id={self.elder_id}, title={self.title})>"
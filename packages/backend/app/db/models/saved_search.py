@@ -0,0 +1,87 @@
+"""Saved search database models."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class SavedSearch(Base):
+    """A search a family member follows for new memories of an elder."""
+
+    __tablename__ = "saved_searches"
+    __table_args__ = (
+        Index("ix_saved_searches_created_at_id", "created_at", "id"),
+        # Reverse index from match keys to searches, probed with ?| on insert.
+        Index("ix_saved_searches_match_keys", "match_keys", postgresql_using="gin"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    family_member_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("family_members.id"), nullable=False, index=True
+    )
+    elder_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("elders.id"), nullable=False, index=True
+    )
+
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    query: Mapped[str] = mapped_column(String(500), nullable=False)
+
+    # Keys a memory must share with this search to possibly match it
+    # (see app/services/percolator_service.py).
+    match_keys: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
+
+    last_matched_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Metadata
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<SavedSearch(id={self.id}, name={self.name}, query={self.query})>"
+
+
+class SavedSearchMatch(Base):
+    """A memory that matched a saved search when it was created."""
+
+    __tablename__ = "saved_search_matches"
+    __table_args__ = (
+        UniqueConstraint("saved_search_id", "memory_id"),
+        Index(
+            "ix_saved_search_matches_search_matched_at",
+            "saved_search_id",
+            "matched_at",
+            "id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    saved_search_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("saved_searches.id"), nullable=False
+    )
+    memory_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("memories.id"), nullable=False, index=True
+    )
+    matched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SavedSearchMatch(saved_search_id={self.saved_search_id}, memory_id={self.memory_id})>"
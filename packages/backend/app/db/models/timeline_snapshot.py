@@ -0,0 +1,62 @@
+"""Materialized timeline database models."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class TimelineSnapshot(Base):
+    """Marks an elder's timeline for one group_by mode as materialized."""
+
+    __tablename__ = "timeline_snapshots"
+
+    elder_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("elders.id"), primary_key=True
+    )
+    group_by: Mapped[str] = mapped_column(String(20), primary_key=True)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<TimelineSnapshot(elder_id={self.elder_id}, group_by={self.group_by})>"
+
+
+class TimelineBucket(Base):
+    """One period of a materialized timeline, with its serialized memories."""
+
+    __tablename__ = "timeline_buckets"
+
+    elder_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("elders.id"), primary_key=True
+    )
+    group_by: Mapped[str] = mapped_column(String(20), primary_key=True)
+    period: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Timeline entries as returned by the API; json rather than jsonb keeps
+    # their key order.
+    memories: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    # The first few of them, for summary timelines.
+    preview: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    # IDs of the memories above, to find a memory's bucket when it changes.
+    memory_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TimelineBucket(elder_id={self.elder_id}, group_by={self.group_by}, "
+            f"period={self.period})>"
+        )
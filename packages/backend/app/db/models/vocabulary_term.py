@@ -0,0 +1,21 @@
+"""Search vocabulary database model."""
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class VocabularyTerm(Base):
+    """A word used in an elder's memories, with the number of memories using it."""
+
+    __tablename__ = "vocabulary_terms"
+
+    elder_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("elders.id"), primary_key=True
+    )
+    term: Mapped[str] = mapped_column(String(50), primary_key=True)
+    frequency: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<VocabularyTerm(elder_id={self.elder_id}, term={self.term})>"
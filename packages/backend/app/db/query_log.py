@@ -0,0 +1,157 @@
+"""Slow query capture with sampled EXPLAIN ANALYZE plans."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.request_context import request_id_var, request_route_var
+
+# Execution option that keeps the logger's own EXPLAIN runs out of the log.
+SKIP_OPTION = "skip_query_log"
+# At most this many EXPLAIN ANALYZE re-runs are in flight at once.
+MAX_CONCURRENT_EXPLAINS = 2
+MAX_PARAMS_LENGTH = 500
+
+
+def describe_parameters(parameters: Any) -> str:
+    """
+    Summarize bind parameters by type and length, never by value.
+
+    Statements bind credentials, personal details and memory text, none of
+    which may be kept in the log.
+    """
+    if isinstance(parameters, dict):
+        described = repr({name: _describe(value) for name, value in parameters.items()})
+    elif isinstance(parameters, list):
+        # executemany: one set of parameters per row.
+        first = describe_parameters(parameters[0]) if parameters else ""
+        described = f"{len(parameters)} x {first}"
+    elif isinstance(parameters, tuple):
+        described = repr(tuple(_describe(value) for value in parameters))
+    else:
+        described = _describe(parameters)
+    return described[:MAX_PARAMS_LENGTH]
+
+
+def _describe(value: Any) -> str:
+    name = type(value).__name__
+    if isinstance(value, (str, bytes, list, tuple, dict)):
+        return f"{name}[{len(value)}]"
+    return name
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of statements slower than SLOW_QUERY_THRESHOLD_MS.
+
+    Each entry records the statement, the types and lengths of its
+    parameters (not their values), its duration and the request it ran
+    for. A sampled fraction of slow SELECTs is re-run in the background
+    with EXPLAIN (ANALYZE, BUFFERS) on a separate pooled connection, and
+    the plan is attached to the entry when it arrives. Only SELECTs are
+    re-run, since ANALYZE executes the statement.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create an empty log holding the last `size` slow statements."""
+        self.entries: deque[dict[str, Any]] = deque(maxlen=size)
+        self._engine: Optional[AsyncEngine] = None
+        self._explains: set[asyncio.Task[None]] = set()
+
+    def install(self, engine: AsyncEngine) -> None:
+        """Start timing every statement executed through engine."""
+        self._engine = engine
+        event.listen(engine.sync_engine, "before_cursor_execute", _before_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_execute)
+
+    def clear(self) -> None:
+        """Forget all captured statements."""
+        self.entries.clear()
+
+    def _after_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        started = conn.info.pop("query_log_start", None)
+        if started is None or conn.get_execution_options().get(SKIP_OPTION):
+            return
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+            return
+
+        entry: dict[str, Any] = {
+            "statement": statement,
+            "parameters": describe_parameters(parameters),
+            "duration_ms": round(duration_ms, 2),
+            "request_id": request_id_var.get(),
+            "route": request_route_var.get(),
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "plan": None,
+        }
+        self.entries.append(entry)
+        logger.warning(
+            "Slow query (%.1f ms)",
+            duration_ms,
+            extra={"request_id": entry["request_id"], "path": entry["route"]},
+        )
+
+        if (
+            not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and len(self._explains) < MAX_CONCURRENT_EXPLAINS
+            and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        ):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self._explain(entry, statement, parameters))
+            self._explains.add(task)
+            task.add_done_callback(self._explains.discard)
+
+    async def _explain(
+        self, entry: dict[str, Any], statement: str, parameters: Any
+    ) -> None:
+        if self._engine is None:
+            return
+        try:
+            async with self._engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_OPTION: True})
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                    parameters,
+                )
+                entry["plan"] = result.scalar()
+        except SQLAlchemyError as exc:
+            # Diagnostics must never surface as request errors.
+            entry["plan_error"] = str(exc)
+
+
+def _before_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    conn.info["query_log_start"] = time.perf_counter()
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_LOG_SIZE)
@@ -5,6 +5,7 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.db.query_log import slow_query_log
 
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -13,6 +14,9 @@ engine = create_async_engine(
     max_overflow=settings.DB_MAX_OVERFLOW,
 )
 
+if settings.SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.install(engine)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -14,6 +14,7 @@ from fastapi.responses import JSONResponse
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.logging import logger, setup_logging
+from app.core.request_context import request_id_var, request_route_var
 
 setup_logging()
 
@@ -55,6 +56,8 @@ async def add_request_id_middleware(request: Request, call_next: Any) -> Any:
     """Add request ID and timing to all requests."""
     request_id = str(uuid.uuid4())
     request.state.request_id = request_id
+    request_id_var.set(request_id)
+    request_route_var.set(f"{request.method} {request.url.path}")
 
     start_time = time.time()
     response = await call_next(request)
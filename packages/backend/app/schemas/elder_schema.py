@@ -70,7 +70,10 @@ class ElderList(BaseModel):
     """Schema for paginated elder list."""
 
     items: list[ElderResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_exact: Optional[bool] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
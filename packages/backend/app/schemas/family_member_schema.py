@@ -60,7 +60,10 @@ class FamilyMemberList(BaseModel):
     """Schema for paginated family member list."""
 
     items: list[FamilyMemberResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_exact: Optional[bool] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
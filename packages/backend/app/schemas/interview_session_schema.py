@@ -58,10 +58,13 @@ class InterviewSessionList(BaseModel):
     """Schema for paginated interview session list."""
 
     items: list[InterviewSessionResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_exact: Optional[bool] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class ConversationTurn(BaseModel):
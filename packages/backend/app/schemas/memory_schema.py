@@ -1,9 +1,11 @@
 """Memory schemas."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.utils.text import normalize_labels
 
 
 class MemoryBase(BaseModel):
@@ -24,8 +26,8 @@ class MemoryBase(BaseModel):
     decade: Optional[str] = Field(None, max_length=10)
     location: Optional[str] = Field(None, max_length=255)
     date_of_event: Optional[datetime] = None
-    people_mentioned: Optional[dict] = None
-    tags: Optional[dict] = None
+    people_mentioned: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
     entities: Optional[dict] = None
     sentiment: Optional[str] = Field(None, max_length=50)
     emotional_tone: Optional[str] = Field(None, max_length=50)
@@ -38,6 +40,18 @@ class MemoryBase(BaseModel):
     audio_quality_score: Optional[float] = None
     recorded_at: Optional[datetime] = None
 
+    @field_validator("tags", mode="before")
+    @classmethod
+    def normalize_tags(cls, v: Any) -> Optional[list[str]]:
+        """Accept legacy tag shapes and normalize them to a lowercase list."""
+        return normalize_labels(v, lowercase=True)
+
+    @field_validator("people_mentioned", mode="before")
+    @classmethod
+    def normalize_people(cls, v: Any) -> Optional[list[str]]:
+        """Accept legacy people shapes and normalize them to a list."""
+        return normalize_labels(v)
+
 
 class MemoryCreate(MemoryBase):
     """Schema for creating a memory."""
@@ -62,8 +76,8 @@ class MemoryUpdate(BaseModel):
     decade: Optional[str] = Field(None, max_length=10)
     location: Optional[str] = Field(None, max_length=255)
     date_of_event: Optional[datetime] = None
-    people_mentioned: Optional[dict] = None
-    tags: Optional[dict] = None
+    people_mentioned: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
     entities: Optional[dict] = None
     sentiment: Optional[str] = Field(None, max_length=50)
     emotional_tone: Optional[str] = Field(None, max_length=50)
@@ -76,6 +90,18 @@ class MemoryUpdate(BaseModel):
     audio_quality_score: Optional[float] = None
     recorded_at: Optional[datetime] = None
 
+    @field_validator("tags", mode="before")
+    @classmethod
+    def normalize_tags(cls, v: Any) -> Optional[list[str]]:
+        """Accept legacy tag shapes and normalize them to a lowercase list."""
+        return normalize_labels(v, lowercase=True)
+
+    @field_validator("people_mentioned", mode="before")
+    @classmethod
+    def normalize_people(cls, v: Any) -> Optional[list[str]]:
+        """Accept legacy people shapes and normalize them to a list."""
+        return normalize_labels(v)
+
 
 class MemoryResponse(MemoryBase):
     """Schema for memory response."""
@@ -95,7 +121,10 @@ class MemoryList(BaseModel):
     """Schema for paginated memory list."""
 
     items: list[MemoryResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_exact: Optional[bool] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
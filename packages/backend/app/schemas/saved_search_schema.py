@@ -0,0 +1,71 @@
+"""Saved search schemas."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.memory_schema import MemoryResponse
+
+
+class SavedSearchBase(BaseModel):
+    """Base saved search schema."""
+
+    name: str = Field(..., min_length=1, max_length=100)
+    query: str = Field(..., min_length=1, max_length=500)
+
+
+class SavedSearchCreate(SavedSearchBase):
+    """Schema for saving a search for a family member."""
+
+    family_member_id: int
+
+
+class SavedSearchUpdate(BaseModel):
+    """Schema for updating a saved search."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    query: Optional[str] = Field(None, min_length=1, max_length=500)
+
+
+class SavedSearchResponse(SavedSearchBase):
+    """Schema for saved search response."""
+
+    id: int
+    family_member_id: int
+    elder_id: int
+    last_matched_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SavedSearchList(BaseModel):
+    """Schema for paginated saved search list."""
+
+    items: list[SavedSearchResponse]
+    total: Optional[int] = None
+    total_is_exact: Optional[bool] = None
+    page: Optional[int] = None
+    size: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class SavedSearchMatchResponse(BaseModel):
+    """A memory matched by a saved search."""
+
+    matched_at: datetime
+    memory: MemoryResponse
+
+
+class SavedSearchMatchList(BaseModel):
+    """Schema for a cursor-paged list of saved search matches."""
+
+    items: list[SavedSearchMatchResponse]
+    size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
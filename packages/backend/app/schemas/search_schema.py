@@ -0,0 +1,55 @@
+"""Search schemas."""
+
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.utils.pagination import TotalMode
+
+SearchMode = Literal["lexical", "hybrid"]
+SearchScope = Literal["all", "family"]
+
+# SearchSpec fields that narrow the result set (echoed as filters_applied).
+SEARCH_FILTER_FIELDS = (
+    "elder_id",
+    "category",
+    "era",
+    "decade",
+    "emotional_tone",
+    "location",
+    "date_from",
+    "date_to",
+    "tag",
+    "person",
+)
+
+
+class SearchSpec(BaseModel):
+    """One memory search; mirrors the query parameters of GET /search."""
+
+    q: str = Field(..., min_length=1, description="Search query")
+    scope: SearchScope = Field("all", description="all, or family for your elders")
+    elder_id: Optional[int] = Field(None, description="Filter by elder ID")
+    category: Optional[str] = Field(None, description="Filter by category")
+    era: Optional[str] = Field(None, description="Filter by era")
+    decade: Optional[str] = Field(None, description="Filter by decade")
+    emotional_tone: Optional[str] = Field(None, description="Filter by tone")
+    location: Optional[str] = Field(None, description="Filter by location")
+    date_from: Optional[str] = Field(None, description="Start date (YYYY-MM-DD)")
+    date_to: Optional[str] = Field(None, description="End date (YYYY-MM-DD)")
+    tag: Optional[list[str]] = Field(None, description="Require all tags")
+    person: Optional[list[str]] = Field(None, description="Require all people")
+    page: int = Field(1, ge=1, description="Page number")
+    page_size: int = Field(20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="Cursor from a previous page")
+    include_total: bool = Field(False, description="Count matches in cursor mode")
+    total_mode: TotalMode = Field("exact", description="exact, capped or estimate")
+    mode: SearchMode = Field("lexical", description="lexical or hybrid")
+    highlight: bool = Field(False, description="Return snippets of matched terms")
+    autocorrect: bool = Field(True, description="Search for corrected spellings")
+
+
+class SearchBatchRequest(BaseModel):
+    """Request schema for running several searches at once."""
+
+    searches: list[SearchSpec] = Field(..., min_length=1, max_length=20)
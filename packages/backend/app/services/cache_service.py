@@ -0,0 +1,264 @@
+"""Response cache backed by Redis with an in-process fallback."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, Optional, Protocol, TypeVar
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "memvault:cache"
+# How long to stay on the local cache after Redis fails before retrying it.
+REDIS_RETRY_SECONDS = 30.0
+
+
+def search_cache_scope(elder_id: Optional[int]) -> str:
+    """Cache scope of search results for an elder, or across all elders."""
+    return f"elder:{elder_id}" if elder_id is not None else "memories"
+
+
+class LocalCache:
+    """Bounded LRU of string values with per-entry expiry."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Create an empty cache holding at most max_entries values."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value for key, if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        """Store value under key for ttl seconds, evicting the oldest entries."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def counter(self, key: str) -> int:
+        """Return the current value of a counter."""
+        return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        """Increment a counter and return its new value."""
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+
+class ElderIndex(Protocol):
+    """An in-process index of one elder's memories."""
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the index."""
+
+    @property
+    def loaded_at(self) -> float:
+        """time.monotonic() when the index was loaded."""
+
+
+IndexT = TypeVar("IndexT", bound=ElderIndex)
+
+
+class ElderIndexCache(Generic[IndexT]):
+    """
+    Per-elder indexes, loaded lazily and evicted LRU by size.
+
+    An index is built by `loader` the first time an elder is asked for and
+    then kept current by its service; writes handled by other processes are
+    picked up when it expires after `ttl()` seconds. Concurrent cold reads
+    of an elder wait on one lock, so the index is loaded once. The lock is
+    dropped when nobody holds or waits on it any more. The budget and TTL
+    are callables, so settings are read when used.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[AsyncSession, int], Awaitable[IndexT]],
+        max_bytes: Callable[[], int],
+        ttl: Callable[[], int],
+    ) -> None:
+        """Create an empty cache of indexes built by loader."""
+        self._loader = loader
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._indexes: OrderedDict[int, IndexT] = OrderedDict()
+        self._locks: dict[int, asyncio.Lock] = {}
+        # Requests holding or waiting on each elder's lock.
+        self._lock_users: dict[int, int] = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by all cached indexes."""
+        return sum(index.nbytes for index in self._indexes.values())
+
+    def peek(self, elder_id: int) -> Optional[IndexT]:
+        """An elder's index if it is loaded, without loading or touching it."""
+        return self._indexes.get(elder_id)
+
+    def _fresh(self, elder_id: int) -> Optional[IndexT]:
+        index = self._indexes.get(elder_id)
+        if index is None:
+            return None
+        if time.monotonic() - index.loaded_at > self._ttl():
+            del self._indexes[elder_id]
+            return None
+        self._indexes.move_to_end(elder_id)
+        return index
+
+    async def get(self, db: AsyncSession, elder_id: int) -> IndexT:
+        """Return an elder's index, loading it if needed."""
+        index = self._fresh(elder_id)
+        if index is not None:
+            return index
+
+        lock = self._locks.get(elder_id)
+        if lock is None:
+            lock = self._locks[elder_id] = asyncio.Lock()
+        self._lock_users[elder_id] = self._lock_users.get(elder_id, 0) + 1
+        try:
+            async with lock:
+                index = self._fresh(elder_id)
+                if index is None:
+                    index = await self._loader(db, elder_id)
+                    self._indexes[elder_id] = index
+                    self.evict()
+                return index
+        finally:
+            self._lock_users[elder_id] -= 1
+            if not self._lock_users[elder_id]:
+                del self._lock_users[elder_id]
+                del self._locks[elder_id]
+
+    def evict(self) -> None:
+        """Drop least recently used indexes until the cache fits its budget."""
+        total = self.nbytes
+        while len(self._indexes) > 1 and total > self._max_bytes():
+            _, index = self._indexes.popitem(last=False)
+            total -= index.nbytes
+
+    def clear(self) -> None:
+        """Drop every cached index."""
+        self._indexes.clear()
+
+
+class CacheService:
+    """
+    Cache of JSON responses invalidated by generation counters.
+
+    Every cached entry is keyed under the current generation of its scope
+    (e.g. an elder). Writes bump the generation, so stale entries are never
+    read again and simply age out. Redis is used when reachable so all workers
+    share entries and generations; otherwise each process falls back to a
+    bounded local LRU, where TTLs bound staleness across workers.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the cache; Redis is connected lazily."""
+        self.local = LocalCache(settings.SEARCH_CACHE_MAX_ENTRIES)
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_retry_at = 0.0
+
+    def _client(self) -> Optional[aioredis.Redis]:
+        if not settings.REDIS_URL or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=0.25,
+                socket_timeout=0.25,
+            )
+        return self._redis
+
+    def _redis_failed(self, error: RedisError) -> None:
+        logger.warning("Redis unavailable, using local cache: %s", error)
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None."""
+        value: Optional[str] = None
+        client = self._client()
+        if client is not None:
+            try:
+                value = await client.get(key)
+            except RedisError as error:
+                self._redis_failed(error)
+                value = self.local.get(key)
+        else:
+            value = self.local.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set_json(self, key: str, value: Any, ttl: int) -> None:
+        """Cache a JSON-serialisable value for ttl seconds."""
+        data = json.dumps(value, separators=(",", ":"), default=str)
+        client = self._client()
+        if client is not None:
+            try:
+                await client.set(key, data, ex=ttl)
+                return
+            except RedisError as error:
+                self._redis_failed(error)
+        self.local.set(key, data, ttl)
+
+    async def generation(self, scope: str) -> str:
+        """
+        Return the current generation of a scope.
+
+        Redis and local generations are counted separately, so they are
+        tagged to keep their keys from ever colliding.
+        """
+        key = f"{KEY_PREFIX}:gen:{scope}"
+        client = self._client()
+        if client is not None:
+            try:
+                return f"r{int(await client.get(key) or 0)}"
+            except RedisError as error:
+                self._redis_failed(error)
+        return f"l{self.local.counter(key)}"
+
+    async def bump(self, *scopes: str) -> None:
+        """Invalidate everything cached under the given scopes."""
+        keys = [f"{KEY_PREFIX}:gen:{scope}" for scope in scopes]
+        for key in keys:
+            self.local.incr(key)
+        client = self._client()
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.incr(key)
+                    await pipe.execute()
+            except RedisError as error:
+                self._redis_failed(error)
+
+    async def key(self, namespace: str, scope: str, params: dict[str, Any]) -> str:
+        """Build a cache key for params under the current generation of scope."""
+        generation = await self.generation(scope)
+        digest = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"{KEY_PREFIX}:{namespace}:{scope}:{generation}:{digest}"
+
+
+cache_service = CacheService()
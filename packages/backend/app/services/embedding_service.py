@@ -0,0 +1,123 @@
+"""Text embedding backends for semantic search."""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Optional, Protocol
+
+import numpy as np
+
+from app.core.config import settings
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+class Embedder(Protocol):
+    """Turns texts into L2-normalised float32 vectors of a fixed dimension."""
+
+    dim: int
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into an array of shape (len(texts), dim)."""
+
+
+@lru_cache(maxsize=200_000)
+def _hash_feature(feature: str, dim: int) -> tuple[int, float]:
+    """Map a feature to a bucket and a sign."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dim, 1.0 if value >> 63 else -1.0
+
+
+class HashingEmbedder:
+    """
+    Deterministic feature-hashing embedder.
+
+    Words and character trigrams are hashed into a signed bag of features, so
+    related word forms ("farm", "farming") land close together. It needs no
+    model or network access, which makes it suitable for tests and offline use.
+    """
+
+    def __init__(self, dim: int = 256) -> None:
+        """Create an embedder producing vectors of the given dimension."""
+        self.dim = dim
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text."""
+        buckets: list[int] = []
+        weights: list[float] = []
+
+        for token in _TOKEN_RE.findall(text.lower()):
+            bucket, sign = _hash_feature(f"w:{token}", self.dim)
+            buckets.append(bucket)
+            weights.append(sign)
+
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                bucket, sign = _hash_feature(f"c:{padded[i : i + 3]}", self.dim)
+                buckets.append(bucket)
+                weights.append(0.5 * sign)
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if buckets:
+            np.add.at(vector, buckets, weights)
+            vector = np.sign(vector) * np.log1p(np.abs(vector))
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+        return vector
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into an array of shape (len(texts), dim)."""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([self.embed_one(text) for text in texts])
+
+
+class OpenAIEmbedder:
+    """Embedder backed by the OpenAI embeddings API."""
+
+    # Keeps requests inside the embedding model's input limit.
+    max_chars = 24000
+
+    def __init__(self, model: str, dim: int) -> None:
+        """Create an embedder for the given model and output dimension."""
+        self.model = model
+        self.dim = dim
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into an array of shape (len(texts), dim)."""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        from app.services.openai_service import openai_service
+
+        response = await openai_service.client.embeddings.create(
+            model=self.model,
+            input=[text[: self.max_chars] for text in texts],
+            dimensions=self.dim,
+        )
+        vectors = np.array([item.embedding for item in response.data], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        normalised: np.ndarray = vectors / np.maximum(norms, 1e-12)
+        return normalised
+
+
+def get_embedder(backend: Optional[str] = None) -> Embedder:
+    """Create the embedder selected by EMBEDDING_BACKEND."""
+    backend = backend or settings.EMBEDDING_BACKEND
+    if backend == "hashing":
+        return HashingEmbedder(settings.EMBEDDING_DIM)
+    if backend == "openai":
+        return OpenAIEmbedder(settings.EMBEDDING_MODEL, settings.EMBEDDING_DIM)
+    raise ValueError(f"Unknown embedding backend: {backend}")
+
+
+def encode_embedding(vector: np.ndarray) -> bytes:
+    """Serialise a vector as float16 bytes for storage."""
+    return np.asarray(vector, dtype=np.float16).tobytes()
+
+
+def decode_embedding(data: bytes) -> np.ndarray:
+    """Deserialise float16 bytes written by encode_embedding."""
+    return np.frombuffer(data, dtype=np.float16)
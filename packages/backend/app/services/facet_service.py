@@ -0,0 +1,293 @@
+"""In-process bitmap index of facet values, per elder."""
+
+import time
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.memory import Memory
+from app.services.cache_service import ElderIndexCache
+
+# Memory columns indexed as facets.
+FACET_FIELDS = ("category", "era", "decade", "emotional_tone")
+
+# Rough CPython cost of tracking one memory outside the bitsets.
+MEMORY_BYTES = 200
+
+# Bitmap filter: a field and the values of which a memory must have one.
+FieldValues = tuple[str, Sequence[str]]
+
+# Number of set bits in each 16-bit value; bitsets are sized in whole words so
+# they can be counted two bytes per lookup.
+_POPCOUNT = np.array([bin(word).count("1") for word in range(1 << 16)], dtype=np.uint8)
+WORD_BYTES = 8
+
+
+def popcount(bits: np.ndarray) -> int:
+    """Count the set bits of a packed bitset."""
+    return int(_POPCOUNT[bits.view(np.uint16)].sum(dtype=np.int64))
+
+
+def _set_bit(bits: np.ndarray, slot: int) -> None:
+    bits[slot >> 3] |= 0x80 >> (slot & 7)
+
+
+def _clear_bit(bits: np.ndarray, slot: int) -> None:
+    bits[slot >> 3] &= 0xFF ^ (0x80 >> (slot & 7))
+
+
+# Matrix row holding the bitset of live memories.
+LIVE_ROW = 0
+
+
+class FacetBitmap:
+    """
+    Packed bitsets over one elder's memories, one per facet value.
+
+    Each memory owns a bit position (slot), reused after it is removed, and
+    each facet value a row of one bit matrix, whose first row marks the
+    slots in use. Filters OR and AND rows into a mask, and all facet counts
+    come from a single AND of the matrix with the mask plus a popcount per
+    row, so both cost a few vectorised passes over (values x memories / 8)
+    bytes.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Create an empty bitmap with room for capacity memories."""
+        words = max(1, -(-capacity // (8 * WORD_BYTES)))
+        size = words * WORD_BYTES
+        self.matrix = np.zeros((8, size), dtype=np.uint8)
+        self.slot_ids = np.zeros(size * 8, dtype=np.int64)
+        self.loaded_at = time.monotonic()
+        self._rows: dict[tuple[str, str], int] = {}
+        self._free_rows = list(range(len(self.matrix) - 1, LIVE_ROW, -1))
+        # Slot and facet values (in FACET_FIELDS order) of each memory.
+        self._memories: dict[int, tuple[int, tuple[Optional[str], ...]]] = {}
+        self._free_slots: list[int] = []
+
+    def __len__(self) -> int:
+        """Number of memories in the bitmap."""
+        return len(self._memories)
+
+    @property
+    def live(self) -> np.ndarray:
+        """The bitset of slots holding a memory."""
+        live: np.ndarray = self.matrix[LIVE_ROW]
+        return live
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the bitmap."""
+        return (
+            self.matrix.nbytes
+            + self.slot_ids.nbytes
+            + MEMORY_BYTES * len(self._memories)
+        )
+
+    def bitset(self, field: str, value: str) -> Optional[np.ndarray]:
+        """The bitset of memories having a value, if any memory has it."""
+        row = self._rows.get((field, value))
+        return self.matrix[row] if row is not None else None
+
+    def _grow_slots(self) -> None:
+        self.matrix = np.concatenate([self.matrix, np.zeros_like(self.matrix)], axis=1)
+        self.slot_ids = np.concatenate([self.slot_ids, np.zeros_like(self.slot_ids)])
+
+    def _add_row(self, key: tuple[str, str]) -> int:
+        if not self._free_rows:
+            used = len(self.matrix)
+            self.matrix = np.concatenate([self.matrix, np.zeros_like(self.matrix)])
+            self._free_rows.extend(range(len(self.matrix) - 1, used - 1, -1))
+        row = self._rows[key] = self._free_rows.pop()
+        return row
+
+    def set_memory(self, memory_id: int, values: Sequence[Optional[str]]) -> None:
+        """Set a memory's facet values, given in FACET_FIELDS order."""
+        new = tuple(values)
+        entry = self._memories.get(memory_id)
+        if entry is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                # Every slot handed out so far is either in use or free.
+                slot = len(self._memories)
+                if slot >= len(self.slot_ids):
+                    self._grow_slots()
+            self.slot_ids[slot] = memory_id
+            _set_bit(self.live, slot)
+            old: tuple[Optional[str], ...] = (None,) * len(FACET_FIELDS)
+        else:
+            slot, old = entry
+
+        for field, before, after in zip(FACET_FIELDS, old, new):
+            if before == after:
+                continue
+            if before is not None:
+                self._unset(field, before, slot)
+            if after is not None:
+                row = self._rows.get((field, after))
+                if row is None:
+                    row = self._add_row((field, after))
+                _set_bit(self.matrix[row], slot)
+        self._memories[memory_id] = (slot, new)
+
+    def remove_memory(self, memory_id: int) -> None:
+        """Drop a memory and free its slot."""
+        entry = self._memories.pop(memory_id, None)
+        if entry is None:
+            return
+        slot, values = entry
+        for field, value in zip(FACET_FIELDS, values):
+            if value is not None:
+                self._unset(field, value, slot)
+        _clear_bit(self.live, slot)
+        self._free_slots.append(slot)
+
+    def _unset(self, field: str, value: str, slot: int) -> None:
+        row = self._rows[(field, value)]
+        _clear_bit(self.matrix[row], slot)
+        if not self.matrix[row].any():
+            del self._rows[(field, value)]
+            self._free_rows.append(row)
+
+    def select(
+        self,
+        include: Iterable[FieldValues] = (),
+        exclude: Iterable[FieldValues] = (),
+    ) -> np.ndarray:
+        """
+        Bitset of the memories that pass every filter.
+
+        Each include filter keeps memories having any of its values; each
+        exclude filter drops memories having any of its values.
+        """
+        mask = self.live.copy()
+        union = np.empty_like(mask)
+        for field, values in include:
+            union.fill(0)
+            for value in values:
+                bits = self.bitset(field, value)
+                if bits is not None:
+                    np.bitwise_or(union, bits, out=union)
+            np.bitwise_and(mask, union, out=mask)
+        for field, values in exclude:
+            for value in values:
+                bits = self.bitset(field, value)
+                if bits is not None:
+                    np.bitwise_and(mask, ~bits, out=mask)
+        return mask
+
+    def counts(self, mask: np.ndarray) -> dict[str, dict[str, int]]:
+        """Count the memories in mask per facet value, skipping zeros."""
+        hits = np.bitwise_and(self.matrix, mask)
+        totals = _POPCOUNT[hits.view(np.uint16)].sum(axis=1, dtype=np.int64)
+
+        counts: dict[str, dict[str, int]] = {field: {} for field in FACET_FIELDS}
+        for (field, value), row in self._rows.items():
+            if totals[row]:
+                counts[field][value] = int(totals[row])
+        return counts
+
+    def memory_ids(self, mask: np.ndarray) -> np.ndarray:
+        """IDs of the memories in mask."""
+        slots = np.flatnonzero(np.unpackbits(mask))
+        ids: np.ndarray = self.slot_ids[slots]
+        return ids
+
+
+def facet_values(memory: Memory) -> tuple[Optional[str], ...]:
+    """A memory's facet values in FACET_FIELDS order."""
+    return tuple(getattr(memory, field) for field in FACET_FIELDS)
+
+
+class FacetService:
+    """
+    Per-elder facet bitmaps, built lazily and evicted LRU by size.
+
+    A bitmap is loaded with one query the first time an elder is asked for
+    and then kept current by the memory write hooks; writes handled by other
+    processes are picked up when it expires after FACET_INDEX_TTL_SECONDS.
+    Only used when FACET_INDEX_ENABLED is set.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty cache."""
+        self._bitmaps: ElderIndexCache[FacetBitmap] = ElderIndexCache(
+            self._load,
+            max_bytes=lambda: settings.FACET_INDEX_MAX_BYTES,
+            ttl=lambda: settings.FACET_INDEX_TTL_SECONDS,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the bitmap fast path is switched on."""
+        return settings.FACET_INDEX_ENABLED
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by all cached bitmaps."""
+        return self._bitmaps.nbytes
+
+    async def get_bitmap(self, db: AsyncSession, elder_id: int) -> FacetBitmap:
+        """Return an elder's bitmap, loading it if needed."""
+        return await self._bitmaps.get(db, elder_id)
+
+    async def _load(self, db: AsyncSession, elder_id: int) -> FacetBitmap:
+        result = await db.execute(
+            select(
+                Memory.id,
+                *(getattr(Memory, field) for field in FACET_FIELDS),
+            ).where(Memory.elder_id == elder_id, Memory.deleted_at.is_(None))
+        )
+        rows = result.all()
+        bitmap = FacetBitmap(capacity=len(rows))
+        for memory_id, *values in rows:
+            bitmap.set_memory(memory_id, values)
+        return bitmap
+
+    async def count(
+        self,
+        db: AsyncSession,
+        elder_id: int,
+        include: Iterable[FieldValues] = (),
+        exclude: Iterable[FieldValues] = (),
+    ) -> int:
+        """Count an elder's memories that pass the filters."""
+        bitmap = await self.get_bitmap(db, elder_id)
+        return popcount(bitmap.select(include, exclude))
+
+    async def facets(
+        self,
+        db: AsyncSession,
+        elder_id: int,
+        include: Iterable[FieldValues] = (),
+        exclude: Iterable[FieldValues] = (),
+    ) -> tuple[int, dict[str, dict[str, int]]]:
+        """Count an elder's memories that pass the filters, in total and per value."""
+        bitmap = await self.get_bitmap(db, elder_id)
+        mask = bitmap.select(include, exclude)
+        return popcount(mask), bitmap.counts(mask)
+
+    def index_memory(self, memory: Memory) -> None:
+        """Reflect a committed memory in its elder's bitmap, if loaded."""
+        bitmap = self._bitmaps.peek(memory.elder_id)
+        if bitmap is None:
+            return
+        if memory.deleted_at is not None:
+            bitmap.remove_memory(memory.id)
+        else:
+            bitmap.set_memory(memory.id, facet_values(memory))
+        self._bitmaps.evict()
+
+    def remove_memory(self, memory: Memory) -> None:
+        """Drop a deleted memory from its elder's bitmap, if loaded."""
+        bitmap = self._bitmaps.peek(memory.elder_id)
+        if bitmap is not None:
+            bitmap.remove_memory(memory.id)
+
+
+facet_service = FacetService()
@@ -0,0 +1,83 @@
+"""Hooks that keep derived search and timeline data in step with memory writes."""
+
+import logging
+
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.elder import Elder
+from app.db.models.memory import Memory
+from app.services.cache_service import cache_service, search_cache_scope
+from app.services.facet_service import facet_service
+from app.services.percolator_service import percolator_service
+from app.services.semantic_search_service import semantic_search_service
+from app.services.suggestion_service import suggestion_service
+from app.services.timeline_service import timeline_service
+from app.services.vocabulary_service import vocabulary_service
+
+logger = logging.getLogger(__name__)
+
+
+async def invalidate_search_cache(elder_id: int) -> None:
+    """Invalidate cached searches that can include an elder's memories."""
+    await cache_service.bump(search_cache_scope(elder_id), search_cache_scope(None))
+
+
+async def bump_content_version(db: AsyncSession, elder_id: int) -> None:
+    """
+    Move an elder's content_version on, so per-elder ETags go stale.
+
+    Called after the elder's timelines are updated and committed with them,
+    so a response cached under the new version reflects both the memory and
+    the timelines, and with any change to a memory's play or share count,
+    which the elder's analytics report. Runs in a savepoint: failures are
+    logged rather than raised, since the memory itself is already saved.
+    """
+    try:
+        async with db.begin_nested():
+            # updated_at is kept, as it tracks the elder's own fields.
+            await db.execute(
+                update(Elder)
+                .where(Elder.id == elder_id)
+                .values(
+                    content_version=Elder.content_version + 1,
+                    updated_at=Elder.updated_at,
+                )
+            )
+    except SQLAlchemyError:
+        logger.exception("Failed to bump content version of elder %s", elder_id)
+
+
+async def before_memory_commit(memory: Memory) -> None:
+    """Compute data stored on the memory row before it is committed."""
+    vocabulary_service.record_committed(memory)
+    await semantic_search_service.embed_memory(memory)
+
+
+async def after_memory_commit(db: AsyncSession, memory: Memory) -> None:
+    """Propagate a created or updated memory to search indexes and timelines."""
+    semantic_search_service.index_memory(memory)
+    suggestion_service.index_memory(memory)
+    facet_service.index_memory(memory)
+    await vocabulary_service.update_memory(db, memory)
+    await timeline_service.update_memory(db, memory)
+    await bump_content_version(db, memory.elder_id)
+    await invalidate_search_cache(memory.elder_id)
+
+
+async def after_memory_create(db: AsyncSession, memory: Memory) -> None:
+    """Propagate a new memory and match it against saved searches."""
+    await after_memory_commit(db, memory)
+    await percolator_service.percolate(db, memory)
+
+
+async def after_memory_delete(db: AsyncSession, memory: Memory) -> None:
+    """Remove a soft-deleted memory from indexes and timelines."""
+    semantic_search_service.remove_memory(memory.id)
+    suggestion_service.remove_memory(memory)
+    facet_service.remove_memory(memory)
+    await vocabulary_service.remove_memory(db, memory)
+    await timeline_service.update_memory(db, memory)
+    await bump_content_version(db, memory.elder_id)
+    await invalidate_search_cache(memory.elder_id)
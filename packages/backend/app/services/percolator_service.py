@@ -0,0 +1,203 @@
+"""Matches new memories against saved searches (percolation)."""
+
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import ColumnElement, Text, and_, cast, func, select, true, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.memory import Memory
+from app.db.models.saved_search import SavedSearch, SavedSearchMatch
+from app.utils.query_parser import ParsedQuery, parse_search_query
+from app.utils.search_filters import (
+    LABEL_FIELDS,
+    SCALAR_FIELDS,
+    TEXT_SEARCH_CONFIG,
+    field_conditions,
+    text_query,
+)
+from app.utils.text import normalize_labels
+
+logger = logging.getLogger(__name__)
+
+# Key every memory carries; searches without a usable key are stored under it.
+MATCH_ALL_KEY = "*"
+
+# Qualifiers that yield exact keys, roughly most selective first.
+KEY_FIELDS = ("tag", "person", "category", "emotional_tone", "era", "decade")
+
+# Candidate searches verified per SQL statement.
+VERIFY_BATCH_SIZE = 100
+
+_EXCLUSION_RE = re.compile(r'(?<!\S)-(?:"[^"]*"?|\S+)')
+_PHRASE_RE = re.compile(r'"[^"]*"?')
+
+
+def field_keys(parsed: ParsedQuery) -> list[str]:
+    """
+    Keys from the field qualifiers of a query, if any qualifier gives them.
+
+    A matching memory must carry one of the returned keys: every required tag
+    or person (so one is enough) or any of the values of a scalar field.
+    """
+    for name in KEY_FIELDS:
+        values = parsed.include.get(name)
+        if not values:
+            continue
+        if name in LABEL_FIELDS:
+            labels = normalize_labels(values, lowercase=True) or []
+            if labels:
+                return [f"{name}:{labels[0]}"]
+        else:
+            return [f"{name}:{value}" for value in values]
+    return []
+
+
+def positive_text(text: str) -> tuple[str, bool]:
+    """
+    Split web-search text into the terms a match must draw from.
+
+    Returns the text without its exclusions and whether it uses OR. Without
+    OR, every remaining term is required; with it, a match contains at least
+    one of them, unless exclusions are OR-ed in too, in which case no term is
+    reliable and the returned text is empty.
+    """
+    positive = _EXCLUSION_RE.sub(" ", text)
+    words = _PHRASE_RE.sub(" ", text).split()
+    uses_or = any(word.lower() == "or" for word in words)
+    if uses_or and positive != text:
+        return "", True
+    return " ".join(positive.split()), uses_or
+
+
+def memory_keys(memory: Memory, lexemes: Iterable[str]) -> list[str]:
+    """Every key under which a saved search matching this memory can be stored."""
+    keys = [MATCH_ALL_KEY, *(f"t:{lexeme}" for lexeme in lexemes)]
+    for name, column in SCALAR_FIELDS.items():
+        value = getattr(memory, column.key)
+        if value:
+            keys.append(f"{name}:{value}")
+    keys.extend(f"tag:{tag}" for tag in memory.tags or [])
+    keys.extend(f"person:{person.lower()}" for person in memory.people_mentioned or [])
+    return keys
+
+
+def search_conditions(parsed: ParsedQuery) -> list[ColumnElement[bool]]:
+    """Predicates a memory must satisfy to match a saved query."""
+    conditions = field_conditions(parsed)
+    if parsed.text:
+        conditions.insert(0, Memory.search_vector.op("@@")(text_query(parsed.text)))
+    return conditions
+
+
+class PercolatorService:
+    """
+    Matches each new memory against the saved searches of its elder.
+
+    Saved searches are inverted rather than re-run: each one stores a few
+    match keys (a required tag, a category value, a stemmed term, ...) that any
+    memory it matches must also carry, and a GIN index on those keys serves as
+    the reverse index. A new memory derives its own keys from its fields and
+    tsvector, probes the index with them, and only the candidates found are
+    verified, all in one statement evaluated against that memory's row. The
+    work thus grows with the size of the memory, not the number of searches.
+    """
+
+    async def match_keys(self, db: AsyncSession, query: str) -> list[str]:
+        """Derive the match keys stored for a saved query."""
+        parsed = parse_search_query(query)
+        keys = field_keys(parsed)
+        if keys:
+            return keys
+
+        text, uses_or = positive_text(parsed.text)
+        if text:
+            result = await db.execute(
+                select(
+                    func.tsvector_to_array(func.to_tsvector(TEXT_SEARCH_CONFIG, text))
+                )
+            )
+            lexemes: list[str] = result.scalar_one() or []
+            if lexemes:
+                # Without OR every term is required, so the longest (likely
+                # rarest) one alone keeps the candidate lists short.
+                chosen = lexemes if uses_or else [max(lexemes, key=len)]
+                return [f"t:{lexeme}" for lexeme in chosen]
+
+        return [MATCH_ALL_KEY]
+
+    async def percolate(self, db: AsyncSession, memory: Memory) -> list[int]:
+        """
+        Record which saved searches a newly created memory matches.
+
+        Runs after the memory is committed, inside a savepoint: failures are
+        logged rather than raised, since the memory itself is already saved.
+        """
+        try:
+            async with db.begin_nested():
+                matched = await self._match(db, memory)
+                if matched:
+                    await db.execute(
+                        insert(SavedSearchMatch)
+                        .values(
+                            [
+                                {"saved_search_id": search_id, "memory_id": memory.id}
+                                for search_id in matched
+                            ]
+                        )
+                        .on_conflict_do_nothing()
+                    )
+                    await db.execute(
+                        update(SavedSearch)
+                        .where(SavedSearch.id.in_(matched))
+                        .values(last_matched_at=func.now())
+                    )
+        except SQLAlchemyError:
+            logger.exception("Failed to match memory %s to saved searches", memory.id)
+            return []
+        await db.commit()
+        return matched
+
+    async def _match(self, db: AsyncSession, memory: Memory) -> list[int]:
+        result = await db.execute(
+            select(func.tsvector_to_array(Memory.search_vector)).where(
+                Memory.id == memory.id
+            )
+        )
+        keys = memory_keys(memory, result.scalar_one_or_none() or [])
+
+        result = await db.execute(
+            select(SavedSearch.id, SavedSearch.query).where(
+                SavedSearch.elder_id == memory.elder_id,
+                SavedSearch.deleted_at.is_(None),
+                SavedSearch.match_keys.has_any(cast(keys, ARRAY(Text))),
+            )
+        )
+        candidates = list(result.all())
+
+        matched: list[int] = []
+        for start in range(0, len(candidates), VERIFY_BATCH_SIZE):
+            batch = candidates[start : start + VERIFY_BATCH_SIZE]
+            checks: list[ColumnElement[Any]] = [
+                and_(true(), *search_conditions(parse_search_query(query)))
+                for _, query in batch
+            ]
+            row = (
+                await db.execute(
+                    select(*checks).where(
+                        Memory.id == memory.id, Memory.deleted_at.is_(None)
+                    )
+                )
+            ).one_or_none()
+            if row is not None:
+                matched.extend(
+                    search_id for (search_id, _), hit in zip(batch, row) if hit
+                )
+        return matched
+
+
+percolator_service = PercolatorService()
@@ -0,0 +1,880 @@
+"""Memory search: lexical, hybrid and family-scoped queries, facets and caching."""
+
+import asyncio
+import json
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
+
+from sqlalchemy import REAL, ColumnElement, Select, and_, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.core.config import settings
+from app.db.models.family_member import FamilyMember
+from app.db.models.memory import Memory
+from app.db.session import AsyncSessionLocal
+from app.schemas.search_schema import SEARCH_FILTER_FIELDS, SearchSpec
+from app.services.cache_service import cache_service, search_cache_scope
+from app.services.facet_service import FACET_FIELDS, FieldValues, facet_service
+from app.services.semantic_search_service import semantic_search_service
+from app.services.vocabulary_service import vocabulary_service
+from app.utils.pagination import count_total, fetch_page, page_count
+from app.utils.query_parser import ParsedQuery, parse_search_query, replace_text_terms
+from app.utils.ranking import reciprocal_rank_fusion
+from app.utils.search_filters import (
+    TEXT_SEARCH_CONFIG,
+    field_conditions,
+    filter_conditions,
+    text_query,
+)
+
+# Semantic search over-fetches from the vector index when SQL filters apply.
+SEMANTIC_OVERSAMPLE = 4
+SEMANTIC_MAX_CANDIDATES = 5000
+
+# Candidates taken from each retriever before fusion in hybrid mode.
+HYBRID_CANDIDATES = 200
+
+FACET_COLUMNS = {
+    "categories": Memory.category,
+    "eras": Memory.era,
+    "decades": Memory.decade,
+    "emotional_tones": Memory.emotional_tone,
+}
+
+# Columns needed to serialize a search result.
+SEARCH_RESULT_COLUMNS = (
+    Memory.id,
+    Memory.elder_id,
+    Memory.title,
+    Memory.summary,
+    Memory.category,
+    Memory.era,
+    Memory.decade,
+    Memory.emotional_tone,
+    Memory.location,
+    Memory.date_of_event,
+    Memory.created_at,
+)
+
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, "
+    'MaxWords=30, MinWords=12, FragmentDelimiter=" … "'
+)
+
+# Rows fetched per round trip when streaming search results.
+STREAM_BATCH_SIZE = 500
+
+_T = TypeVar("_T")
+
+# Vector hits of a search: (memory ID, similarity), most similar first.
+SemanticHits = list[tuple[int, float]]
+
+
+def family_elders(user_id: int) -> Select[tuple[int]]:
+    """Elders a user may search, through family memberships with access."""
+    return select(FamilyMember.elder_id).where(
+        FamilyMember.user_id == user_id,
+        FamilyMember.deleted_at.is_(None),
+        FamilyMember.access_level.in_(settings.search_family_access_levels_list),
+    )
+
+
+@dataclass
+class CompiledSearch:
+    """SQL building blocks of a search spec."""
+
+    parsed: ParsedQuery
+    # None when the query consists of field qualifiers only.
+    ts_query: Optional[ColumnElement[Any]]
+    rank: ColumnElement[Any]
+    # Filter parameters and field qualifiers; the text match is kept apart so
+    # hybrid search can apply the filters to semantic hits as well.
+    filters: list[ColumnElement[bool]]
+    semantic_text: str
+    # Elders a family-scoped search is restricted to.
+    family_elders: Optional[Select[tuple[int]]] = None
+
+    @property
+    def lexical_conditions(self) -> list[ColumnElement[bool]]:
+        """Conditions for full-text matches that pass the filters."""
+        if self.ts_query is None:
+            return self.filters
+        return [Memory.search_vector.op("@@")(self.ts_query), *self.filters]
+
+    def highlight(self, spec: SearchSpec) -> bool:
+        """Whether to return headlines; there are none without query text."""
+        return spec.highlight and self.ts_query is not None
+
+    def headline(self) -> ColumnElement[Any]:
+        """Headline column for the text match; only valid when highlighting."""
+        assert self.ts_query is not None
+        return _headline(self.ts_query)
+
+
+def compile_search(spec: SearchSpec, user_id: Optional[int] = None) -> CompiledSearch:
+    """
+    Parse the query text and build the text match, rank and filters.
+
+    Field qualifiers in the query (category:travel, -tag:war) become column
+    predicates that can use their indexes; the rest is matched as web-search
+    text. A query of qualifiers only skips the text match and ranks all hits
+    equally, so they come back newest first. A family-scoped search (user_id
+    set) gets an `elder_id IN (user's elders)` filter, which Postgres runs as
+    a semi-join against the family_members index.
+    """
+    parsed = parse_search_query(spec.q)
+    filters = filter_conditions(**spec.model_dump(include=set(SEARCH_FILTER_FIELDS)))
+    filters.extend(field_conditions(parsed))
+
+    elders = None
+    if spec.scope == "family" and user_id is not None:
+        elders = family_elders(user_id)
+        filters.insert(0, Memory.elder_id.in_(elders))
+
+    ts_query: Optional[ColumnElement[Any]] = None
+    rank: ColumnElement[Any]
+    if parsed.text:
+        ts_query = text_query(parsed.text)
+        rank = func.ts_rank_cd(Memory.search_vector, ts_query, type_=REAL)
+    else:
+        rank = literal(0.0, REAL)
+
+    return CompiledSearch(
+        parsed=parsed,
+        ts_query=ts_query,
+        rank=rank.label("rank"),
+        filters=filters,
+        semantic_text=parsed.text or spec.q,
+        family_elders=elders,
+    )
+
+
+def stream_query(
+    spec: SearchSpec, user_id: Optional[int] = None
+) -> tuple[Select[Any], bool]:
+    """
+    Build the query of a streamed search and whether it returns headlines.
+
+    Called before the response starts, so invalid filters are answered with
+    an error status rather than a truncated stream.
+    """
+    compiled = compile_search(spec, user_id)
+    query = (
+        select(Memory, compiled.rank)
+        .options(load_only(*SEARCH_RESULT_COLUMNS))
+        .where(Memory.deleted_at.is_(None), *compiled.lexical_conditions)
+        .order_by(compiled.rank.desc(), Memory.id.desc())
+    )
+    highlight = compiled.highlight(spec)
+    if highlight:
+        query = query.add_columns(compiled.headline())
+    return query, highlight
+
+
+async def _stream_rows(query: Select[Any], highlight: bool) -> AsyncIterator[bytes]:
+    """
+    Yield every match of a stream query as an NDJSON line, best first.
+
+    Uses its own session: the request's session is closed once the endpoint
+    returns, before the response body is streamed.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for row in result:
+            item = {
+                **serialize_memory(row[0]),
+                "rank": row[1],
+                **(_highlighted(row[2]) if highlight else {}),
+            }
+            yield json.dumps(item).encode("utf-8") + b"\n"
+
+
+def _semantic_candidates(
+    spec: SearchSpec, conditions: list[ColumnElement[bool]]
+) -> int:
+    """How many vector hits a hybrid search asks the index for."""
+    # Elder filters are applied by the index itself; others need headroom.
+    scoped = spec.elder_id is not None or spec.scope == "family"
+    filtered = len(conditions) > scoped
+    return HYBRID_CANDIDATES * (SEMANTIC_OVERSAMPLE if filtered else 1)
+
+
+async def _family_elder_ids(
+    db: AsyncSession, compiled: CompiledSearch
+) -> Optional[list[int]]:
+    """Elder IDs of a family-scoped search, for the vector index; else None."""
+    if compiled.family_elders is None:
+        return None
+    result = await db.execute(compiled.family_elders)
+    return list(result.scalars().all())
+
+
+async def _search_cache_key(spec: SearchSpec, include_facets: bool) -> Optional[str]:
+    """Cache key of a search response, or None when caching is disabled."""
+    if not settings.SEARCH_CACHE_ENABLED or spec.scope == "family":
+        return None
+    params = spec.model_dump()
+    params["q"] = " ".join(spec.q.split())
+    params["facets"] = include_facets
+    return await cache_service.key("search", search_cache_scope(spec.elder_id), params)
+
+
+async def _cached_search(
+    cache_key: Optional[str], spec: SearchSpec
+) -> Optional[dict[str, Any]]:
+    """Return a cached search response, echoing this request's query text."""
+    if cache_key is None:
+        return None
+    cached = await cache_service.get_json(cache_key)
+    if cached is not None:
+        cached["query"] = spec.q
+    return cached  # type: ignore[no-any-return]
+
+
+async def _cached_searches(
+    specs: Sequence[SearchSpec],
+) -> tuple[dict[int, dict[str, Any]], list[Optional[str]]]:
+    """Cached responses of a batch of searches, by index, and their cache keys."""
+    responses: dict[int, dict[str, Any]] = {}
+    cache_keys: list[Optional[str]] = []
+    for i, spec in enumerate(specs):
+        cache_key = await _search_cache_key(spec, include_facets=False)
+        cache_keys.append(cache_key)
+        cached = await _cached_search(cache_key, spec)
+        if cached is not None:
+            responses[i] = cached
+    return responses, cache_keys
+
+
+async def _store_search(cache_key: Optional[str], response: dict[str, Any]) -> None:
+    """Cache a search response."""
+    if cache_key is not None:
+        await cache_service.set_json(
+            cache_key, response, settings.SEARCH_CACHE_TTL_SECONDS
+        )
+
+
+async def _timed(timings: dict[str, float], name: str, coro: Awaitable[_T]) -> _T:
+    """Await coro, recording its duration in timings as `<name>_ms`."""
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[f"{name}_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def _headline(ts_query: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Snippets of a memory's text around the terms matched by ts_query."""
+    return func.ts_headline(
+        TEXT_SEARCH_CONFIG,
+        func.coalesce(Memory.transcription, Memory.summary, Memory.title),
+        ts_query,
+        HEADLINE_OPTIONS,
+    ).label("headline")
+
+
+def _highlighted(headline: Optional[str]) -> dict[str, Any]:
+    """Result fields that replace the summary when highlighting."""
+    return {"summary": None, "headline": headline}
+
+
+def serialize_memory(memory: Memory) -> dict[str, Any]:
+    """Serialize a memory for search results."""
+    return {
+        "id": memory.id,
+        "elder_id": memory.elder_id,
+        "title": memory.title,
+        "summary": memory.summary,
+        "category": memory.category,
+        "era": memory.era,
+        "decade": memory.decade,
+        "emotional_tone": memory.emotional_tone,
+        "location": memory.location,
+        "date_of_event": (
+            memory.date_of_event.isoformat() if memory.date_of_event else None
+        ),
+        "created_at": memory.created_at.isoformat(),
+    }
+
+
+def _count_facets(memories: list[Memory]) -> dict[str, Any]:
+    """Count facets over already loaded memories."""
+    counts: dict[str, Counter[Any]] = {}
+    for column in FACET_COLUMNS.values():
+        counts[column.key] = Counter(getattr(memory, column.key) for memory in memories)
+        counts[column.key].pop(None, None)
+    return _facet_lists(counts)
+
+
+def _facet_lists(counts: Mapping[str, Mapping[Any, int]]) -> dict[str, Any]:
+    """Shape per-column value counts as facets, most common values first."""
+    facets: dict[str, list[dict[str, Any]]] = {}
+    for key, column in FACET_COLUMNS.items():
+        facets[key] = [
+            {"value": value, "count": count}
+            for value, count in Counter(counts.get(column.key, {})).most_common()
+        ]
+
+    facets["decades"].sort(key=lambda item: str(item["value"]))
+
+    return facets
+
+
+def _facets_key(spec: SearchSpec) -> str:
+    """Key of a search's facets in a batch response."""
+    if spec.scope == "family":
+        return "family"
+    return str(spec.elder_id) if spec.elder_id is not None else "all"
+
+
+class SearchService:
+    """
+    Runs memory searches and builds their responses.
+
+    Lexical searches rank full-text matches in Postgres; hybrid searches fuse
+    them with hits from the vector index. Responses are cached per elder
+    through the cache service, except for family-scoped searches.
+    """
+
+    async def search(
+        self, db: AsyncSession, spec: SearchSpec, user_id: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Run a search with facets, answering from the cache when possible."""
+        cache_key = await _search_cache_key(spec, include_facets=True)
+        cached = await _cached_search(cache_key, spec)
+        if cached is not None:
+            return cached
+
+        response = await self._execute(db, spec, include_facets=True, user_id=user_id)
+        await _store_search(cache_key, response)
+        return response
+
+    async def search_batch(
+        self,
+        db: AsyncSession,
+        specs: Sequence[SearchSpec],
+        user_ids: Sequence[Optional[int]],
+    ) -> dict[str, Any]:
+        """
+        Run several searches, sharing facets between searches of an elder.
+
+        SQL runs one statement at a time on the session, but the vector
+        lookups of hybrid searches are started up front and overlap it.
+        Searches already in the cache do not touch the database.
+        """
+        responses, cache_keys = await _cached_searches(specs)
+        misses = [i for i in range(len(specs)) if i not in responses]
+        semantic = await self._start_semantic(db, specs, user_ids, misses)
+        try:
+            for i in misses:
+                responses[i] = await self._execute(
+                    db,
+                    specs[i],
+                    include_facets=False,
+                    semantic=semantic.get(i),
+                    user_id=user_ids[i],
+                )
+                await _store_search(cache_keys[i], responses[i])
+        finally:
+            for task in semantic.values():
+                task.cancel()
+
+        facets: dict[str, Any] = {}
+        results: list[dict[str, Any]] = []
+        for i, spec in enumerate(specs):
+            facets_key = _facets_key(spec)
+            if facets_key not in facets:
+                user_id = user_ids[i]
+                facets[facets_key] = await self.elder_facets(
+                    db,
+                    spec.elder_id,
+                    family_elders(user_id) if user_id is not None else None,
+                )
+            results.append({**responses[i], "facets_key": facets_key})
+
+        return {"results": results, "facets": facets}
+
+    async def _start_semantic(
+        self,
+        db: AsyncSession,
+        specs: Sequence[SearchSpec],
+        user_ids: Sequence[Optional[int]],
+        indexes: list[int],
+    ) -> dict[int, asyncio.Task[SemanticHits]]:
+        """Start the vector lookups of the hybrid searches among indexes."""
+        tasks: dict[int, asyncio.Task[SemanticHits]] = {}
+        if not any(specs[i].mode == "hybrid" for i in indexes):
+            return tasks
+
+        await semantic_search_service.refresh(db)
+        for i in indexes:
+            if specs[i].mode != "hybrid":
+                continue
+            spec, _ = await self.autocorrect(db, specs[i])
+            compiled = compile_search(spec, user_ids[i])
+            tasks[i] = asyncio.create_task(
+                semantic_search_service.nearest(
+                    compiled.semantic_text,
+                    _semantic_candidates(spec, compiled.filters),
+                    elder_id=spec.elder_id,
+                    elder_ids=await _family_elder_ids(db, compiled),
+                )
+            )
+        return tasks
+
+    async def stream(
+        self, db: AsyncSession, spec: SearchSpec, user_id: Optional[int] = None
+    ) -> tuple[AsyncIterator[bytes], Optional[str]]:
+        """
+        Every match of a lexical search as NDJSON lines, and its did_you_mean.
+
+        The query is built, and its filters validated, before this returns;
+        rows are read when the stream is iterated.
+        """
+        spec, correction = await self.autocorrect(db, spec)
+        return _stream_rows(*stream_query(spec, user_id)), correction["did_you_mean"]
+
+    async def semantic_search(
+        self,
+        db: AsyncSession,
+        q: str,
+        filters: Mapping[str, Any],
+        wanted: int,
+    ) -> list[tuple[Memory, float]]:
+        """
+        Up to `wanted` memories nearest to q that pass the filters, with scores.
+
+        Candidates come from the vector index, restricted to the elder filter
+        when one is set, and the other filters are applied in SQL. When they
+        discard candidates the index is asked for more, up to
+        SEMANTIC_MAX_CANDIDATES.
+        """
+        elder_id = filters.get("elder_id")
+        conditions = filter_conditions(**{**filters, "elder_id": None})
+        k = wanted * SEMANTIC_OVERSAMPLE if conditions else wanted
+
+        while True:
+            hits = await semantic_search_service.search(db, q, k, elder_id=elder_id)
+            scores = dict(hits)
+            result = await db.execute(
+                select(Memory).where(
+                    Memory.id.in_(scores),
+                    Memory.deleted_at.is_(None),
+                    *conditions,
+                )
+            )
+            memories = sorted(
+                result.scalars().all(),
+                key=lambda memory: (-scores[memory.id], memory.id),
+            )
+            if len(memories) >= wanted or len(hits) < k or k >= SEMANTIC_MAX_CANDIDATES:
+                break
+            k = min(k * SEMANTIC_OVERSAMPLE, SEMANTIC_MAX_CANDIDATES)
+
+        return [(memory, scores[memory.id]) for memory in memories]
+
+    async def autocorrect(
+        self, db: AsyncSession, spec: SearchSpec
+    ) -> tuple[SearchSpec, dict[str, Any]]:
+        """
+        Correct misspelled words in a search's text against its elder's vocabulary.
+
+        Returns the spec to run, rewritten when autocorrect is on, and response
+        fields reporting the corrected query as `did_you_mean`. Searches across
+        all elders are left alone, as vocabularies are kept per elder.
+        """
+        correction: dict[str, Any] = {
+            "did_you_mean": None,
+            "autocorrected": False,
+            "corrections": [],
+        }
+        if spec.elder_id is None:
+            return spec, correction
+        text = parse_search_query(spec.q).text
+        if not text:
+            return spec, correction
+
+        corrections = await vocabulary_service.corrections(db, spec.elder_id, text)
+        if not corrections:
+            return spec, correction
+
+        corrected = replace_text_terms(spec.q, corrections)
+        correction["did_you_mean"] = corrected
+        correction["corrections"] = [
+            {"term": term, "suggestion": suggestion}
+            for term, suggestion in sorted(corrections.items())
+        ]
+        if spec.autocorrect:
+            correction["autocorrected"] = True
+            spec = spec.model_copy(update={"q": corrected})
+        return spec, correction
+
+    async def _execute(
+        self,
+        db: AsyncSession,
+        spec: SearchSpec,
+        include_facets: bool,
+        semantic: Optional[Awaitable[SemanticHits]] = None,
+        user_id: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Run a search against the database and build its response."""
+        query = spec.q
+        spec, correction = await self.autocorrect(db, spec)
+        compiled = compile_search(spec, user_id)
+
+        if spec.mode == "hybrid":
+            response = await self._hybrid(db, spec, compiled, include_facets, semantic)
+        else:
+            response = await self._lexical(db, spec, compiled, include_facets)
+        response["query"] = query
+        response.update(correction)
+        response["scope"] = spec.scope
+        response["filters_applied"] = spec.model_dump(include=set(SEARCH_FILTER_FIELDS))
+        response["parsed_query"] = {
+            "text": compiled.parsed.text,
+            "include": compiled.parsed.include,
+            "exclude": compiled.parsed.exclude,
+        }
+        return response
+
+    async def _lexical(
+        self,
+        db: AsyncSession,
+        spec: SearchSpec,
+        compiled: CompiledSearch,
+        include_facets: bool,
+    ) -> dict[str, Any]:
+        """
+        Rank full-text matches and page through them by offset or cursor.
+
+        Only the columns a result needs are loaded, so transcriptions never
+        leave the database. Headlines are added to the page query alone, not
+        to the count or facets; since ts_headline is expensive and not needed
+        for ordering, Postgres evaluates it after the sort and limit, i.e. only
+        for the rows returned.
+        """
+        query = (
+            select(Memory, compiled.rank)
+            .options(load_only(*SEARCH_RESULT_COLUMNS))
+            .where(Memory.deleted_at.is_(None), *compiled.lexical_conditions)
+        )
+        highlight = compiled.highlight(spec)
+        bitmap_facets = await self._bitmap_facets(db, spec, compiled)
+
+        total = total_is_exact = None
+        if spec.cursor is None or spec.include_total:
+            if bitmap_facets is not None:
+                total, total_is_exact = bitmap_facets[0], True
+            else:
+                total, total_is_exact = await count_total(db, query, spec.total_mode)
+
+        result = await fetch_page(
+            db,
+            query.add_columns(compiled.headline()) if highlight else query,
+            (compiled.rank, Memory.id),
+            spec.page_size,
+            cursor=spec.cursor,
+            offset=(spec.page - 1) * spec.page_size,
+        )
+
+        response: dict[str, Any] = {
+            "query": spec.q,
+            "total": total,
+            "total_is_exact": total_is_exact,
+            "page": spec.page if spec.cursor is None else None,
+            "page_size": spec.page_size,
+            "total_pages": page_count(total, spec.page_size),
+            "next_cursor": result.next_cursor,
+            "prev_cursor": result.prev_cursor,
+            "results": [
+                {
+                    **serialize_memory(row[0]),
+                    "rank": row[1],
+                    **(_highlighted(row[2]) if highlight else {}),
+                }
+                for row in result.rows
+            ],
+        }
+        if include_facets:
+            if bitmap_facets is not None:
+                response["facets"] = _facet_lists(bitmap_facets[1])
+            else:
+                response["facets"] = await self._search_facets(db, query.whereclause)
+        return response
+
+    async def _bitmap_facets(
+        self, db: AsyncSession, spec: SearchSpec, compiled: CompiledSearch
+    ) -> Optional[tuple[int, dict[str, dict[str, int]]]]:
+        """
+        Count a search's matches from the facet bitmaps, when they can answer it.
+
+        That is when the bitmaps are enabled and the search is scoped to an
+        elder and filters on facet fields only, without query text. Returns
+        the number of matches and their counts per facet value.
+        """
+        if not facet_service.enabled or spec.elder_id is None:
+            return None
+        if compiled.ts_query is not None:
+            return None
+        if spec.location or spec.date_from or spec.date_to or spec.tag or spec.person:
+            return None
+        parsed = compiled.parsed
+        if not {*parsed.include, *parsed.exclude} <= set(FACET_FIELDS):
+            return None
+
+        include: list[FieldValues] = [
+            (field, [getattr(spec, field)])
+            for field in FACET_FIELDS
+            if getattr(spec, field)
+        ]
+        include.extend(parsed.include.items())
+        return await facet_service.facets(
+            db, spec.elder_id, include, list(parsed.exclude.items())
+        )
+
+    async def _hybrid(
+        self,
+        db: AsyncSession,
+        spec: SearchSpec,
+        compiled: CompiledSearch,
+        include_facets: bool,
+        semantic: Optional[Awaitable[SemanticHits]] = None,
+    ) -> dict[str, Any]:
+        """
+        Fuse the top lexical and semantic candidates with reciprocal rank fusion.
+
+        Both retrievers run concurrently: the full-text query on the session
+        and the vector lookup in a worker thread (the index is refreshed first,
+        which is normally a no-op). Each contributes up to HYBRID_CANDIDATES
+        ids, so the total counts the fused candidates rather than every match.
+        Facets are counted over the fused set, and headlines are computed for
+        the page only. A vector lookup already in flight can be passed in as
+        `semantic`.
+        """
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+
+        lexical_hits, semantic_hits, exact = await self._hybrid_candidates(
+            db, spec, compiled, semantic, timings
+        )
+        fused, memories = await _timed(
+            timings, "fusion", self._fuse(db, compiled, lexical_hits, semantic_hits)
+        )
+        results = await self._hybrid_results(
+            db, spec, compiled, fused, memories, (lexical_hits, semantic_hits)
+        )
+        timings["total_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        response: dict[str, Any] = {
+            "query": spec.q,
+            "mode": "hybrid",
+            "total": len(fused),
+            "total_is_exact": exact,
+            "page": spec.page,
+            "page_size": spec.page_size,
+            "total_pages": page_count(len(fused), spec.page_size),
+            "next_cursor": None,
+            "prev_cursor": None,
+            "results": results,
+            "timings": timings,
+        }
+        if include_facets:
+            response["facets"] = _count_facets(
+                [memories[memory_id] for memory_id, _ in fused]
+            )
+        return response
+
+    async def _hybrid_candidates(
+        self,
+        db: AsyncSession,
+        spec: SearchSpec,
+        compiled: CompiledSearch,
+        semantic: Optional[Awaitable[SemanticHits]],
+        timings: dict[str, float],
+    ) -> tuple[list[tuple[int, float]], SemanticHits, bool]:
+        """
+        Run both retrievers of a hybrid search concurrently.
+
+        Returns the lexical (id, rank) and semantic (id, similarity) hits, and
+        whether neither retriever was cut off, i.e. the fused total is exact.
+        """
+        semantic_k = _semantic_candidates(spec, compiled.filters)
+        if semantic is None:
+            await semantic_search_service.refresh(db)
+            semantic = semantic_search_service.nearest(
+                compiled.semantic_text,
+                semantic_k,
+                elder_id=spec.elder_id,
+                elder_ids=await _family_elder_ids(db, compiled),
+            )
+        lexical_hits, semantic_hits = await asyncio.gather(
+            _timed(timings, "lexical", self._lexical_candidates(db, compiled)),
+            _timed(timings, "semantic", semantic),
+        )
+        exact = (
+            len(lexical_hits) < HYBRID_CANDIDATES and len(semantic_hits) < semantic_k
+        )
+        return lexical_hits, semantic_hits, exact
+
+    async def _lexical_candidates(
+        self, db: AsyncSession, compiled: CompiledSearch
+    ) -> list[tuple[int, float]]:
+        """The top full-text matches of a hybrid search, as (id, rank)."""
+        result = await db.execute(
+            select(Memory.id, compiled.rank)
+            .where(Memory.deleted_at.is_(None), *compiled.lexical_conditions)
+            .order_by(compiled.rank.desc(), Memory.id.desc())
+            .limit(HYBRID_CANDIDATES)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def _fuse(
+        self,
+        db: AsyncSession,
+        compiled: CompiledSearch,
+        lexical_hits: list[tuple[int, float]],
+        semantic_hits: SemanticHits,
+    ) -> tuple[list[tuple[int, float]], dict[int, Memory]]:
+        """
+        Fuse both rankings and load the fused memories that pass the filters.
+
+        Returns the surviving (id, score) pairs, best first, and the memories.
+        """
+        fused = reciprocal_rank_fusion(
+            [
+                [memory_id for memory_id, _ in lexical_hits],
+                [memory_id for memory_id, _ in semantic_hits],
+            ]
+        )
+        result = await db.execute(
+            select(Memory)
+            .options(load_only(*SEARCH_RESULT_COLUMNS))
+            .where(
+                Memory.id.in_([memory_id for memory_id, _ in fused]),
+                Memory.deleted_at.is_(None),
+                *compiled.filters,
+            )
+        )
+        memories = {memory.id: memory for memory in result.scalars().all()}
+        return [hit for hit in fused if hit[0] in memories], memories
+
+    async def _hybrid_results(
+        self,
+        db: AsyncSession,
+        spec: SearchSpec,
+        compiled: CompiledSearch,
+        fused: list[tuple[int, float]],
+        memories: dict[int, Memory],
+        hits: tuple[list[tuple[int, float]], SemanticHits],
+    ) -> list[dict[str, Any]]:
+        """
+        Serialize the requested page of fused results.
+
+        Each result reports its fused score and, where it was retrieved by
+        them, its lexical rank and semantic similarity. Headlines are computed
+        for the page only.
+        """
+        offset = (spec.page - 1) * spec.page_size
+        page_hits = fused[offset : offset + spec.page_size]
+        lexical_ranks, similarities = dict(hits[0]), dict(hits[1])
+
+        highlight = compiled.highlight(spec)
+        headlines: dict[int, Optional[str]] = {}
+        if highlight and page_hits:
+            result = await db.execute(
+                select(Memory.id, compiled.headline()).where(
+                    Memory.id.in_([memory_id for memory_id, _ in page_hits])
+                )
+            )
+            headlines = {row[0]: row[1] for row in result.all()}
+
+        return [
+            {
+                **serialize_memory(memories[memory_id]),
+                "score": score,
+                "rank": lexical_ranks.get(memory_id),
+                "similarity": similarities.get(memory_id),
+                **(_highlighted(headlines.get(memory_id)) if highlight else {}),
+            }
+            for memory_id, score in page_hits
+        ]
+
+    async def elder_facets(
+        self,
+        db: AsyncSession,
+        elder_id: Optional[int],
+        elders: Optional[Select[tuple[int]]] = None,
+    ) -> dict[str, Any]:
+        """
+        Facets over all of an elder's memories (or all memories), cached.
+
+        With elders, over the memories of those elders instead, uncached.
+        """
+        if elders is not None:
+            return await self._search_facets(
+                db, and_(Memory.deleted_at.is_(None), Memory.elder_id.in_(elders))
+            )
+
+        if elder_id is not None and facet_service.enabled:
+            _, counts = await facet_service.facets(db, elder_id)
+            return _facet_lists(counts)
+
+        cache_key = None
+        if settings.SEARCH_CACHE_ENABLED:
+            cache_key = await cache_service.key(
+                "search-facets", search_cache_scope(elder_id), {}
+            )
+            cached = await cache_service.get_json(cache_key)
+            if cached is not None:
+                return cached  # type: ignore[no-any-return]
+
+        criteria: ColumnElement[bool] = Memory.deleted_at.is_(None)
+        if elder_id is not None:
+            criteria = and_(criteria, Memory.elder_id == elder_id)
+        facets = await self._search_facets(db, criteria)
+
+        if cache_key is not None:
+            await cache_service.set_json(
+                cache_key, facets, settings.SEARCH_CACHE_TTL_SECONDS
+            )
+        return facets
+
+    async def _search_facets(
+        self, db: AsyncSession, criteria: Optional[ColumnElement[bool]]
+    ) -> dict[str, Any]:
+        """
+        Get facets for search filtering.
+
+        All four facets are counted in one pass over the filtered result set
+        with GROUPING SETS. Each output row belongs to exactly one grouping
+        set, so the single non-null facet column tells which facet the count is
+        for; rows where every facet column is null are the "value missing"
+        groups and are skipped.
+        """
+        facet_columns = tuple(FACET_COLUMNS.values())
+        facet_query = select(*facet_columns, func.count().label("count")).group_by(
+            func.grouping_sets(*facet_columns)
+        )
+        if criteria is not None:
+            facet_query = facet_query.where(criteria)
+
+        result = await db.execute(facet_query)
+
+        facets: dict[str, list[dict[str, Any]]] = {key: [] for key in FACET_COLUMNS}
+        facet_keys = list(facets)
+        for row in result.fetchall():
+            for key, value in zip(facet_keys, row[:-1]):
+                if value is not None:
+                    facets[key].append({"value": value, "count": row[-1]})
+                    break
+
+        facets["decades"].sort(key=lambda item: str(item["value"]))
+
+        return facets
+
+
+search_service = SearchService()
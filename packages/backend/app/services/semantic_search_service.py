@@ -0,0 +1,230 @@
+"""Semantic (embedding) search over memories."""
+
+import asyncio
+import time
+from collections.abc import Collection
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.memory import Memory
+from app.services.embedding_service import (
+    decode_embedding,
+    encode_embedding,
+    get_embedder,
+)
+from app.services.vector_index import VectorIndex
+
+TEXT_FIELDS = ("title", "summary", "transcription")
+
+# Rows whose transaction started before a sync but committed after it carry an
+# older updated_at, so each sync re-reads a short window behind the last one.
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+def memory_text(memory: Memory) -> str:
+    """Text that represents a memory for embedding."""
+    parts = [getattr(memory, field) for field in TEXT_FIELDS]
+    return "\n".join(part for part in parts if part)
+
+
+class SemanticSearchService:
+    """
+    Embeds memories and answers nearest-neighbour queries over them.
+
+    Embeddings are stored on the memory row as float16 bytes, and the vector
+    index is a derived, memory-mapped copy of them. Each process loads the last
+    published build, then catches up on rows changed since (by updated_at) at
+    most every VECTOR_INDEX_REFRESH_SECONDS, so writes from other workers
+    become searchable without a rebuild.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the embedder and an empty index."""
+        self.embedder = get_embedder()
+        self.index = VectorIndex(Path(settings.VECTOR_INDEX_PATH), self.embedder.dim)
+        self._loaded = False
+        self._synced_at: Optional[datetime] = None
+        self._next_refresh = 0.0
+        self._refresh_lock = asyncio.Lock()
+
+    async def embed_memory(self, memory: Memory) -> None:
+        """Compute the embedding of a new memory or one whose text changed."""
+        state = inspect(memory)
+        if state.persistent and not any(
+            state.attrs[field].history.has_changes() for field in TEXT_FIELDS
+        ):
+            return
+
+        text = memory_text(memory)
+        if not text:
+            memory.embedding = None
+            return
+
+        vectors = await self.embedder.embed([text])
+        memory.embedding = encode_embedding(vectors[0])
+
+    def index_memory(self, memory: Memory) -> None:
+        """Reflect a committed memory in this process's index."""
+        vector = (
+            self._vector(memory.embedding) if memory.embedding is not None else None
+        )
+        if memory.deleted_at is not None or vector is None:
+            self.index.remove(memory.id)
+            return
+        self.index.upsert(memory.id, memory.elder_id, vector)
+
+    def remove_memory(self, memory_id: int) -> None:
+        """Drop a memory from this process's index."""
+        self.index.remove(memory_id)
+
+    def _vector(self, data: bytes) -> Optional[np.ndarray]:
+        vector = decode_embedding(data)
+        return vector if len(vector) == self.embedder.dim else None
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> None:
+        """Load the published build and apply rows changed since the last sync."""
+        if not force and time.monotonic() < self._next_refresh:
+            return
+
+        async with self._refresh_lock:
+            if not force and time.monotonic() < self._next_refresh:
+                return
+
+            if not self._loaded:
+                await asyncio.to_thread(self.index.load)
+                self._synced_at = self.index.built_at
+                self._loaded = True
+
+            query = select(
+                Memory.id,
+                Memory.elder_id,
+                Memory.embedding,
+                Memory.deleted_at,
+                Memory.updated_at,
+            )
+            if self._synced_at is not None:
+                query = query.where(Memory.updated_at > self._synced_at - SYNC_OVERLAP)
+            else:
+                query = query.where(Memory.deleted_at.is_(None))
+
+            synced_at = self._synced_at
+            result = await db.stream(query.execution_options(yield_per=1000))
+            async for memory_id, elder_id, embedding, deleted_at, updated_at in result:
+                vector = self._vector(embedding) if embedding is not None else None
+                if deleted_at is not None or vector is None:
+                    self.index.remove(memory_id)
+                else:
+                    self.index.upsert(memory_id, elder_id, vector)
+                if synced_at is None or updated_at > synced_at:
+                    synced_at = updated_at
+
+            self._synced_at = synced_at
+            self._next_refresh = (
+                time.monotonic() + settings.VECTOR_INDEX_REFRESH_SECONDS
+            )
+
+    async def search(
+        self,
+        db: AsyncSession,
+        text: str,
+        k: int,
+        elder_id: Optional[int] = None,
+    ) -> list[tuple[int, float]]:
+        """Return up to k (memory_id, score) pairs most similar to text."""
+        await self.refresh(db)
+        return await self.nearest(text, k, elder_id)
+
+    async def nearest(
+        self,
+        text: str,
+        k: int,
+        elder_id: Optional[int] = None,
+        elder_ids: Optional[Collection[int]] = None,
+    ) -> list[tuple[int, float]]:
+        """Query the index as last refreshed, without touching the database."""
+        vectors = await self.embedder.embed([text])
+        return await asyncio.to_thread(
+            self.index.search,
+            vectors[0],
+            k,
+            elder_id,
+            settings.VECTOR_INDEX_NPROBE,
+            elder_ids,
+        )
+
+    async def embed_missing(self, db: AsyncSession, batch_size: int = 100) -> int:
+        """Backfill embeddings for memories that do not have one yet."""
+        embedded = 0
+        last_id = 0
+        while True:
+            result = await db.execute(
+                select(Memory)
+                .where(
+                    Memory.id > last_id,
+                    Memory.deleted_at.is_(None),
+                    Memory.embedding.is_(None),
+                )
+                .order_by(Memory.id)
+                .limit(batch_size)
+            )
+            memories = list(result.scalars().all())
+            if not memories:
+                return embedded
+
+            last_id = memories[-1].id
+            texts = [memory_text(memory) for memory in memories]
+            with_text = [(m, t) for m, t in zip(memories, texts) if t]
+            if with_text:
+                vectors = await self.embedder.embed([t for _, t in with_text])
+                for (memory, _), vector in zip(with_text, vectors):
+                    memory.embedding = encode_embedding(vector)
+                embedded += len(with_text)
+            await db.commit()
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """Embed any missing memories and publish a fresh index build."""
+        await self.embed_missing(db)
+
+        built_at = (await db.execute(select(func.now()))).scalar_one()
+        result = await db.stream(
+            select(Memory.id, Memory.elder_id, Memory.embedding)
+            .where(Memory.deleted_at.is_(None), Memory.embedding.isnot(None))
+            .execution_options(yield_per=5000)
+        )
+
+        ids: list[int] = []
+        elder_ids: list[int] = []
+        vectors: list[np.ndarray] = []
+        async for memory_id, elder_id, embedding in result:
+            vector = self._vector(embedding)
+            if vector is not None:
+                ids.append(memory_id)
+                elder_ids.append(elder_id)
+                vectors.append(vector)
+
+        matrix = (
+            np.stack(vectors).astype(np.float32)
+            if vectors
+            else np.zeros((0, self.embedder.dim), dtype=np.float32)
+        )
+        await asyncio.to_thread(
+            self.index.build,
+            np.array(ids, dtype=np.int64),
+            np.array(elder_ids, dtype=np.int32),
+            matrix,
+            built_at or datetime.now(timezone.utc),
+        )
+
+        self._loaded = True
+        self._synced_at = self.index.built_at
+        self._next_refresh = 0.0
+        return len(ids)
+
+
+semantic_search_service = SemanticSearchService()
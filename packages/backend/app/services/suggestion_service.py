@@ -0,0 +1,206 @@
+"""In-process autocomplete index for search suggestions."""
+
+import heapq
+import time
+from collections.abc import Iterable
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.memory import Memory
+from app.services.cache_service import ElderIndexCache
+
+# Rough per-object sizes on CPython, used to keep the cache inside its budget.
+NODE_BYTES = 240
+TERM_BYTES = 120
+MEMORY_BYTES = 200
+
+
+def suggestion_terms(
+    title: Optional[str],
+    tags: Optional[list[str]],
+    people: Optional[list[str]],
+    location: Optional[str],
+) -> frozenset[str]:
+    """Collect the suggestable terms of a memory."""
+    terms = [title, *(tags or []), *(people or []), location]
+    return frozenset(term.strip() for term in terms if term and term.strip())
+
+
+class _Node:
+    """Trie node; `term` is set when a suggestion ends here."""
+
+    __slots__ = ("children", "term", "count")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.term: Optional[str] = None
+        self.count = 0
+
+
+class SuggestionTrie:
+    """
+    Case-insensitive prefix trie over one elder's suggestion terms.
+
+    Each term counts the memories that contain it, so popular terms rank
+    first. The terms of every memory are kept so updates and deletes can
+    retract exactly what that memory added.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty trie."""
+        self.root = _Node()
+        self.nbytes = NODE_BYTES
+        self.loaded_at = time.monotonic()
+        self._memory_terms: dict[int, frozenset[str]] = {}
+
+    def set_memory(self, memory_id: int, terms: frozenset[str]) -> None:
+        """Replace the terms contributed by a memory."""
+        old = self._memory_terms.get(memory_id, frozenset())
+        for term in old - terms:
+            self._remove(term)
+        for term in terms - old:
+            self._add(term)
+
+        if terms:
+            if memory_id not in self._memory_terms:
+                self.nbytes += MEMORY_BYTES
+            self._memory_terms[memory_id] = terms
+        elif self._memory_terms.pop(memory_id, None) is not None:
+            self.nbytes -= MEMORY_BYTES
+
+    def remove_memory(self, memory_id: int) -> None:
+        """Retract everything a memory contributed."""
+        self.set_memory(memory_id, frozenset())
+
+    def _add(self, term: str) -> None:
+        node = self.root
+        for char in term.casefold():
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+                self.nbytes += NODE_BYTES
+            node = child
+        if node.count == 0:
+            node.term = term
+            self.nbytes += TERM_BYTES + len(term)
+        node.count += 1
+
+    def _remove(self, term: str) -> None:
+        path = [self.root]
+        key = term.casefold()
+        for char in key:
+            child = path[-1].children.get(char)
+            if child is None:
+                return
+            path.append(child)
+
+        node = path[-1]
+        node.count -= 1
+        if node.count > 0:
+            return
+        self.nbytes -= TERM_BYTES + len(node.term or "")
+        node.term = None
+
+        # Prune the branch back to the last node still in use.
+        for char, parent in zip(reversed(key), reversed(path[:-1])):
+            child = parent.children[char]
+            if child.children or child.count:
+                break
+            del parent.children[char]
+            self.nbytes -= NODE_BYTES
+
+    def complete(self, prefix: str, limit: int) -> list[str]:
+        """Return up to limit terms starting with prefix, most common first."""
+        node = self.root
+        for char in prefix.casefold():
+            child = node.children.get(char)
+            if child is None:
+                return []
+            node = child
+
+        def walk(start: _Node) -> Iterable[_Node]:
+            stack = [start]
+            while stack:
+                current = stack.pop()
+                if current.count:
+                    yield current
+                stack.extend(current.children.values())
+
+        best = heapq.nsmallest(
+            limit, walk(node), key=lambda n: (-n.count, (n.term or "").casefold())
+        )
+        return [n.term for n in best if n.term is not None]
+
+
+class SuggestionService:
+    """
+    Per-elder suggestion tries, built lazily and evicted LRU by size.
+
+    A trie is loaded with one query the first time an elder is asked for and
+    then kept current by the memory write hooks, so warm suggestions never
+    touch the database. Writes handled by other processes are picked up when
+    the trie expires after SUGGESTION_INDEX_TTL_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty cache."""
+        self._tries: ElderIndexCache[SuggestionTrie] = ElderIndexCache(
+            self._load,
+            max_bytes=lambda: settings.SUGGESTION_INDEX_MAX_BYTES,
+            ttl=lambda: settings.SUGGESTION_INDEX_TTL_SECONDS,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by all cached tries."""
+        return self._tries.nbytes
+
+    async def _load(self, db: AsyncSession, elder_id: int) -> SuggestionTrie:
+        result = await db.execute(
+            select(
+                Memory.id,
+                Memory.title,
+                Memory.tags,
+                Memory.people_mentioned,
+                Memory.location,
+            ).where(Memory.elder_id == elder_id, Memory.deleted_at.is_(None))
+        )
+        trie = SuggestionTrie()
+        for memory_id, title, tags, people, location in result:
+            trie.set_memory(memory_id, suggestion_terms(title, tags, people, location))
+        return trie
+
+    async def suggest(
+        self, db: AsyncSession, elder_id: int, prefix: str, limit: int
+    ) -> list[str]:
+        """Return suggestions for an elder's memories starting with prefix."""
+        trie = await self._tries.get(db, elder_id)
+        return trie.complete(prefix, limit)
+
+    def index_memory(self, memory: Memory) -> None:
+        """Reflect a committed memory in its elder's trie, if loaded."""
+        trie = self._tries.peek(memory.elder_id)
+        if trie is None:
+            return
+        if memory.deleted_at is not None:
+            trie.remove_memory(memory.id)
+        else:
+            trie.set_memory(
+                memory.id,
+                suggestion_terms(
+                    memory.title, memory.tags, memory.people_mentioned, memory.location
+                ),
+            )
+        self._tries.evict()
+
+    def remove_memory(self, memory: Memory) -> None:
+        """Retract a deleted memory from its elder's trie, if loaded."""
+        trie = self._tries.peek(memory.elder_id)
+        if trie is not None:
+            trie.remove_memory(memory.id)
+
+
+suggestion_service = SuggestionService()
@@ -0,0 +1,530 @@
+"""Materialized per-elder timelines, maintained incrementally."""
+
+import logging
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Integer,
+    Select,
+    Subquery,
+    Text,
+    and_,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    JSON,
+    aggregate_order_by,
+    array,
+    insert,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.db.models.elder import Elder
+from app.db.models.memory import Memory
+from app.db.models.timeline_snapshot import TimelineBucket, TimelineSnapshot
+from app.utils.pagination import Page, fetch_page
+
+logger = logging.getLogger(__name__)
+
+# Fields returned for each memory of a timeline, in order.
+TIMELINE_FIELDS: tuple[InstrumentedAttribute[Any], ...] = (
+    Memory.id,
+    Memory.title,
+    Memory.category,
+    Memory.date_of_event,
+    Memory.summary,
+    Memory.emotional_tone,
+    Memory.location,
+)
+
+# Fields returned per group_by mode; category timelines leave out the
+# category, which is the period itself.
+TIMELINE_GROUPINGS = {
+    "decade": TIMELINE_FIELDS,
+    "year": TIMELINE_FIELDS,
+    "era": TIMELINE_FIELDS,
+    "category": tuple(field for field in TIMELINE_FIELDS if field.key != "category"),
+}
+
+# Eras in life order; also the life stages memory_life_stage() derives from
+# an elder's age at the event (migration f4a9d3e61c27).
+ERA_ORDER = [
+    "childhood",
+    "adolescence",
+    "young_adult",
+    "adult",
+    "middle_age",
+    "senior",
+    "Unknown",
+]
+
+# Memories kept per bucket for summary timelines, earliest event first.
+TIMELINE_PREVIEW_SIZE = 3
+
+# Columns of a bucket computed from memories, in bucket_query order.
+BUCKET_FIELDS = ("period", "count", "memories", "preview", "memory_ids")
+
+# Sort key standing in for a missing event date, after every real one.
+UNDATED_SORT_KEY = 2**62
+
+# Histogram resolutions and how their periods are labelled.
+HISTOGRAM_FORMATS = {"year": "YYYY", "month": "YYYY-MM"}
+
+# First key of the advisory locks serializing timeline writes per elder.
+TIMELINE_LOCK_KEY = 0x7431
+
+# Completeness scoring: decades expected in a full life story, and distinct
+# categories that earn the full category half of the score.
+EXPECTED_DECADES = 8
+EXPECTED_CATEGORIES = 10
+
+
+def timeline_period(group_by: str) -> ColumnElement[str]:
+    """SQL for the timeline period of a memory, from its derived event fields."""
+    if group_by == "decade":
+        return func.coalesce(Memory.event_decade, "Unknown")
+    if group_by == "year":
+        return func.coalesce(Memory.event_year.cast(Text), "Unknown")
+    if group_by == "era":
+        return func.coalesce(Memory.event_era, "Unknown")
+    return func.coalesce(func.nullif(Memory.category, ""), "Uncategorized")
+
+
+def event_sort_key() -> ColumnElement[int]:
+    """
+    Unique-per-instant integer key ordering memories by event date.
+
+    Microseconds since the epoch, with undated memories last; usable as a
+    keyset pagination key, unlike the nullable date itself.
+    """
+    micros = (func.extract("epoch", Memory.date_of_event) * 1_000_000).cast(BigInteger)
+    return func.coalesce(micros, UNDATED_SORT_KEY)
+
+
+def period_order(
+    group_by: str, period: ColumnElement[str], count: ColumnElement[int]
+) -> list[ColumnElement[Any]]:
+    """
+    Order of the periods of a timeline, given their period and count columns.
+
+    Periods without a value ("Unknown") sort last, except that categories
+    are ordered by size.
+    """
+    if group_by == "decade":
+        return [period == "Unknown", period.collate("C")]
+    if group_by == "year":
+        return [func.nullif(period, "Unknown").cast(Integer).asc().nulls_last()]
+    if group_by == "era":
+        position = func.array_position(array(ERA_ORDER), period)
+        return [func.coalesce(position, len(ERA_ORDER) + 1), period]
+    return [count.desc(), period]
+
+
+def bucket_query(
+    elder_id: int, group_by: str, periods: Optional[list[str]] = None
+) -> Select[Any]:
+    """
+    Group an elder's memories into timeline buckets, in timeline order.
+
+    Selects BUCKET_FIELDS: each period, its count, its memories serialized
+    by json_agg (oldest event first), the first TIMELINE_PREVIEW_SIZE of them
+    and their IDs, reading only the timeline fields. With periods, only those
+    buckets are computed.
+    """
+    period = timeline_period(group_by)
+    item = func.json_build_object(
+        *(
+            arg
+            for field in TIMELINE_GROUPINGS[group_by]
+            for arg in (literal_column(f"'{field.key}'"), field)
+        )
+    )
+    order = (Memory.date_of_event.asc(), Memory.id.asc())
+    count = func.count()
+
+    query = (
+        select(
+            period.label("period"),
+            count.label("count"),
+            func.json_agg(aggregate_order_by(item, *order), type_=JSON).label(
+                "memories"
+            ),
+            func.array_to_json(
+                func.array_agg(aggregate_order_by(item, *order), type_=ARRAY(JSON))[
+                    1:TIMELINE_PREVIEW_SIZE
+                ],
+                type_=JSON,
+            ).label("preview"),
+            func.array_agg(aggregate_order_by(Memory.id, *order)).label("memory_ids"),
+        )
+        .where(Memory.elder_id == elder_id, Memory.deleted_at.is_(None))
+        .group_by(period)
+        .order_by(*period_order(group_by, period, count))
+    )
+    if periods is not None:
+        query = query.where(period.in_(periods))
+    return query
+
+
+def timeline_entry(group_by: str, values: Sequence[Any]) -> dict[str, Any]:
+    """A memory's selected timeline fields as returned in a timeline."""
+    entry = {
+        field.key: value for field, value in zip(TIMELINE_GROUPINGS[group_by], values)
+    }
+    if entry["date_of_event"] is not None:
+        entry["date_of_event"] = entry["date_of_event"].isoformat()
+    return entry
+
+
+def fold_stats_groups(groups: Subquery) -> Select:
+    """
+    Fold the grouping-set rows of the stats query into one row.
+
+    The row holds the total count, the earliest and latest event dates, the
+    sorted decades, and JSON maps of counts per category and per era.
+    """
+    # GROUPING() sets a bit for each column rolled up in a row's set.
+    total_row = groups.c.rolled_up == 0b111
+    decade_row = and_(groups.c.rolled_up == 0b011, groups.c.decade.is_not(None))
+    category_row = and_(groups.c.rolled_up == 0b101, groups.c.category.is_not(None))
+    era_row = and_(groups.c.rolled_up == 0b110, groups.c.era.is_not(None))
+    return select(
+        func.max(groups.c.count).filter(total_row),
+        func.max(groups.c.earliest).filter(total_row),
+        func.max(groups.c.latest).filter(total_row),
+        func.array_agg(aggregate_order_by(groups.c.decade, groups.c.decade)).filter(
+            decade_row
+        ),
+        func.json_object_agg(groups.c.category, groups.c.count, type_=JSON).filter(
+            category_row
+        ),
+        func.json_object_agg(groups.c.era, groups.c.count, type_=JSON).filter(era_row),
+    )
+
+
+def timeline_completeness(total: int, decades: int, categories: int) -> float:
+    """
+    Score (0-100) how fully memories cover a life.
+
+    Half the score comes from decades covered, half from categories.
+    """
+    if not total:
+        return 0.0
+
+    decade_score = (decades / EXPECTED_DECADES) * 50
+    category_score = min((categories / EXPECTED_CATEGORIES) * 50, 50)
+    return min(decade_score + category_score, 100.0)
+
+
+def _buckets(rows: Any) -> list[dict[str, Any]]:
+    return [
+        {"period": period, "memories": memories, "count": count}
+        for period, count, memories in rows
+    ]
+
+
+class TimelineService:
+    """
+    Timelines stored per elder and group_by mode, one row per period.
+
+    A timeline is materialized on first read (or by `python -m app.cli
+    rebuild-timelines`) and then read with a single keyed query. Each memory
+    write recomputes, in SQL, only the buckets the memory left and joined.
+    Writes to an elder's timeline take a transaction-level advisory lock, so
+    a build racing a memory write cannot store buckets that miss it.
+    """
+
+    async def get_timeline(
+        self, db: AsyncSession, elder_id: int, group_by: str, summary: bool = False
+    ) -> Optional[tuple[str, list[dict[str, Any]]]]:
+        """
+        Return an elder's name and timeline buckets, or None without elder.
+
+        A summary timeline holds only the preview memories of each bucket; the
+        full lists are then not even read from the table.
+        """
+        memories = TimelineBucket.preview if summary else TimelineBucket.memories
+        result = await db.execute(
+            select(
+                Elder.name,
+                TimelineSnapshot.built_at,
+                TimelineBucket.period,
+                TimelineBucket.count,
+                memories,
+            )
+            .select_from(Elder)
+            .outerjoin(
+                TimelineSnapshot,
+                and_(
+                    TimelineSnapshot.elder_id == Elder.id,
+                    TimelineSnapshot.group_by == group_by,
+                ),
+            )
+            .outerjoin(
+                TimelineBucket,
+                and_(
+                    TimelineBucket.elder_id == TimelineSnapshot.elder_id,
+                    TimelineBucket.group_by == TimelineSnapshot.group_by,
+                ),
+            )
+            .where(Elder.id == elder_id)
+            .order_by(
+                *period_order(
+                    group_by,
+                    TimelineBucket.period.expression,
+                    TimelineBucket.count.expression,
+                )
+            )
+        )
+        rows = result.all()
+        if not rows:
+            return None
+
+        elder_name = rows[0][0]
+        if rows[0][1] is None:
+            built = await self.build(db, elder_id, group_by)
+            column = 3 if summary else 2
+            return elder_name, _buckets((row[0], row[1], row[column]) for row in built)
+        return elder_name, _buckets(row[2:] for row in rows if row[2] is not None)
+
+    async def _lock(self, db: AsyncSession, elder_id: int) -> None:
+        await db.execute(
+            select(func.pg_advisory_xact_lock(TIMELINE_LOCK_KEY, elder_id))
+        )
+
+    async def build(
+        self, db: AsyncSession, elder_id: int, group_by: str
+    ) -> list[tuple[Any, ...]]:
+        """
+        Materialize an elder's timeline for one mode.
+
+        Returns its buckets as (period, count, memories, preview) tuples.
+        """
+        await self._lock(db, elder_id)
+        await db.execute(
+            delete(TimelineBucket).where(
+                TimelineBucket.elder_id == elder_id, TimelineBucket.group_by == group_by
+            )
+        )
+        result = await db.execute(bucket_query(elder_id, group_by))
+        rows = result.all()
+        if rows:
+            await db.execute(
+                insert(TimelineBucket),
+                [
+                    {
+                        "elder_id": elder_id,
+                        "group_by": group_by,
+                        **dict(zip(BUCKET_FIELDS, row)),
+                    }
+                    for row in rows
+                ],
+            )
+        await db.execute(
+            insert(TimelineSnapshot)
+            .values(elder_id=elder_id, group_by=group_by)
+            .on_conflict_do_update(
+                index_elements=[TimelineSnapshot.elder_id, TimelineSnapshot.group_by],
+                set_={"built_at": func.now()},
+            )
+        )
+        return [tuple(row[:4]) for row in rows]
+
+    async def _refresh(
+        self, db: AsyncSession, elder_id: int, group_by: str, periods: list[str]
+    ) -> None:
+        """Recompute some buckets of a materialized timeline, in the database."""
+        await db.execute(
+            delete(TimelineBucket).where(
+                TimelineBucket.elder_id == elder_id,
+                TimelineBucket.group_by == group_by,
+                TimelineBucket.period.in_(periods),
+            )
+        )
+        buckets = bucket_query(elder_id, group_by, periods).subquery()
+        await db.execute(
+            insert(TimelineBucket).from_select(
+                ["elder_id", "group_by", *BUCKET_FIELDS],
+                select(
+                    literal(elder_id),
+                    literal(group_by),
+                    *(buckets.c[field] for field in BUCKET_FIELDS),
+                ),
+            )
+        )
+
+    async def update_memory(self, db: AsyncSession, memory: Memory) -> None:
+        """
+        Reflect a committed (or soft-deleted) memory in its elder's timelines.
+
+        For each materialized mode, recomputes the bucket holding the memory
+        before the write and the one it belongs to now, which are usually
+        the same. Runs in a savepoint: failures are logged rather than
+        raised, since the memory itself is already saved.
+        """
+        try:
+            async with db.begin_nested():
+                await self._lock(db, memory.elder_id)
+                result = await db.execute(
+                    select(TimelineSnapshot.group_by).where(
+                        TimelineSnapshot.elder_id == memory.elder_id
+                    )
+                )
+                modes = list(result.scalars().all())
+                if not modes:
+                    return
+
+                result = await db.execute(
+                    select(*(timeline_period(mode) for mode in modes)).where(
+                        Memory.id == memory.id, Memory.deleted_at.is_(None)
+                    )
+                )
+                current = result.one_or_none()
+                periods: dict[str, set[str]] = {
+                    mode: {current[i]} if current is not None else set()
+                    for i, mode in enumerate(modes)
+                }
+
+                result = await db.execute(
+                    select(TimelineBucket.group_by, TimelineBucket.period).where(
+                        TimelineBucket.elder_id == memory.elder_id,
+                        TimelineBucket.memory_ids.contains([memory.id]),
+                    )
+                )
+                for mode, period in result.all():
+                    periods.setdefault(mode, set()).add(period)
+
+                for mode, mode_periods in periods.items():
+                    if mode_periods:
+                        await self._refresh(
+                            db, memory.elder_id, mode, sorted(mode_periods)
+                        )
+        except SQLAlchemyError:
+            logger.exception("Failed to update timelines for memory %s", memory.id)
+
+    async def period_page(
+        self,
+        db: AsyncSession,
+        elder_id: int,
+        group_by: str,
+        period: str,
+        size: int,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """
+        Page through the memories of one timeline period, in timeline order.
+
+        Reads the memories table directly, keyset-paged on (event date, id),
+        so any period can be walked without loading its whole bucket.
+        """
+        query = select(*TIMELINE_GROUPINGS[group_by]).where(
+            Memory.elder_id == elder_id,
+            Memory.deleted_at.is_(None),
+            timeline_period(group_by) == period,
+        )
+        return await fetch_page(
+            db,
+            query,
+            (event_sort_key(), Memory.id),
+            size,
+            cursor=cursor,
+            descending=False,
+        )
+
+    async def histogram(
+        self, db: AsyncSession, elder_id: int, resolution: str
+    ) -> list[dict[str, Any]]:
+        """
+        Count an elder's memories per year or month of their event, in order.
+
+        Only periods with memories are returned; undated memories are counted
+        under "Unknown", last.
+        """
+        period = func.to_char(Memory.date_of_event, HISTOGRAM_FORMATS[resolution])
+        result = await db.execute(
+            select(func.coalesce(period, "Unknown"), func.count())
+            .where(Memory.elder_id == elder_id, Memory.deleted_at.is_(None))
+            .group_by(period)
+            .order_by(period.asc().nulls_last())
+        )
+        return [{"period": label, "count": count} for label, count in result.all()]
+
+    async def stats(self, db: AsyncSession, elder_id: int) -> dict[str, Any]:
+        """
+        Summarize the coverage of an elder's memories in one statement.
+
+        Counts per decade, category and era are grouping sets of one scan; an
+        outer aggregate folds them into a single row of scalars and small maps,
+        so nothing here grows with the number of memories.
+        """
+        decade = Memory.event_decade
+        category = func.nullif(Memory.category, "")
+        era = Memory.event_era
+        groups = (
+            select(
+                decade.label("decade"),
+                category.label("category"),
+                era.label("era"),
+                func.grouping(decade, category, era).label("rolled_up"),
+                func.count().label("count"),
+                func.min(Memory.date_of_event).label("earliest"),
+                func.max(Memory.date_of_event).label("latest"),
+            )
+            .where(Memory.elder_id == elder_id, Memory.deleted_at.is_(None))
+            .group_by(func.grouping_sets(literal_column("()"), decade, category, era))
+            .subquery()
+        )
+
+        row = (await db.execute(fold_stats_groups(groups))).one()
+        total, earliest, latest, decades, categories, eras = row
+
+        total = total or 0
+        decades = decades or []
+        categories = categories or {}
+        return {
+            "total_memories": total,
+            "earliest_memory": earliest.isoformat() if earliest else None,
+            "latest_memory": latest.isoformat() if latest else None,
+            "decades_covered": decades,
+            "total_decades": len(decades),
+            "categories": categories,
+            "eras": eras or {},
+            "completeness_score": timeline_completeness(
+                total, len(decades), len(categories)
+            ),
+        }
+
+    async def clear(self, db: AsyncSession, elder_id: int) -> None:
+        """Drop an elder's materialized timelines; they are rebuilt on read."""
+        await self._lock(db, elder_id)
+        await db.execute(
+            delete(TimelineBucket).where(TimelineBucket.elder_id == elder_id)
+        )
+        await db.execute(
+            delete(TimelineSnapshot).where(TimelineSnapshot.elder_id == elder_id)
+        )
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """Materialize every elder's timelines from scratch."""
+        result = await db.execute(select(Elder.id).where(Elder.deleted_at.is_(None)))
+        elder_ids = list(result.scalars().all())
+
+        buckets = 0
+        for elder_id in elder_ids:
+            for group_by in TIMELINE_GROUPINGS:
+                buckets += len(await self.build(db, elder_id, group_by))
+            await db.commit()
+        return buckets
+
+
+timeline_service = TimelineService()
@@ -0,0 +1,361 @@
+"""Approximate nearest-neighbour index over memory embeddings."""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Elders with at most this many vectors are searched exactly instead of via IVF.
+EXACT_SEARCH_LIMIT = 20000
+# Below this many vectors a single inverted list (plain brute force) is used.
+MIN_VECTORS_PER_LIST = 256
+# Vectors assigned to their nearest centroid per matrix product.
+ASSIGN_CHUNK_SIZE = 65536
+
+
+def train_ivf(
+    vectors: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster unit vectors with spherical k-means.
+
+    Returns the float32 centroids and the list assignment of every vector.
+    Centroids are trained on a sample and every vector is then assigned in
+    chunks, so memory use stays bounded for large inputs.
+    """
+    rng = np.random.default_rng(seed)
+    count = len(vectors)
+    sample_size = min(count, nlist * MIN_VECTORS_PER_LIST)
+    sample = np.asarray(
+        vectors[rng.choice(count, size=sample_size, replace=False)], dtype=np.float32
+    )
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+    for _ in range(iterations):
+        centroids = _kmeans_step(sample, centroids)
+
+    assignments = np.empty(count, dtype=np.int32)
+    for start in range(0, count, ASSIGN_CHUNK_SIZE):
+        chunk = np.asarray(vectors[start : start + ASSIGN_CHUNK_SIZE], dtype=np.float32)
+        assignments[start : start + ASSIGN_CHUNK_SIZE] = np.argmax(
+            chunk @ centroids.T, axis=1
+        )
+
+    return centroids.astype(np.float32), assignments
+
+
+def _kmeans_step(sample: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Move each centroid to the normalised mean of its vectors; keep empty ones."""
+    labels = np.argmax(sample @ centroids.T, axis=1)
+    sums = np.zeros_like(centroids)
+    np.add.at(sums, labels, sample)
+    norms = np.linalg.norm(sums, axis=1, keepdims=True)
+    empty = norms[:, 0] == 0
+    return np.where(empty[:, None], centroids, sums / np.maximum(norms, 1e-12))
+
+
+def _elder_filter(
+    elder_id: Optional[int], elder_ids: Optional[Collection[int]]
+) -> Optional[np.ndarray]:
+    """The elders a search is restricted to, or None for all elders."""
+    if elder_id is not None:
+        return np.array([elder_id], dtype=np.int32)
+    if elder_ids is not None:
+        return np.unique(np.fromiter(elder_ids, dtype=np.int32))
+    return None
+
+
+def _top_k(ids: np.ndarray, scores: np.ndarray, k: int) -> list[tuple[int, float]]:
+    """The k best (id, score) pairs, best first."""
+    if len(ids) > k:
+        top = np.argpartition(-scores, k - 1)[:k]
+        ids, scores = ids[top], scores[top]
+    order = np.argsort(-scores, kind="stable")
+    return [(int(ids[i]), float(scores[i])) for i in order]
+
+
+@dataclass
+class IVFBuild:
+    """
+    One immutable build of the base index.
+
+    Vectors are stored grouped by inverted list: list i holds positions
+    offsets[i] to offsets[i + 1], with their memory and elder ids alongside.
+    """
+
+    centroids: np.ndarray
+    vectors: np.ndarray
+    ids: np.ndarray
+    elder_ids: np.ndarray
+    offsets: np.ndarray
+    built_at: Optional[datetime] = None
+    # Positions of each elder's vectors, computed on first use.
+    elder_positions: dict[int, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls, dim: int) -> "IVFBuild":
+        """A build holding no vectors."""
+        return cls(
+            centroids=np.zeros((0, dim), dtype=np.float32),
+            vectors=np.zeros((0, dim), dtype=np.float16),
+            ids=np.zeros(0, dtype=np.int64),
+            elder_ids=np.zeros(0, dtype=np.int32),
+            offsets=np.zeros(1, dtype=np.int64),
+        )
+
+    @classmethod
+    def open(cls, build_dir: Path, built_at: datetime) -> "IVFBuild":
+        """Memory-map a build written by VectorIndex.build."""
+        return cls(
+            centroids=np.load(build_dir / "centroids.npy"),
+            vectors=np.load(build_dir / "vectors.npy", mmap_mode="r"),
+            ids=np.load(build_dir / "ids.npy", mmap_mode="r"),
+            elder_ids=np.load(build_dir / "elder_ids.npy", mmap_mode="r"),
+            offsets=np.load(build_dir / "offsets.npy"),
+            built_at=built_at,
+        )
+
+    def positions_for_elder(self, elder_id: int) -> np.ndarray:
+        """Positions of an elder's vectors."""
+        positions = self.elder_positions.get(elder_id)
+        if positions is None:
+            positions = np.flatnonzero(np.asarray(self.elder_ids) == elder_id)
+            self.elder_positions[elder_id] = positions
+        return positions
+
+    def probe(
+        self, query: np.ndarray, elders: Optional[np.ndarray], nprobe: int
+    ) -> np.ndarray:
+        """
+        Positions of the vectors a search scores.
+
+        Elders with few enough vectors are scanned exactly; otherwise the
+        nprobe lists nearest to the query are, filtered to the elders.
+        """
+        if elders is not None:
+            positions: np.ndarray = np.concatenate(
+                [self.positions_for_elder(int(elder)) for elder in elders]
+            )
+            if len(positions) <= EXACT_SEARCH_LIMIT:
+                return positions
+        if len(self.ids) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        probes = min(nprobe, len(self.centroids))
+        lists = np.argsort(self.centroids @ query)[::-1][:probes]
+        probed: list[np.ndarray] = []
+        for list_no in lists:
+            start, end = self.offsets[list_no], self.offsets[list_no + 1]
+            in_list = np.arange(start, end)
+            if elders is not None:
+                in_list = in_list[
+                    np.isin(np.asarray(self.elder_ids[start:end]), elders)
+                ]
+            probed.append(in_list)
+        return np.concatenate(probed)
+
+    def score(
+        self, query: np.ndarray, positions: np.ndarray, removed: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Ids and scores of the vectors at positions, skipping removed ids."""
+        ids = np.asarray(self.ids[positions])
+        scores = np.asarray(self.vectors[positions], dtype=np.float32) @ query
+        if len(removed):
+            keep = ~np.isin(ids, removed)
+            ids, scores = ids[keep], scores[keep]
+        return ids, scores
+
+
+class DeltaArrays(NamedTuple):
+    """Array snapshot of the writes made since the last build."""
+
+    ids: np.ndarray
+    elder_ids: np.ndarray
+    vectors: np.ndarray
+    # Base entries masked out: every updated or deleted memory.
+    removed: np.ndarray
+
+    def score(
+        self, query: np.ndarray, elders: Optional[np.ndarray]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Ids and scores of the written vectors, restricted to elders."""
+        if elders is None:
+            ids, vectors = self.ids, self.vectors
+        else:
+            mask = np.isin(self.elder_ids, elders)
+            ids, vectors = self.ids[mask], self.vectors[mask]
+        return ids, np.asarray(vectors, dtype=np.float32) @ query
+
+
+@dataclass
+class DeltaLog:
+    """Writes made since the last build, kept in memory."""
+
+    dim: int
+    entries: dict[int, tuple[int, np.ndarray]] = field(default_factory=dict)
+    removed: set[int] = field(default_factory=set)
+    # Arrays of the current entries, rebuilt after a write.
+    snapshot: Optional[DeltaArrays] = None
+
+    def upsert(self, memory_id: int, elder_id: int, vector: np.ndarray) -> None:
+        """Add or replace the vector for a memory."""
+        self.entries[memory_id] = (elder_id, vector.astype(np.float16))
+        self.removed.add(memory_id)
+        self.snapshot = None
+
+    def remove(self, memory_id: int) -> None:
+        """Drop a memory."""
+        self.entries.pop(memory_id, None)
+        self.removed.add(memory_id)
+        self.snapshot = None
+
+    def arrays(self) -> DeltaArrays:
+        """The entries as arrays, cached until the next write."""
+        if self.snapshot is None:
+            self.snapshot = DeltaArrays(
+                ids=np.fromiter(self.entries.keys(), dtype=np.int64),
+                elder_ids=np.array(
+                    [elder for elder, _ in self.entries.values()], dtype=np.int32
+                ),
+                vectors=(
+                    np.stack([vector for _, vector in self.entries.values()])
+                    if self.entries
+                    else np.zeros((0, self.dim), dtype=np.float16)
+                ),
+                removed=np.fromiter(self.removed, dtype=np.int64),
+            )
+        return self.snapshot
+
+
+class VectorIndex:
+    """
+    IVF-flat index with float16 vectors memory-mapped from disk.
+
+    The on-disk base index is immutable and rebuilt offline. Writes made after
+    a build land in a small in-memory delta that is searched exhaustively, and
+    base entries that were updated or deleted are masked out until the next
+    build. Each build is written to its own directory and published by
+    atomically replacing the CURRENT pointer file.
+    """
+
+    def __init__(self, path: Path, dim: int) -> None:
+        """Create an empty index rooted at path."""
+        self.path = path
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._base = IVFBuild.empty(dim)
+        self._delta = DeltaLog(dim)
+
+    @property
+    def built_at(self) -> Optional[datetime]:
+        """When the loaded base index was built; None before the first load."""
+        return self._base.built_at
+
+    def load(self) -> bool:
+        """Memory-map the current build from disk, if there is one."""
+        pointer = self.path / "CURRENT"
+        if not pointer.exists():
+            return False
+
+        build_dir = self.path / pointer.read_text().strip()
+        meta = json.loads((build_dir / "meta.json").read_text())
+        if meta["dim"] != self.dim:
+            return False
+
+        base = IVFBuild.open(build_dir, datetime.fromisoformat(meta["built_at"]))
+        with self._lock:
+            self._base = base
+            self._delta = DeltaLog(self.dim)
+        return True
+
+    def build(
+        self,
+        ids: np.ndarray,
+        elder_ids: np.ndarray,
+        vectors: np.ndarray,
+        built_at: datetime,
+    ) -> None:
+        """Build a new base index from unit vectors, publish it and load it."""
+        count = len(ids)
+        nlist = max(1, min(4096, int(np.sqrt(count)), count // MIN_VECTORS_PER_LIST))
+        if nlist > 1:
+            centroids, assignments = train_ivf(vectors, nlist)
+        else:
+            centroids = np.zeros((1, self.dim), dtype=np.float32)
+            assignments = np.zeros(count, dtype=np.int32)
+
+        order = np.argsort(assignments, kind="stable")
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=nlist), out=offsets[1:])
+
+        build_name = f"build-{int(time.time() * 1000)}"
+        build_dir = self.path / build_name
+        build_dir.mkdir(parents=True, exist_ok=True)
+        np.save(build_dir / "centroids.npy", centroids)
+        np.save(build_dir / "vectors.npy", vectors[order].astype(np.float16))
+        np.save(build_dir / "ids.npy", ids[order].astype(np.int64))
+        np.save(build_dir / "elder_ids.npy", elder_ids[order].astype(np.int32))
+        np.save(build_dir / "offsets.npy", offsets)
+        (build_dir / "meta.json").write_text(
+            json.dumps(
+                {"dim": self.dim, "count": count, "built_at": built_at.isoformat()}
+            )
+        )
+
+        pointer_tmp = self.path / f"CURRENT.{os.getpid()}"
+        pointer_tmp.write_text(build_name)
+        os.replace(pointer_tmp, self.path / "CURRENT")
+
+        self.load()
+        for old in self.path.glob("build-*"):
+            if old.name != build_name:
+                shutil.rmtree(old, ignore_errors=True)
+
+    def upsert(self, memory_id: int, elder_id: int, vector: np.ndarray) -> None:
+        """Add or replace the vector for a memory."""
+        with self._lock:
+            self._delta.upsert(memory_id, elder_id, vector)
+
+    def remove(self, memory_id: int) -> None:
+        """Drop a memory from the index."""
+        with self._lock:
+            self._delta.remove(memory_id)
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        elder_id: Optional[int] = None,
+        nprobe: int = 8,
+        elder_ids: Optional[Collection[int]] = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Return up to k (memory_id, cosine score) pairs, best first.
+
+        Hits can be restricted to one elder (elder_id) or to several
+        (elder_ids); an empty elder_ids matches nothing. Base hits that were
+        updated or deleted since the build are overlaid by the delta.
+        """
+        query = np.asarray(query, dtype=np.float32)
+        elders = _elder_filter(elder_id, elder_ids)
+        if elders is not None and len(elders) == 0:
+            return []
+
+        with self._lock:
+            base, delta = self._base, self._delta.arrays()
+        base_ids, base_scores = base.score(
+            query, base.probe(query, elders, nprobe), delta.removed
+        )
+        delta_ids, delta_scores = delta.score(query, elders)
+        return _top_k(
+            np.concatenate([base_ids, delta_ids]),
+            np.concatenate([base_scores, delta_scores]),
+            k,
+        )
@@ -0,0 +1,419 @@
+"""Per-elder search vocabulary and typo correction (SymSpell)."""
+
+import bisect
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from sqlalchemy import and_, delete, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.core.config import settings
+from app.db.models.memory import Memory
+from app.db.models.vocabulary_term import VocabularyTerm
+from app.services.cache_service import ElderIndexCache
+from app.utils.text import words
+
+logger = logging.getLogger(__name__)
+
+# Words shorter than this are neither indexed nor corrected.
+MIN_TERM_LENGTH = 3
+MAX_TERM_LENGTH = 50
+
+# Edits allowed when correcting a word; short words get one.
+MAX_EDIT_DISTANCE = 2
+SHORT_WORD_LENGTH = 4
+
+# Deletes are generated from this many leading characters only, which bounds
+# the index size; candidates are then checked on the whole word.
+PREFIX_LENGTH = 7
+
+# The text search stems words, so a word within a few trailing characters of
+# a known term (farm/farming) is treated as known rather than corrected.
+STEM_MIN_LENGTH = 4
+STEM_SLACK = 3
+
+# Rough per-object sizes on CPython, used to keep the cache inside its budget.
+TERM_BYTES = 120
+DELETE_BYTES = 80
+
+INSERT_BATCH_SIZE = 5000
+
+# Memory fields the vocabulary is drawn from; people_mentioned is a list.
+VOCABULARY_FIELDS = ("title", "summary", "transcription", "location")
+
+# Key of a memory's committed vocabulary in its ORM instance state.
+COMMITTED_VOCABULARY_KEY = "committed_vocabulary"
+
+
+def _vocabulary(texts: Iterable[Optional[str]]) -> set[str]:
+    return {
+        word
+        for text in texts
+        if text
+        for word in words(text)
+        if MIN_TERM_LENGTH <= len(word) <= MAX_TERM_LENGTH
+    }
+
+
+def memory_vocabulary(memory: Memory) -> set[str]:
+    """The distinct words of a memory worth offering as corrections."""
+    return _vocabulary(
+        [
+            *(getattr(memory, field) for field in VOCABULARY_FIELDS),
+            *(memory.people_mentioned or []),
+        ]
+    )
+
+
+def committed_vocabulary(memory: Memory) -> set[str]:
+    """
+    The words of a memory as last loaded from the database.
+
+    Read from the attribute history of changes not yet flushed, so it must be
+    called before the memory is committed; a new memory has none.
+    """
+    state = inspect(memory)
+    if state.key is None:
+        return set()
+
+    def committed(field: str) -> Any:
+        history = state.attrs[field].history
+        values = history.deleted or history.unchanged
+        return values[0] if values else None
+
+    return _vocabulary(
+        [
+            *(committed(field) for field in VOCABULARY_FIELDS),
+            *(committed("people_mentioned") or []),
+        ]
+    )
+
+
+def osa_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between a and b.
+
+    Counts insertions, deletions, substitutions and transpositions of adjacent
+    characters; gives up and returns max_distance + 1 once it is exceeded.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        char = a[i - 1]
+        current = [i]
+        row_min = i
+        for j in range(1, len(b) + 1):
+            value = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                i > 1
+                and j > 1
+                and char == b[j - 2]
+                and a[i - 2] == b[j - 1]
+                and previous2[j - 2] + 1 < value
+            ):
+                value = previous2[j - 2] + 1
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """The word's prefix with up to distance characters deleted."""
+    prefix = word[:PREFIX_LENGTH]
+    variants = {prefix}
+    frontier = {prefix}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+class SymSpellIndex:
+    """
+    Deletion-neighbourhood index over one elder's vocabulary.
+
+    Every term is stored under each string obtained by deleting up to
+    MAX_EDIT_DISTANCE characters from it. Two words within that distance
+    share such a deletion, so a misspelling finds its candidates by looking
+    up its own deletions, without scanning the vocabulary.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.frequencies: dict[str, int] = {}
+        self.nbytes = 0
+        self.loaded_at = time.monotonic()
+        self._deletes: dict[str, list[str]] = {}
+        self._sorted: Optional[list[str]] = None
+
+    def add(self, term: str, count: int = 1) -> None:
+        """Add a term, or raise the frequency of a known one."""
+        if term in self.frequencies:
+            self.frequencies[term] += count
+            return
+
+        self.frequencies[term] = count
+        self._sorted = None
+        variants = _deletes(term, MAX_EDIT_DISTANCE)
+        for variant in variants:
+            self._deletes.setdefault(variant, []).append(term)
+        self.nbytes += TERM_BYTES + len(term) + DELETE_BYTES * len(variants)
+
+    def discard(self, term: str) -> None:
+        """Lower the frequency of a term, forgetting it when none are left."""
+        frequency = self.frequencies.get(term)
+        if frequency is None:
+            return
+        if frequency > 1:
+            self.frequencies[term] = frequency - 1
+            return
+
+        del self.frequencies[term]
+        self._sorted = None
+        variants = _deletes(term, MAX_EDIT_DISTANCE)
+        for variant in variants:
+            terms = self._deletes[variant]
+            terms.remove(term)
+            if not terms:
+                del self._deletes[variant]
+        self.nbytes -= TERM_BYTES + len(term) + DELETE_BYTES * len(variants)
+
+    def is_known(self, word: str) -> bool:
+        """Whether a word is a term or an inflection of one."""
+        if word in self.frequencies:
+            return True
+        if len(word) < STEM_MIN_LENGTH:
+            return False
+
+        for end in range(max(STEM_MIN_LENGTH, len(word) - STEM_SLACK), len(word)):
+            if word[:end] in self.frequencies:
+                return True
+
+        if self._sorted is None:
+            self._sorted = sorted(self.frequencies)
+        start = bisect.bisect_left(self._sorted, word)
+        for term in self._sorted[start : start + 8]:
+            if not term.startswith(word):
+                break
+            if len(term) - len(word) <= STEM_SLACK:
+                return True
+        return False
+
+    def lookup(self, word: str) -> Optional[tuple[str, int]]:
+        """
+        Return the closest term to a word and its edit distance, if any.
+
+        Ties on distance go to the more frequent term, then alphabetically.
+        """
+        # Distance of the best candidate so far, which later ones must match.
+        bound = 1 if len(word) <= SHORT_WORD_LENGTH else MAX_EDIT_DISTANCE
+        best: Optional[tuple[int, int, str]] = None
+        seen: set[str] = set()
+        for variant in _deletes(word, bound):
+            for term in self._deletes.get(variant, ()):
+                if term in seen:
+                    continue
+                seen.add(term)
+                distance = osa_distance(word, term, bound)
+                if distance > bound:
+                    continue
+                candidate = (distance, -self.frequencies[term], term)
+                if best is None or candidate < best:
+                    best = candidate
+                    bound = distance
+        return (best[2], best[0]) if best is not None else None
+
+    def correct(self, word: str) -> Optional[str]:
+        """Return the correction for an unknown word, or None."""
+        if self.is_known(word):
+            return None
+        match = self.lookup(word)
+        return match[0] if match is not None else None
+
+
+class VocabularyService:
+    """
+    Per-elder SymSpell indexes over the vocabulary table.
+
+    An elder's index is loaded with one query on first use and then kept
+    current by the memory write hooks, so corrections never touch the
+    database. Indexes expire after VOCABULARY_INDEX_TTL_SECONDS, picking up
+    writes handled by other processes, and are evicted LRU by size.
+
+    Term frequencies count the live memories using each term: a write adds
+    the words it introduced and takes back the words it removed, and a
+    delete takes back all of a memory's words. Terms no memory uses are
+    dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty cache."""
+        self._indexes: ElderIndexCache[SymSpellIndex] = ElderIndexCache(
+            self._load,
+            max_bytes=lambda: settings.VOCABULARY_INDEX_MAX_BYTES,
+            ttl=lambda: settings.VOCABULARY_INDEX_TTL_SECONDS,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by all cached indexes."""
+        return self._indexes.nbytes
+
+    async def _load(self, db: AsyncSession, elder_id: int) -> SymSpellIndex:
+        result = await db.execute(
+            select(VocabularyTerm.term, VocabularyTerm.frequency).where(
+                VocabularyTerm.elder_id == elder_id
+            )
+        )
+        index = SymSpellIndex()
+        for term, frequency in result:
+            index.add(term, frequency)
+        return index
+
+    async def corrections(
+        self, db: AsyncSession, elder_id: int, text: str
+    ) -> dict[str, str]:
+        """Map each unknown word of text to its closest term in the vocabulary."""
+        index = await self._indexes.get(db, elder_id)
+        if not index.frequencies:
+            return {}
+
+        corrections: dict[str, str] = {}
+        for word in set(words(text)):
+            if len(word) < MIN_TERM_LENGTH:
+                continue
+            correction = index.correct(word)
+            if correction is not None:
+                corrections[word] = correction
+        return corrections
+
+    def record_committed(self, memory: Memory) -> None:
+        """
+        Remember a memory's committed words before a write is committed.
+
+        update_memory diffs against them afterwards, as the attribute history
+        is reset by the commit.
+        """
+        inspect(memory).info[COMMITTED_VOCABULARY_KEY] = committed_vocabulary(memory)
+
+    async def update_memory(self, db: AsyncSession, memory: Memory) -> None:
+        """
+        Apply the words a committed write added to and removed from a memory.
+
+        Without words recorded by record_committed, every word counts as new.
+        Runs in a savepoint: failures are logged rather than raised, since the
+        memory itself is already saved.
+        """
+        before = inspect(memory).info.pop(COMMITTED_VOCABULARY_KEY, set())
+        after = memory_vocabulary(memory) if memory.deleted_at is None else set()
+        await self._apply(db, memory, sorted(after - before), sorted(before - after))
+
+    async def remove_memory(self, db: AsyncSession, memory: Memory) -> None:
+        """Take back the words of a soft-deleted memory."""
+        await self._apply(db, memory, [], sorted(memory_vocabulary(memory)))
+
+    async def _apply(
+        self, db: AsyncSession, memory: Memory, added: list[str], removed: list[str]
+    ) -> None:
+        if not added and not removed:
+            return
+
+        elder_terms = and_(
+            VocabularyTerm.elder_id == memory.elder_id,
+            VocabularyTerm.term.in_(removed),
+        )
+        try:
+            async with db.begin_nested():
+                if added:
+                    statement = insert(VocabularyTerm).values(
+                        [{"elder_id": memory.elder_id, "term": term} for term in added]
+                    )
+                    await db.execute(
+                        statement.on_conflict_do_update(
+                            index_elements=[
+                                VocabularyTerm.elder_id,
+                                VocabularyTerm.term,
+                            ],
+                            set_={"frequency": VocabularyTerm.frequency + 1},
+                        )
+                    )
+                if removed:
+                    await db.execute(
+                        update(VocabularyTerm)
+                        .where(elder_terms)
+                        .values(frequency=VocabularyTerm.frequency - 1)
+                    )
+                    await db.execute(
+                        delete(VocabularyTerm).where(
+                            elder_terms, VocabularyTerm.frequency <= 0
+                        )
+                    )
+        except SQLAlchemyError:
+            logger.exception("Failed to update vocabulary for memory %s", memory.id)
+            return
+
+        index = self._indexes.peek(memory.elder_id)
+        if index is not None:
+            for term in added:
+                index.add(term)
+            for term in removed:
+                index.discard(term)
+            self._indexes.evict()
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """Recount the vocabulary of every elder from scratch."""
+        counts: dict[int, Counter[str]] = {}
+        result = await db.stream(
+            select(Memory)
+            .options(
+                load_only(
+                    Memory.elder_id,
+                    Memory.title,
+                    Memory.summary,
+                    Memory.transcription,
+                    Memory.location,
+                    Memory.people_mentioned,
+                )
+            )
+            .where(Memory.deleted_at.is_(None))
+            .execution_options(yield_per=1000)
+        )
+        async for memory in result.scalars():
+            counts.setdefault(memory.elder_id, Counter()).update(
+                memory_vocabulary(memory)
+            )
+
+        await db.execute(delete(VocabularyTerm))
+        rows = [
+            {"elder_id": elder_id, "term": term, "frequency": frequency}
+            for elder_id, terms in counts.items()
+            for term, frequency in terms.items()
+        ]
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            await db.execute(
+                insert(VocabularyTerm), rows[start : start + INSERT_BATCH_SIZE]
+            )
+        await db.commit()
+
+        self._indexes.clear()
+        return len(rows)
+
+
+vocabulary_service = VocabularyService()
@@ -0,0 +1,38 @@
+"""Entity tags for conditional GET requests."""
+
+import hashlib
+from typing import Any, Optional
+
+
+def strong_etag(*parts: Any) -> str:
+    """A quoted strong ETag identifying the given version parts."""
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    A weak ETag identifying the given version parts.
+
+    For representations that are equivalent whenever the parts are, but not
+    byte-identical, e.g. ones stamped with the time they were generated.
+    """
+    return f"W/{strong_etag(*parts)}"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    W/ prefix on either tag, e.g. one added by a proxy, does not defeat the
+    match.
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
@@ -0,0 +1,195 @@
+"""Offset and keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from math import ceil
+from typing import Any, Literal, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, DateTime, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
+
+from app.core.config import settings
+from app.db.explain import explain, plan_rows
+
+SortKey = ColumnElement[Any] | QueryableAttribute[Any]
+TotalMode = Literal["exact", "capped", "estimate"]
+
+
+@dataclass
+class Page:
+    """One page of rows plus the cursors of its neighbouring pages."""
+
+    rows: list[tuple[Any, ...]]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any], backwards: bool = False) -> str:
+    """Encode sort-key values into an opaque, URL-safe cursor."""
+    payload: dict[str, Any] = {
+        "k": [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ]
+    }
+    if backwards:
+        payload["b"] = 1
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> tuple[list[Any], bool]:
+    """Decode a cursor into sort-key values and its direction."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["k"]
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        decoded = [
+            (
+                datetime.fromisoformat(value)
+                if isinstance(key.type, DateTime) and value is not None
+                else value
+            )
+            for value, key in zip(values, keys)
+        ]
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+    return decoded, bool(payload.get("b"))
+
+
+async def count_rows(
+    db: AsyncSession, query: Select[Any], limit: Optional[int] = None
+) -> int:
+    """Count the rows matched by a query, stopping after `limit` rows if given."""
+    query = query.order_by(None)
+    if limit is not None:
+        query = query.limit(limit)
+    count_query = select(func.count()).select_from(query.subquery())
+    result = await db.execute(count_query)
+    return result.scalar() or 0
+
+
+async def estimate_rows(db: AsyncSession, query: Select[Any]) -> int:
+    """Return the planner's row estimate for a query without running it."""
+    result = await db.execute(explain(query.order_by(None)))
+    return plan_rows(result.scalar())
+
+
+async def count_total(
+    db: AsyncSession, query: Select[Any], mode: TotalMode = "exact"
+) -> tuple[int, bool]:
+    """
+    Count the rows matched by a query and say whether the count is exact.
+
+    "capped" stops counting at PAGINATION_COUNT_CAP rows. "estimate" uses the
+    planner's row estimate, falling back to a capped count when the estimate
+    is small enough that counting is cheap and more accurate.
+    """
+    cap = settings.PAGINATION_COUNT_CAP
+
+    if mode == "estimate":
+        estimate = await estimate_rows(db, query)
+        if estimate >= cap:
+            return estimate, False
+        mode = "capped"
+
+    if mode == "capped":
+        total = await count_rows(db, query, limit=cap)
+        return total, total < cap
+
+    return await count_rows(db, query), True
+
+
+def page_count(total: Optional[int], size: int) -> Optional[int]:
+    """Number of pages needed for total rows, or None when total is unknown."""
+    if total is None:
+        return None
+    return ceil(total / size) if total > 0 else 0
+
+
+def cursor_predicate(
+    keys: Sequence[SortKey], values: Sequence[Any], scan_descending: bool
+) -> ColumnElement[bool]:
+    """Row-value comparison selecting the rows after a cursor in scan order."""
+    position = tuple_(*keys)
+    bound = tuple_(*[literal(value, key.type) for value, key in zip(values, keys)])
+    return position < bound if scan_descending else position > bound
+
+
+def build_page(
+    fetched: Sequence[Sequence[Any]], key_count: int, has_next: bool, has_prev: bool
+) -> Page:
+    """
+    Split the sort keys off the end of fetched rows and encode page cursors.
+
+    The next cursor points after the last row, the previous one before the
+    first; neither is set when there are no rows.
+    """
+    rows = [tuple(row[:-key_count]) for row in fetched]
+    if not fetched:
+        return Page(rows=rows, next_cursor=None, prev_cursor=None)
+    return Page(
+        rows=rows,
+        next_cursor=encode_cursor(fetched[-1][-key_count:]) if has_next else None,
+        prev_cursor=(
+            encode_cursor(fetched[0][-key_count:], backwards=True) if has_prev else None
+        ),
+    )
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select[Any],
+    keys: Sequence[SortKey],
+    size: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    descending: bool = True,
+) -> Page:
+    """
+    Fetch one page of an unordered query, ordered by a unique tuple of keys.
+
+    With a cursor the page is located with a row-value comparison on the keys,
+    so its cost does not depend on how deep the page is; without one, `offset`
+    rows are skipped. Either way the neighbouring pages' cursors are returned.
+    """
+    backwards = False
+    if cursor is not None:
+        values, backwards = decode_cursor(cursor, keys)
+
+    # Walking backwards over a descending sort means scanning ascending.
+    scan_descending = descending != backwards
+    if cursor is not None:
+        query = query.where(cursor_predicate(keys, values, scan_descending))
+    query = query.add_columns(*keys).order_by(
+        *[key.desc() if scan_descending else key.asc() for key in keys]
+    )
+    if cursor is None and offset:
+        query = query.offset(offset)
+
+    fetched = list((await db.execute(query.limit(size + 1))).all())
+
+    has_more = len(fetched) > size
+    fetched = fetched[:size]
+    if backwards:
+        fetched.reverse()
+
+    if backwards:
+        has_next = cursor is not None
+        has_prev = has_more
+    else:
+        has_next = has_more
+        has_prev = cursor is not None or offset > 0
+
+    return build_page(fetched, len(keys), has_next, has_prev)
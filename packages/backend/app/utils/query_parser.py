@@ -0,0 +1,99 @@
+"""Parser for the search query language.
+
+Queries mix free text with field qualifiers, for example
+``category:travel era:"post-war" "train station" -war -tag:sad``. Qualifiers
+become column predicates; everything else is rebuilt as web-search syntax
+for websearch_to_tsquery (quoted phrases, ``-`` exclusions and ``OR``).
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from app.utils.text import WORD_RE
+
+# Qualifier names (and aliases) mapped to the filter they set.
+SEARCH_FIELDS = {
+    "category": "category",
+    "era": "era",
+    "decade": "decade",
+    "tone": "emotional_tone",
+    "emotional_tone": "emotional_tone",
+    "location": "location",
+    "place": "location",
+    "tag": "tag",
+    "person": "person",
+    "people": "person",
+}
+
+_TOKEN_RE = re.compile(
+    r'(?P<neg>-)?(?:(?P<field>[A-Za-z_]+):)?(?:"(?P<quoted>[^"]*)"?|(?P<word>\S+))'
+)
+
+
+@dataclass
+class ParsedQuery:
+    """A search query split into free text and field qualifiers."""
+
+    text: str = ""
+    include: dict[str, list[str]] = field(default_factory=dict)
+    exclude: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def has_fields(self) -> bool:
+        """Whether any field qualifier was given."""
+        return bool(self.include or self.exclude)
+
+
+def parse_search_query(query: str) -> ParsedQuery:
+    """Split a query into web-search text and per-field values."""
+    parsed = ParsedQuery()
+    text_parts: list[str] = []
+
+    for match in _TOKEN_RE.finditer(query):
+        negated = match.group("neg") is not None
+        quoted = match.group("quoted")
+        value = quoted if quoted is not None else match.group("word")
+        value = " ".join(value.split())
+        qualifier = match.group("field")
+        target = SEARCH_FIELDS.get(qualifier.lower()) if qualifier else None
+
+        if target is not None:
+            if value:
+                values = parsed.exclude if negated else parsed.include
+                values.setdefault(target, []).append(value)
+            continue
+
+        if qualifier:
+            # Not a known field: leave the token to the text search as typed.
+            text_parts.append(match.group(0))
+            continue
+        if not value:
+            continue
+        if quoted is not None:
+            value = f'"{value}"'
+        text_parts.append(f"-{value}" if negated else value)
+
+    parsed.text = " ".join(text_parts)
+    return parsed
+
+
+def replace_text_terms(query: str, replacements: Mapping[str, str]) -> str:
+    """
+    Replace words in the free text of a query, leaving qualifiers as typed.
+
+    Replacements are keyed by lowercase word and matched case-insensitively.
+    """
+    if not replacements:
+        return query
+
+    def replace_word(match: re.Match[str]) -> str:
+        return replacements.get(match.group(0).lower(), match.group(0))
+
+    def replace_token(match: re.Match[str]) -> str:
+        qualifier = match.group("field")
+        if qualifier and qualifier.lower() in SEARCH_FIELDS:
+            return match.group(0)
+        return WORD_RE.sub(replace_word, match.group(0))
+
+    return _TOKEN_RE.sub(replace_token, query)
@@ -0,0 +1,24 @@
+"""Rank fusion helpers."""
+
+from collections.abc import Sequence
+
+# Damping constant from the original RRF paper; larger values flatten the
+# advantage of top positions.
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[int]], k: int = RRF_K
+) -> list[tuple[int, float]]:
+    """
+    Fuse ranked id lists with reciprocal rank fusion.
+
+    Each id scores the sum of 1 / (k + rank) over the lists it appears in, with
+    ranks starting at 1. Returns (id, score) pairs, best first; ties are broken
+    by lower id so the order is stable across calls.
+    """
+    scores: dict[int, float] = {}
+    for ranking in rankings:
+        for position, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + position)
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,144 @@
+"""SQL predicates for the search query language."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, func, or_
+
+from app.db.models.memory import Memory
+from app.utils.query_parser import ParsedQuery
+from app.utils.text import LIKE_ESCAPE, escape_like, normalize_labels
+
+# Must match the configuration used by the memories_search_vector_trigger.
+TEXT_SEARCH_CONFIG = "english"
+
+# Query-language fields that map onto a single column.
+SCALAR_FIELDS = {
+    "category": Memory.category,
+    "era": Memory.era,
+    "decade": Memory.decade,
+    "emotional_tone": Memory.emotional_tone,
+}
+
+# Query-language fields over JSONB label arrays, matched with lowercased
+# values against the stored (tags) or generated lowercase (people) column.
+LABEL_FIELDS = {
+    "tag": Memory.tags,
+    "person": Memory.people_keys,
+}
+
+
+def text_query(text: str) -> ColumnElement[Any]:
+    """tsquery for web-search text (phrases, -exclusions, OR)."""
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, text)
+
+
+def field_conditions(parsed: ParsedQuery) -> list[ColumnElement[bool]]:
+    """
+    Build predicates for the field qualifiers of a parsed query.
+
+    Repeated qualifiers of a single-valued field match any of the values;
+    repeated tags and people must all be present. Excluded values also keep
+    memories where the field is empty.
+    """
+    conditions: list[ColumnElement[bool]] = []
+
+    for name, values in parsed.include.items():
+        if name in SCALAR_FIELDS:
+            conditions.append(SCALAR_FIELDS[name].in_(values))
+        elif name == "location":
+            conditions.append(or_(*(location_matches(value) for value in values)))
+        elif name in LABEL_FIELDS:
+            labels = normalize_labels(values, lowercase=True)
+            if labels:
+                conditions.append(LABEL_FIELDS[name].contains(labels))
+
+    for name, values in parsed.exclude.items():
+        if name in SCALAR_FIELDS:
+            scalar = SCALAR_FIELDS[name]
+            conditions.append(or_(scalar.is_(None), scalar.not_in(values)))
+        elif name == "location":
+            for value in values:
+                conditions.append(
+                    or_(Memory.location.is_(None), ~location_matches(value))
+                )
+        elif name in LABEL_FIELDS:
+            column = LABEL_FIELDS[name]
+            for label in normalize_labels(values, lowercase=True) or []:
+                conditions.append(or_(column.is_(None), ~column.contains([label])))
+
+    return conditions
+
+
+def location_matches(value: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match on location."""
+    return Memory.location.ilike(f"%{escape_like(value)}%", escape=LIKE_ESCAPE)
+
+
+def filter_conditions(
+    elder_id: Optional[int] = None,
+    category: Optional[str] = None,
+    era: Optional[str] = None,
+    decade: Optional[str] = None,
+    emotional_tone: Optional[str] = None,
+    location: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    tag: Optional[list[str]] = None,
+    person: Optional[list[str]] = None,
+) -> list[ColumnElement[bool]]:
+    """
+    Build the WHERE conditions for the search filters that are set.
+
+    Takes the filter parameters of a search by name. Tags and people compile
+    to JSONB containment (@>), which the jsonb_path_ops GIN indexes answer;
+    several values must all be present. People are matched
+    case-insensitively, on the lowercased people_keys.
+    """
+    conditions: list[ColumnElement[bool]] = []
+
+    if elder_id is not None:
+        conditions.append(Memory.elder_id == elder_id)
+
+    if category:
+        conditions.append(Memory.category == category)
+
+    if era:
+        conditions.append(Memory.era == era)
+
+    if decade:
+        conditions.append(Memory.decade == decade)
+
+    if emotional_tone:
+        conditions.append(Memory.emotional_tone == emotional_tone)
+
+    if location:
+        conditions.append(location_matches(location))
+
+    if date_from:
+        conditions.append(Memory.date_of_event >= _parse_date(date_from, "date_from"))
+
+    if date_to:
+        conditions.append(Memory.date_of_event <= _parse_date(date_to, "date_to"))
+
+    tag_labels = normalize_labels(tag, lowercase=True)
+    if tag_labels:
+        conditions.append(Memory.tags.contains(tag_labels))
+
+    person_labels = normalize_labels(person, lowercase=True)
+    if person_labels:
+        conditions.append(Memory.people_keys.contains(person_labels))
+
+    return conditions
+
+
+def _parse_date(value: str, name: str) -> datetime:
+    """Parse an ISO date filter, rejecting malformed values with 400."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {name}: expected an ISO date (YYYY-MM-DD)",
+        ) from exc
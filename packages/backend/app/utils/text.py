@@ -0,0 +1,69 @@
+"""Text helpers shared by search and filtering code."""
+
+import re
+from typing import Any, Optional
+
+LIKE_ESCAPE = "\\"
+
+# A word: letters, optionally joined by apostrophes ("o'brien", "don't").
+WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+
+def words(text: str) -> list[str]:
+    """Split text into lowercase words, dropping digits and punctuation."""
+    return [word.lower() for word in WORD_RE.findall(text)]
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE/ILIKE wildcards so user input is matched literally."""
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def normalize_labels(value: Any, lowercase: bool = False) -> Optional[list[str]]:
+    """
+    Normalize a tags or people JSON value to a de-duplicated list of strings.
+
+    Accepts the legacy shapes as well: lists of strings or {"name": ...}
+    objects, dicts keyed by label, dicts wrapping lists ({"tags": [...]}) and
+    comma-separated strings. Whitespace is collapsed, duplicates are dropped
+    case-insensitively keeping the first spelling, and an empty result
+    becomes None.
+    """
+    if value is None:
+        return None
+
+    labels: list[str] = []
+    seen: set[str] = set()
+    for candidate in _label_candidates(value):
+        if isinstance(candidate, dict):
+            candidate = candidate.get("name")
+        if not isinstance(candidate, str):
+            continue
+        label = " ".join(candidate.split())
+        if lowercase:
+            label = label.lower()
+        if label and label.casefold() not in seen:
+            seen.add(label.casefold())
+            labels.append(label)
+    return labels or None
+
+
+def _label_candidates(value: Any) -> list[Any]:
+    """Flatten a tags or people value of any accepted shape into its elements."""
+    if isinstance(value, str):
+        return value.split(",")
+    if isinstance(value, dict):
+        candidates: list[Any] = []
+        for key, item in value.items():
+            if isinstance(item, list):
+                candidates.extend(item)
+            else:
+                candidates.append(key)
+        return candidates
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    raise ValueError("Labels must be a list of strings")
@@ -0,0 +1,72 @@
+"""Tests for the response cache."""
+
+import asyncio
+import time
+from typing import Any
+
+from app.core.config import settings
+from app.services.cache_service import CacheService, ElderIndexCache, LocalCache
+
+
+class FakeIndex:
+    """An elder index of a fixed size."""
+
+    def __init__(self, elder_id: int, nbytes: int) -> None:
+        self.elder_id = elder_id
+        self.nbytes = nbytes
+        self.loaded_at = time.monotonic()
+
+
+def test_local_cache_lru_and_expiry():
+    """Test that the local cache evicts the oldest entries and expires them."""
+    cache = LocalCache(max_entries=2)
+    cache.set("a", "1", ttl=60)
+    cache.set("b", "2", ttl=60)
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3", ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    cache.set("d", "4", ttl=-1)
+    assert cache.get("d") is None
+
+
+async def test_generation_bump_changes_key(monkeypatch):
+    """Test that bumping a scope moves its entries to a fresh key."""
+    monkeypatch.setattr(settings, "REDIS_URL", "")
+    cache = CacheService()
+
+    key = await cache.key("search", "elder:1", {"q": "farm"})
+    await cache.set_json(key, {"total": 3}, ttl=60)
+    assert await cache.get_json(key) == {"total": 3}
+    assert await cache.key("search", "elder:1", {"q": "farm"}) == key
+
+    await cache.bump("elder:1")
+
+    new_key = await cache.key("search", "elder:1", {"q": "farm"})
+    assert new_key != key
+    assert await cache.get_json(new_key) is None
+
+
+async def test_elder_index_cache_loads_once_and_evicts_by_size():
+    """Test that concurrent cold reads share one load and the LRU fits its budget."""
+    loads: list[int] = []
+
+    async def load(db: Any, elder_id: int) -> FakeIndex:
+        loads.append(elder_id)
+        await asyncio.sleep(0)
+        return FakeIndex(elder_id, nbytes=10)
+
+    cache = ElderIndexCache(load, max_bytes=lambda: 20, ttl=lambda: 60)
+    first, second = await asyncio.gather(cache.get(None, 1), cache.get(None, 1))
+    assert first is second
+    assert loads == [1]
+    assert not cache._locks
+
+    await cache.get(None, 2)
+    await cache.get(None, 1)
+    await cache.get(None, 3)
+    assert cache.peek(2) is None
+    assert cache.peek(1) is first
+    assert cache.nbytes == 20
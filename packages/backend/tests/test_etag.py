@@ -0,0 +1,109 @@
+"""Tests for ETag helpers."""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import Response
+from sqlalchemy import Update
+from starlette.requests import Request
+
+from app.api.dependencies import elder_etag
+from app.api.v1.endpoints.memories import get_memory
+from app.db.models.memory import Memory
+from app.utils.etag import etag_matches, strong_etag, weak_etag
+
+
+def test_strong_etag():
+    """Test that ETags are quoted and change with any part."""
+    etag = strong_etag(1, 5, "/timeline")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == strong_etag(1, 5, "/timeline")
+    assert etag != strong_etag(1, 6, "/timeline")
+    assert etag != strong_etag(1, 5, "/timeline/stats")
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing."""
+    etag = strong_etag("a")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_weak_etag_matches_either_form():
+    """Test that weak tags match with or without the W/ prefix."""
+    etag = weak_etag("a")
+    assert etag == f"W/{strong_etag('a')}"
+    assert etag_matches(etag, etag)
+    assert etag_matches(strong_etag("a"), etag)
+    assert not etag_matches(weak_etag("b"), etag)
+
+
+class FakeResult:
+    """A query result holding one row."""
+
+    def __init__(self, row: Any) -> None:
+        self.row = row
+
+    def one_or_none(self) -> Any:
+        return self.row
+
+    def scalar_one_or_none(self) -> Any:
+        return self.row
+
+
+class FakeSavepoint:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class FakeSession:
+    """Just enough of a session for get_memory and elder_etag, on one elder."""
+
+    def __init__(self, memory: Memory) -> None:
+        self.memory = memory
+        self.version = 0
+        self.updated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    async def execute(self, statement: Any) -> FakeResult:
+        if isinstance(statement, Update):
+            self.version += 1
+            return FakeResult(None)
+        if "content_version" in str(statement):
+            return FakeResult((self.version, self.updated_at))
+        return FakeResult(self.memory)
+
+    def begin_nested(self) -> FakeSavepoint:
+        return FakeSavepoint()
+
+    async def commit(self) -> None:
+        return None
+
+    async def refresh(self, instance: Any) -> None:
+        return None
+
+
+async def test_play_changes_elder_etag():
+    """Test that playing a memory invalidates its elder's analytics ETag."""
+    db: Any = FakeSession(Memory(id=7, elder_id=1, play_count=0))
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/elders/1/analytics",
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+    before = await elder_etag(1, request, Response(), db)
+    await get_memory(7, db)
+    after = await elder_etag(1, request, Response(), db)
+
+    assert db.memory.play_count == 1
+    assert before["ETag"] != after["ETag"]
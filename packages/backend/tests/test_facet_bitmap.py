@@ -0,0 +1,36 @@
+"""Tests for the facet bitmap index."""
+
+from app.services.facet_service import FacetBitmap, popcount
+
+
+def test_select_and_counts():
+    """Test that filters intersect bitsets and counts cover the selection."""
+    bitmap = FacetBitmap(capacity=2)
+    bitmap.set_memory(10, ("war", "1940s", "1940s", "sad"))
+    bitmap.set_memory(11, ("war", "1950s", None, "proud"))
+    bitmap.set_memory(12, ("family", "1940s", "1940s", None))
+
+    mask = bitmap.select([("category", ["war"])])
+    assert sorted(bitmap.memory_ids(mask)) == [10, 11]
+    assert bitmap.counts(mask)["era"] == {"1940s": 1, "1950s": 1}
+
+    mask = bitmap.select(
+        [("era", ["1940s", "1950s"])], exclude=[("emotional_tone", ["sad"])]
+    )
+    assert sorted(bitmap.memory_ids(mask)) == [11, 12]
+    assert popcount(bitmap.select([("category", ["travel"])])) == 0
+
+
+def test_update_and_remove_reuse_slots():
+    """Test that updates move bits and removed slots are reused."""
+    bitmap = FacetBitmap(capacity=1)
+    bitmap.set_memory(1, ("war", None, None, None))
+    bitmap.set_memory(1, ("family", None, None, None))
+    assert bitmap.counts(bitmap.live)["category"] == {"family": 1}
+    assert bitmap.bitset("category", "war") is None
+
+    bitmap.remove_memory(1)
+    bitmap.set_memory(2, ("war", None, None, None))
+    assert len(bitmap) == 1
+    assert list(bitmap.memory_ids(bitmap.live)) == [2]
+    assert bitmap.counts(bitmap.live)["category"] == {"war": 1}
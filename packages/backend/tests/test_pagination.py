@@ -0,0 +1,61 @@
+"""Tests for pagination helpers."""
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.explain import explain
+from app.db.models import Memory
+from app.utils.pagination import decode_cursor, encode_cursor, page_count
+
+
+def test_cursor_round_trip():
+    """Test that cursors decode back to typed sort-key values."""
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor([created_at, 42], backwards=True)
+
+    values, backwards = decode_cursor(cursor, (Memory.created_at, Memory.id))
+
+    assert values == [created_at, 42]
+    assert backwards is True
+
+
+def test_invalid_cursor_rejected():
+    """Test that malformed or mismatched cursors are rejected with 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor", (Memory.created_at, Memory.id))
+    assert exc_info.value.status_code == 400
+
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor([1]), (Memory.created_at, Memory.id))
+
+
+def test_page_count():
+    """Test page count calculation with known and unknown totals."""
+    assert page_count(45, 20) == 3
+    assert page_count(0, 20) == 0
+    assert page_count(None, 20) is None
+
+
+def test_explain_keeps_bind_parameters():
+    """Test that EXPLAIN carries the statement's typed and expanding binds."""
+    query = select(Memory.id).where(
+        Memory.id.in_([1, 2]), Memory.tags.contains(["war"]), Memory.title == "x"
+    )
+    compiled = explain(query).compile(
+        dialect=postgresql.asyncpg.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+
+    assert compiled.string.startswith("EXPLAIN (FORMAT JSON) SELECT memories.id")
+    assert "IN ($3::INTEGER, $4::INTEGER)" in compiled.string
+    assert "@> $1::JSONB" in compiled.string
+    assert compiled.construct_params() == {
+        "tags_1": ["war"],
+        "title_1": "x",
+        "id_1_1": 1,
+        "id_1_2": 2,
+    }
@@ -0,0 +1,54 @@
+"""Tests for saved search match keys."""
+
+from app.db.models.memory import Memory
+from app.services.percolator_service import (
+    MATCH_ALL_KEY,
+    field_keys,
+    memory_keys,
+    positive_text,
+)
+from app.utils.query_parser import parse_search_query
+
+
+def test_field_keys():
+    """Test that one required label, or every scalar alternative, is a key."""
+    assert field_keys(parse_search_query("grandpa tag:War tag:navy")) == ["tag:war"]
+    assert field_keys(parse_search_query("era:1940s era:1950s")) == [
+        "era:1940s",
+        "era:1950s",
+    ]
+    assert field_keys(parse_search_query('person:"Aunt Rose"')) == ["person:aunt rose"]
+    assert field_keys(parse_search_query("grandpa -tag:war location:Ohio")) == []
+
+
+def test_positive_text():
+    """Test that exclusions are dropped and OR-ed exclusions give no terms."""
+    assert positive_text('"train station" -war well-known') == (
+        '"train station" well-known',
+        False,
+    )
+    assert positive_text("farm OR ranch") == ("farm OR ranch", True)
+    assert positive_text("farm or -city") == ("", True)
+
+
+def test_memory_keys():
+    """Test that a memory carries keys for every field a search can require."""
+    memory = Memory(
+        elder_id=1,
+        title="Shipyard",
+        category="work",
+        era="1940s",
+        tags=["Navy"],
+        people_mentioned=["Grandpa Joe"],
+    )
+
+    keys = memory_keys(memory, ["shipyard"])
+
+    assert set(keys) == {
+        MATCH_ALL_KEY,
+        "t:shipyard",
+        "category:work",
+        "era:1940s",
+        "tag:navy",
+        "person:grandpa joe",
+    }
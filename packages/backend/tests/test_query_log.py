@@ -0,0 +1,45 @@
+"""Tests for slow query capture."""
+
+from typing import Any
+
+from app.core.config import settings
+from app.core.request_context import request_id_var, request_route_var
+from app.db.query_log import SKIP_OPTION, SlowQueryLog, describe_parameters
+
+
+class FakeConnection:
+    """Just enough of a Connection for the cursor event handlers."""
+
+    def __init__(self, **options: Any) -> None:
+        self.info: dict[str, Any] = {"query_log_start": 0.0}
+        self.options = options
+
+    def get_execution_options(self) -> dict[str, Any]:
+        return self.options
+
+
+def test_slow_statements_are_captured(monkeypatch):
+    """Test that slow statements are recorded with their request context."""
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0.0)
+    request_id_var.set("req-1")
+    request_route_var.set("GET /api/v1/search/search")
+    log = SlowQueryLog(size=2)
+
+    for statement in ("SELECT 1", "SELECT 2", "SELECT 3"):
+        log._after_execute(FakeConnection(), None, statement, (), None, False)
+    log._after_execute(
+        FakeConnection(**{SKIP_OPTION: True}), None, "SELECT 4", (), None, False
+    )
+
+    assert [entry["statement"] for entry in log.entries] == ["SELECT 2", "SELECT 3"]
+    assert log.entries[-1]["request_id"] == "req-1"
+    assert log.entries[-1]["route"] == "GET /api/v1/search/search"
+    assert log.entries[-1]["plan"] is None
+
+
+def test_parameters_are_described_not_stored():
+    """Test that bind values are reduced to their types and lengths."""
+    assert describe_parameters(("hunter2", 42, None)) == "('str[7]', 'int', 'NoneType')"
+    assert describe_parameters({"email": "a@b.c"}) == "{'email': 'str[5]'}"
+    assert describe_parameters([("x",), ("yy",)]) == "2 x ('str[1]',)"
@@ -0,0 +1,60 @@
+"""Tests for the search query language parser."""
+
+from sqlalchemy.dialects import postgresql
+
+from app.utils.query_parser import parse_search_query, replace_text_terms
+from app.utils.search_filters import field_conditions
+
+
+def test_fields_phrases_and_negation():
+    """Test that qualifiers are split out and text keeps web-search syntax."""
+    parsed = parse_search_query('category:travel "train station" -war OR ship')
+
+    assert parsed.include == {"category": ["travel"]}
+    assert parsed.exclude == {}
+    assert parsed.text == '"train station" -war OR ship'
+
+
+def test_quoted_aliased_and_negated_fields():
+    """Test quoted field values, aliases and excluded fields."""
+    parsed = parse_search_query(
+        'tone:joyful place:"New  York" -tag:sad people:Rose Rose:garden'
+    )
+
+    assert parsed.include == {
+        "emotional_tone": ["joyful"],
+        "location": ["New York"],
+        "person": ["Rose"],
+    }
+    assert parsed.exclude == {"tag": ["sad"]}
+    assert parsed.text == "Rose:garden"
+    assert parsed.has_fields
+
+
+def test_plain_text_and_empty_values():
+    """Test that plain queries pass through and empty qualifiers are ignored."""
+    assert parse_search_query("summer at the lake").text == "summer at the lake"
+
+    parsed = parse_search_query('era:"" ""')
+    assert parsed.text == ""
+    assert not parsed.has_fields
+
+
+def test_replace_text_terms():
+    """Test that only free-text words are replaced, whatever their case."""
+    query = 'Margret "clevelnd ohio" -war place:Clevelnd'
+    replacements = {"margret": "margaret", "clevelnd": "cleveland"}
+
+    assert (
+        replace_text_terms(query, replacements)
+        == 'margaret "cleveland ohio" -war place:Clevelnd'
+    )
+
+
+def test_person_conditions_ignore_case():
+    """Test that people are matched lowercased against people_keys."""
+    (condition,) = field_conditions(parse_search_query('person:"Aunt  Rose"'))
+    compiled = condition.compile(dialect=postgresql.dialect())
+
+    assert str(compiled) == "memories.people_keys @> %(people_keys_1)s"
+    assert compiled.params == {"people_keys_1": ["aunt rose"]}
@@ -0,0 +1,21 @@
+"""Tests for rank fusion helpers."""
+
+import pytest
+
+from app.utils.ranking import reciprocal_rank_fusion
+
+
+def test_reciprocal_rank_fusion():
+    """Test that items ranked well by both lists come first."""
+    fused = reciprocal_rank_fusion([[1, 2, 3], [3, 1, 4]], k=60)
+
+    assert [item_id for item_id, _ in fused] == [1, 3, 2, 4]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+
+def test_reciprocal_rank_fusion_ties():
+    """Test that ties are broken by id."""
+    fused = reciprocal_rank_fusion([[5], [2]])
+
+    assert [item_id for item_id, _ in fused] == [2, 5]
+    assert reciprocal_rank_fusion([]) == []
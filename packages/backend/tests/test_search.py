@@ -0,0 +1,30 @@
+"""Tests for search endpoint validation."""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_stream_rejects_invalid_dates_before_streaming():
+    """Test that a malformed date filter is a 400, not a truncated stream."""
+    response = client.get(
+        "/api/v1/search/search",
+        params={"q": "farm", "stream": "ndjson", "date_from": "last spring"},
+    )
+    assert response.status_code == 400
+    assert "date_from" in response.json()["detail"]
+
+
+def test_stale_token_is_anonymous_unless_scope_needs_a_user():
+    """Test that an invalid token only fails family-scoped searches."""
+    headers = {"Authorization": "Bearer stale-token"}
+    params = {"q": "farm", "stream": "ndjson", "date_from": "last spring"}
+
+    response = client.get("/api/v1/search/search", params=params, headers=headers)
+    assert response.status_code == 400
+
+    params["scope"] = "family"
+    response = client.get("/api/v1/search/search", params=params, headers=headers)
+    assert response.status_code == 401
@@ -0,0 +1,37 @@
+"""Tests for the autocomplete trie."""
+
+from app.services.suggestion_service import NODE_BYTES, SuggestionTrie, suggestion_terms
+
+
+def test_suggestion_terms():
+    """Test that terms are gathered from every field and blanks dropped."""
+    terms = suggestion_terms("Summer at the lake", ["family"], ["Aunt May"], " ")
+
+    assert terms == {"Summer at the lake", "family", "Aunt May"}
+
+
+def test_trie_complete_and_rank():
+    """Test case-insensitive prefix completion ranked by memory count."""
+    trie = SuggestionTrie()
+    trie.set_memory(1, frozenset({"Farm life", "farming"}))
+    trie.set_memory(2, frozenset({"farming", "Family"}))
+
+    assert trie.complete("fa", 10) == ["farming", "Family", "Farm life"]
+    assert trie.complete("FARM", 1) == ["farming"]
+    assert trie.complete("x", 10) == []
+
+
+def test_trie_update_and_remove():
+    """Test that updates retract old terms and removal prunes the trie."""
+    trie = SuggestionTrie()
+    trie.set_memory(1, frozenset({"Wedding"}))
+    trie.set_memory(1, frozenset({"Honeymoon"}))
+
+    assert trie.complete("we", 10) == []
+    assert trie.complete("ho", 10) == ["Honeymoon"]
+
+    trie.remove_memory(1)
+
+    assert trie.complete("ho", 10) == []
+    assert not trie.root.children
+    assert trie.nbytes == NODE_BYTES
@@ -0,0 +1,25 @@
+"""Tests for text helpers."""
+
+from app.utils.text import escape_like, normalize_labels
+
+
+def test_escape_like():
+    """Test that LIKE wildcards are escaped."""
+    assert escape_like("100%_\\") == "100\\%\\_\\\\"
+
+
+def test_normalize_labels_shapes():
+    """Test that legacy tag and people shapes normalize to one list shape."""
+    assert normalize_labels(["Aunt  Rose", " aunt rose", "Bob", ""]) == [
+        "Aunt Rose",
+        "Bob",
+    ]
+    assert normalize_labels({"tags": ["Farm", "War"]}, lowercase=True) == [
+        "farm",
+        "war",
+    ]
+    assert normalize_labels({"Aunt Rose": "sister"}) == ["Aunt Rose"]
+    assert normalize_labels([{"name": "Bob"}, 3]) == ["Bob"]
+    assert normalize_labels("farm, war") == ["farm", "war"]
+    assert normalize_labels([]) is None
+    assert normalize_labels(None) is None
@@ -0,0 +1,34 @@
+"""Tests for timeline helpers."""
+
+from datetime import datetime, timezone
+
+from app.services.timeline_service import timeline_completeness, timeline_entry
+
+
+def test_timeline_entry():
+    """Test that entries follow the fields of their group_by mode."""
+    date = datetime(1965, 6, 1, tzinfo=timezone.utc)
+    entry = timeline_entry(
+        "decade", (7, "Wedding", "family", date, "Summary", "joyful", "Leeds")
+    )
+    assert entry == {
+        "id": 7,
+        "title": "Wedding",
+        "category": "family",
+        "date_of_event": "1965-06-01T00:00:00+00:00",
+        "summary": "Summary",
+        "emotional_tone": "joyful",
+        "location": "Leeds",
+    }
+
+    entry = timeline_entry("category", (7, "Wedding", None, None, None, None))
+    assert "category" not in entry
+    assert entry["date_of_event"] is None
+
+
+def test_timeline_completeness():
+    """Test that completeness weighs decades and categories equally."""
+    assert timeline_completeness(0, 0, 0) == 0.0
+    assert timeline_completeness(3, 4, 0) == 25.0
+    assert timeline_completeness(3, 0, 20) == 50.0
+    assert timeline_completeness(30, 12, 10) == 100.0
@@ -0,0 +1,73 @@
+"""Tests for the embedding backends and vector index."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.services.embedding_service import (
+    HashingEmbedder,
+    decode_embedding,
+    encode_embedding,
+)
+from app.services.vector_index import VectorIndex
+
+
+def test_hashing_embedder_is_deterministic():
+    """Test that hashing embeddings are stable, normalised and related."""
+    embedder = HashingEmbedder(dim=64)
+
+    first = embedder.embed_one("Working on the family farm")
+    second = embedder.embed_one("Working on the family farm")
+    related = embedder.embed_one("farming with my family")
+    unrelated = embedder.embed_one("jazz concert downtown")
+
+    assert np.array_equal(first, second)
+    assert np.isclose(np.linalg.norm(first), 1.0)
+    assert first @ related > first @ unrelated
+    assert not embedder.embed_one("").any()
+
+
+def test_embedding_round_trip():
+    """Test float16 serialisation of embeddings."""
+    vector = HashingEmbedder(dim=32).embed_one("wedding day")
+
+    decoded = decode_embedding(encode_embedding(vector))
+
+    assert decoded.shape == (32,)
+    assert np.allclose(decoded, vector, atol=1e-3)
+
+
+def test_vector_index_search(tmp_path):
+    """Test building, searching, updating and removing from the index."""
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(600, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = np.arange(1, 601, dtype=np.int64)
+    elder_ids = (ids % 3 + 1).astype(np.int32)
+
+    index = VectorIndex(tmp_path, dim=16)
+    index.build(ids, elder_ids, vectors, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    hits = index.search(vectors[9], k=5, nprobe=2)
+    assert hits[0][0] == 10
+    assert [score for _, score in hits] == sorted(
+        (score for _, score in hits), reverse=True
+    )
+
+    hits = index.search(vectors[9], k=10, elder_id=2)
+    assert all(elder_ids[memory_id - 1] == 2 for memory_id, _ in hits)
+
+    hits = index.search(vectors[9], k=20, elder_ids=[1, 3])
+    assert hits and all(elder_ids[memory_id - 1] != 2 for memory_id, _ in hits)
+    assert index.search(vectors[9], k=5, elder_ids=[]) == []
+
+    index.remove(10)
+    assert 10 not in dict(index.search(vectors[9], k=5))
+
+    index.upsert(1000, 1, vectors[9])
+    assert index.search(vectors[9], k=1)[0][0] == 1000
+
+    reloaded = VectorIndex(tmp_path, dim=16)
+    assert reloaded.load()
+    assert reloaded.built_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert reloaded.search(vectors[9], k=1)[0][0] == 10
@@ -0,0 +1,85 @@
+"""Tests for the SymSpell vocabulary index."""
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.db.models.memory import Memory
+from app.services.vocabulary_service import (
+    SymSpellIndex,
+    committed_vocabulary,
+    memory_vocabulary,
+    osa_distance,
+)
+
+
+def test_osa_distance():
+    """Test edits, adjacent transpositions and the early cut-off."""
+    assert osa_distance("margaret", "margaret", 2) == 0
+    assert osa_distance("margret", "margaret", 2) == 1
+    assert osa_distance("cleveland", "clevelnad", 2) == 1
+    assert osa_distance("ohio", "iowa", 2) == 3
+
+
+def test_lookup_prefers_distance_then_frequency():
+    """Test that the nearest, then most frequent, term is suggested."""
+    index = SymSpellIndex()
+    index.add("margaret", 5)
+    index.add("margarine", 1)
+    index.add("cleveland", 2)
+    index.add("bell", 3)
+    index.add("ball", 7)
+
+    assert index.lookup("margarett") == ("margaret", 1)
+    assert index.lookup("clevelnd") == ("cleveland", 1)
+    assert index.lookup("bxll") == ("ball", 1)
+    assert index.lookup("zzzz") is None
+
+
+def test_known_words_and_inflections_are_not_corrected():
+    """Test that terms and stemmed forms of terms are left alone."""
+    index = SymSpellIndex()
+    index.add("farm")
+    index.add("harvests")
+
+    assert index.correct("farm") is None
+    assert index.correct("farming") is None
+    assert index.correct("harvest") is None
+    assert index.correct("frm") == "farm"
+
+
+def test_discard_forgets_terms_no_memory_uses():
+    """Test that discarded terms drop out of lookups at zero frequency."""
+    index = SymSpellIndex()
+    index.add("margaret", 2)
+    nbytes = index.nbytes
+    index.add("margarine")
+
+    index.discard("margarine")
+    index.discard("margaret")
+    assert index.nbytes == nbytes
+    assert index.lookup("margarett") == ("margaret", 1)
+
+    index.discard("margaret")
+    assert index.frequencies == {}
+    assert index.nbytes == 0
+    assert index.lookup("margarett") is None
+
+
+def test_committed_vocabulary_reads_words_before_the_update():
+    """Test that an edit is diffed against the words last loaded."""
+    memory = Memory(
+        id=1,
+        elder_id=1,
+        title="Harvest in Ohio",
+        summary=None,
+        transcription=None,
+        location=None,
+        people_mentioned=["Rose"],
+    )
+    assert committed_vocabulary(memory) == set()
+
+    make_transient_to_detached(memory)
+    memory.title = "Harvest in Iowa"
+    memory.people_mentioned = ["Rose", "Walter"]
+
+    assert committed_vocabulary(memory) == {"harvest", "ohio", "rose"}
+    assert memory_vocabulary(memory) == {"harvest", "iowa", "rose", "walter"}